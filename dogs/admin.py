@@ -1,6 +1,22 @@
 from django.contrib import admin
 
-from .models import Dog, Favorite, Match, Message, UserProfile
+from services.cache_service import DOG_VERSION, bump_version
+from services.count_service import ApproximateCountPaginator
+
+from .models import Breed, BreedAlias, Dog, Favorite, Match, Message, UserProfile
+
+
+class BreedAliasInline(admin.TabularInline):
+    model = BreedAlias
+    extra = 1
+    fields = ("alias",)
+
+
+@admin.register(Breed)
+class BreedAdmin(admin.ModelAdmin):
+    list_display = ("name", "normalized_name")
+    search_fields = ("name", "normalized_name", "aliases__normalized_alias")
+    inlines = (BreedAliasInline,)
 
 
 @admin.register(Dog)
@@ -15,24 +31,67 @@ class DogAdmin(admin.ModelAdmin):
         "is_active",
         "created_at",
     )
-    list_filter = ("gender", "size", "breed", "is_active", "looking_for")
+    list_filter = (
+        "gender",
+        "size",
+        "canonical_breed",
+        "is_active",
+        "looking_for",
+        "photo_status",
+    )
     search_fields = ("name", "breed", "owner__username")
     list_editable = ("is_active",)
-    readonly_fields = ("created_at", "updated_at")
+    readonly_fields = (
+        "canonical_breed",
+        "photo_status",
+        "photo_attempts",
+        "created_at",
+        "updated_at",
+    )
+    # Большие выборки считаются приблизительно, без полного COUNT(*)
+    paginator = ApproximateCountPaginator
+    show_full_result_count = False
+    actions = ("deactivate_dogs",)
 
     fieldsets = (
         (
             "Основная информация",
-            {"fields": ("owner", "name", "breed", "age", "gender", "size")},
+            {
+                "fields": (
+                    "owner",
+                    "name",
+                    "breed",
+                    "canonical_breed",
+                    "age",
+                    "gender",
+                    "size",
+                )
+            },
         ),
         (
             "Характеристики",
-            {"fields": ("temperament", "looking_for", "description", "photo")},
+            {
+                "fields": (
+                    "temperament",
+                    "looking_for",
+                    "description",
+                    "photo",
+                    "photo_status",
+                    "photo_attempts",
+                )
+            },
         ),
         ("Настройки", {"fields": ("is_active",)}),
         ("Даты", {"fields": ("created_at", "updated_at"), "classes": ("collapse",)}),
     )
 
+    @admin.action(description="Деактивировать выбранные профили")
+    def deactivate_dogs(self, request, queryset):
+        updated = queryset.filter(is_active=True).update(is_active=False)
+        # update() не вызывает сигналы, поэтому кэши поиска сбрасываем явно
+        bump_version(DOG_VERSION)
+        self.message_user(request, f"Деактивировано профилей: {updated}")
+
 
 @admin.register(UserProfile)
 class UserProfileAdmin(admin.ModelAdmin):
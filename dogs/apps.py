@@ -5,3 +5,6 @@ class DogsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "dogs"
     verbose_name = "Собаки"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,396 @@
+// Theme management
+const THEME_KEY = 'dog-dating-theme';
+const themeToggle = document.getElementById('theme-toggle');
+const htmlElement = document.documentElement;
+
+// Initialize theme
+function initTheme() {
+    const savedTheme = localStorage.getItem(THEME_KEY) || 'dark';
+    setTheme(savedTheme);
+}
+
+// Set theme
+function setTheme(theme) {
+    htmlElement.setAttribute('data-theme', theme);
+    document.body.setAttribute('data-theme', theme);
+
+    const icon = themeToggle.querySelector('i');
+    const label = themeToggle.querySelector('.theme-label');
+
+    if (theme === 'light') {
+        icon.className = 'bi bi-sun-fill';
+        label.textContent = 'Светлая';
+    } else {
+        icon.className = 'bi bi-moon-fill';
+        label.textContent = 'Темная';
+    }
+
+    localStorage.setItem(THEME_KEY, theme);
+}
+
+// Toggle theme
+function toggleTheme() {
+    const currentTheme = htmlElement.getAttribute('data-theme');
+    const newTheme = currentTheme === 'dark' ? 'light' : 'dark';
+    setTheme(newTheme);
+}
+
+// Event listener
+themeToggle.addEventListener('click', toggleTheme);
+
+// Initialize on page load
+document.addEventListener('DOMContentLoaded', initTheme);
+
+// CSRF token handling
+function getCookie(name) {
+    let cookieValue = null;
+    if (document.cookie && document.cookie !== '') {
+        const cookies = document.cookie.split(';');
+        for (let i = 0; i < cookies.length; i++) {
+            const cookie = cookies[i].trim();
+            if (cookie.substring(0, name.length + 1) === (name + '=')) {
+                cookieValue = decodeURIComponent(cookie.substring(name.length + 1));
+                break;
+            }
+        }
+    }
+    return cookieValue;
+}
+
+// Mobile menu toggle
+// Поведение мобильного меню теперь полностью
+// реализовано в static-скрипте
+// `dogs/assets/js/mobile-optimization.js`, чтобы не было
+// двух обработчиков клика по бургер-кнопке, которые
+// могли бы открывать и сразу же закрывать сайдбар
+// за один тап.
+
+// Toast notification system
+function showToast(message, type = 'success') {
+    const container = document.getElementById('toast-container') || document.body;
+    const toast = document.createElement('div');
+    toast.className = `toast toast-${type}`;
+
+    const icon = type === 'success' ? '✅' :
+                type === 'error' ? '❌' :
+                type === 'info' ? 'ℹ️' : '✅';
+
+    toast.innerHTML = `
+        <span>${icon}</span>
+        <span>${message}</span>
+        <button onclick="this.parentElement.remove()" style="border: none; background: none; cursor: pointer; font-size: 1.2rem;">&times;</button>
+    `;
+
+    container.appendChild(toast);
+
+    // Auto remove after 5 seconds
+    setTimeout(() => {
+        if (toast.parentElement) {
+            toast.remove();
+        }
+    }, 5000);
+}
+
+// Add loading class to buttons on click
+document.querySelectorAll('.btn').forEach(btn => {
+    btn.addEventListener('click', function() {
+        this.classList.add('loading');
+    });
+});
+
+// Handle responsive menu
+function toggleMobileMenu() {
+    const sidebar = document.querySelector('.sidebar');
+    if (sidebar) {
+        sidebar.classList.toggle('active');
+    }
+}
+
+// Favorite toggle functionality for favorite buttons
+function toggleFavorite(dogId, button = null) {
+    if (!button) button = event.target.closest('.favorite-btn');
+    if (!button) return;
+
+    button.disabled = true;
+
+    fetch(`/dogs/${dogId}/favorite/`, {
+        method: 'POST',
+        headers: {
+            'X-CSRFToken': getCookie('csrftoken'),
+            'Content-Type': 'application/json',
+        },
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (data.is_favorite) {
+            button.innerHTML = '<i class="bi bi-heart-fill"></i>';
+            button.dataset.isFavorite = 'true';
+            showToast(data.message || 'Добавлено в избранное', 'success');
+        } else {
+            button.innerHTML = '<i class="bi bi-heart"></i>';
+            button.dataset.isFavorite = 'false';
+            showToast(data.message || 'Удалено из избранного', 'info');
+        }
+    })
+    .catch(error => {
+        console.error('Error:', error);
+        showToast('Произошла ошибка', 'error');
+    })
+    .finally(() => {
+        button.disabled = false;
+    });
+}
+
+function removeFavorite(button, dogId) {
+    const cardContainer = button.closest('div[style*="border: 1px solid"]') || button.closest('div').closest('div');
+
+    fetch(`/dogs/${dogId}/favorite/`, {
+        method: 'POST',
+        headers: {
+            'X-CSRFToken': getCookie('csrftoken'),
+            'Content-Type': 'application/json',
+        },
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (!data.is_favorite) {
+            // Удаляем карточку с анимацией
+            if (cardContainer) {
+                cardContainer.style.opacity = '0';
+                cardContainer.style.transform = 'scale(0.95)';
+                cardContainer.style.transition = 'all 0.3s ease';
+                setTimeout(() => {
+                    cardContainer.remove();
+                    // Проверяем, остались ли ещё карточки
+                    const gridContainer = document.querySelector('[style*="grid-template-columns"]');
+                    if (gridContainer && gridContainer.children.length === 0) {
+                        location.reload();
+                    }
+                }, 300);
+            }
+            showToast(data.message, 'success');
+        }
+    })
+    .catch(error => {
+        console.error('Error:', error);
+        showToast('Произошла ошибка', 'error');
+    });
+}
+
+// Auto-bind favorite buttons on page load
+document.addEventListener('DOMContentLoaded', function() {
+    // Initialize theme
+    initTheme();
+
+    document.querySelectorAll('.favorite-btn').forEach(btn => {
+        if (!btn.dataset.listenerAdded) {
+            btn.addEventListener('click', function(e) {
+                e.preventDefault();
+                const dogId = this.dataset.dogId;
+                toggleFavorite(dogId, this);
+            });
+            btn.dataset.listenerAdded = true;
+        }
+    });
+});
+
+// Collapsible menu functionality
+document.addEventListener('DOMContentLoaded', function() {
+    // Handle menu toggle clicks
+    document.addEventListener('click', function(e) {
+        // Handle clicks on parent menu items (spans) - toggle submenu
+        if (e.target.closest('.menu-link.header-nav-top-link')) {
+            e.preventDefault();
+            e.stopPropagation();
+            const menuLink = e.target.closest('.menu-link');
+            const menuItem = menuLink.closest('.menu-item');
+            const submenu = menuItem.querySelector('.submenu');
+
+            if (submenu) {
+                const isExpanded = !submenu.classList.contains('collapsed');
+
+                if (isExpanded) {
+                    // Collapse the menu
+                    submenu.classList.add('collapsed');
+                } else {
+                    // Expand the menu
+                    submenu.classList.remove('collapsed');
+                }
+            }
+        }
+
+        // Prevent any menu link clicks from affecting other menus
+        if (e.target.closest('.menu-link')) {
+            // Don't prevent default behavior for menu links - they should navigate normally
+            // Just stop propagation to prevent affecting other menu items
+            e.stopPropagation();
+        }
+    });
+});
+
+// Scroll wheel conflict prevention for nested scrollable areas
+document.addEventListener('DOMContentLoaded', function() {
+    // Prevent scroll wheel from bubbling up between nested scrollable areas
+    const scrollableAreas = document.querySelectorAll('.submenu, .scrollable-content');
+
+    scrollableAreas.forEach(area => {
+        area.addEventListener('wheel', function(e) {
+            // Check if this area can still scroll
+            const canScrollUp = this.scrollTop > 0;
+            const canScrollDown = this.scrollTop < this.scrollHeight - this.clientHeight;
+
+            // If we're at the top and trying to scroll up, or at the bottom and trying to scroll down
+            const atTop = !canScrollUp && e.deltaY < 0;
+            const atBottom = !canScrollDown && e.deltaY > 0;
+
+            // If we can't scroll in the direction we're trying to go, prevent the wheel event from bubbling
+            if (atTop || atBottom) {
+                e.preventDefault();
+                e.stopPropagation();
+            }
+        }, { passive: false });
+
+        // Prevent touch/mouse events from causing scroll chaining
+        area.addEventListener('touchstart', function(e) {
+            this._touchStartY = e.touches[0].clientY;
+        }, { passive: true });
+
+        area.addEventListener('touchmove', function(e) {
+            const touchY = e.touches[0].clientY;
+            const touchDelta = this._touchStartY - touchY;
+
+            const canScrollUp = this.scrollTop > 0;
+            const canScrollDown = this.scrollTop < this.scrollHeight - this.clientHeight;
+
+            // If we're at the edge and trying to scroll beyond, prevent the event
+            const atTop = !canScrollUp && touchDelta < 0;
+            const atBottom = !canScrollDown && touchDelta > 0;
+
+            if (atTop || atBottom) {
+                e.preventDefault();
+                e.stopPropagation();
+            }
+        }, { passive: false });
+    });
+});
+
+/* ============================================================
+   GUEST MENU JAVASCRIPT - Dropdown Menu for Guests
+   Feature: Provides navigation for non-authenticated users
+   Safety: Uses unique class names and IDs to avoid conflicts
+   Flag: GUEST_MENU_ENABLED = true (set to false to disable)
+   ============================================================ */
+
+// Feature flag - set to false to completely disable guest menu
+const GUEST_MENU_ENABLED = true;
+
+// Initialize guest menu functionality
+function initGuestMenu() {
+    // Early exit if feature is disabled
+    if (!GUEST_MENU_ENABLED) {
+        console.info('[Guest Menu] Feature is disabled via flag');
+        return;
+    }
+
+    const guestMenuToggle = document.getElementById('guest-menu-toggle');
+    const guestMenuDropdown = document.getElementById('guest-menu-dropdown');
+
+    // Verify elements exist (only for non-authenticated users)
+    if (!guestMenuToggle || !guestMenuDropdown) {
+        console.debug('[Guest Menu] Guest menu elements not found (likely authenticated user)');
+        return;
+    }
+
+    console.info('[Guest Menu] Initializing guest dropdown menu');
+
+    // Toggle dropdown visibility
+    function toggleGuestMenu(e) {
+        e.preventDefault();
+        e.stopPropagation();
+
+        const isOpen = guestMenuDropdown.classList.contains('guest-menu-show');
+
+        if (isOpen) {
+            guestMenuDropdown.classList.remove('guest-menu-show');
+            guestMenuToggle.setAttribute('aria-expanded', 'false');
+            guestMenuDropdown.setAttribute('aria-hidden', 'true');
+        } else {
+            guestMenuDropdown.classList.add('guest-menu-show');
+            guestMenuToggle.setAttribute('aria-expanded', 'true');
+            guestMenuDropdown.setAttribute('aria-hidden', 'false');
+        }
+    }
+
+    // Close dropdown when clicking outside
+    function closeGuestMenu(e) {
+        // Don't close if clicking on the toggle button or container
+        if (guestMenuToggle.contains(e.target) || guestMenuToggle.closest('.guest-menu-container').contains(e.target)) {
+            return;
+        }
+
+        if (guestMenuDropdown.classList.contains('guest-menu-show')) {
+            guestMenuDropdown.classList.remove('guest-menu-show');
+            guestMenuToggle.setAttribute('aria-expanded', 'false');
+            guestMenuDropdown.setAttribute('aria-hidden', 'true');
+        }
+    }
+
+    // Close dropdown when a menu item is clicked
+    function handleMenuItemClick(e) {
+        // Don't close on click - let the link navigate naturally
+        // Menu will close after navigation
+    }
+
+    // Keyboard navigation support
+    function handleKeyboardNavigation(e) {
+        const isOpen = guestMenuDropdown.classList.contains('guest-menu-show');
+
+        // Close on Escape key
+        if (e.key === 'Escape' && isOpen) {
+            e.preventDefault();
+            guestMenuDropdown.classList.remove('guest-menu-show');
+            guestMenuToggle.setAttribute('aria-expanded', 'false');
+            guestMenuDropdown.setAttribute('aria-hidden', 'true');
+            guestMenuToggle.focus();
+            return;
+        }
+
+        // Open on Enter/Space when toggle is focused
+        if ((e.key === 'Enter' || e.key === ' ') && document.activeElement === guestMenuToggle && !isOpen) {
+            e.preventDefault();
+            toggleGuestMenu(e);
+        }
+    }
+
+    // Add event listeners
+    guestMenuToggle.addEventListener('click', toggleGuestMenu);
+    document.addEventListener('click', closeGuestMenu);
+    guestMenuDropdown.querySelectorAll('.guest-menu-item').forEach(item => {
+        item.addEventListener('click', handleMenuItemClick);
+    });
+    document.addEventListener('keydown', handleKeyboardNavigation);
+
+    console.debug('[Guest Menu] Event listeners attached successfully');
+}
+
+// Initialize guest menu when DOM is ready
+if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', initGuestMenu);
+} else {
+    // DOM already loaded
+    initGuestMenu();
+}
+
+// Cleanup function for guest menu (optional, for reference)
+function disableGuestMenu() {
+    console.info('[Guest Menu] Disabling guest menu');
+    const guestMenuToggle = document.getElementById('guest-menu-toggle');
+    const guestMenuDropdown = document.getElementById('guest-menu-dropdown');
+
+    if (guestMenuToggle) {
+        guestMenuToggle.style.display = 'none';
+    }
+    if (guestMenuDropdown) {
+        guestMenuDropdown.style.display = 'none';
+    }
+}
@@ -0,0 +1,173 @@
+// Theme toggle functionality
+const THEME_KEY = 'dog-dating-theme';
+
+function initTheme() {
+    const htmlElement = document.documentElement;
+    const themeToggle = document.getElementById('theme-toggle');
+    const savedTheme = localStorage.getItem(THEME_KEY) || 'dark';
+    setTheme(savedTheme);
+}
+
+function setTheme(theme) {
+    const htmlElement = document.documentElement;
+    const themeToggle = document.getElementById('theme-toggle');
+
+    if (!themeToggle) return;
+
+    htmlElement.setAttribute('data-theme', theme);
+    document.body.setAttribute('data-theme', theme);
+
+    const icon = themeToggle.querySelector('i');
+    const label = themeToggle.querySelector('.theme-label');
+
+    if (icon && label) {
+        if (theme === 'light') {
+            icon.className = 'bi bi-sun-fill';
+            label.textContent = 'Светлая';
+        } else {
+            icon.className = 'bi bi-moon-fill';
+            label.textContent = 'Темная';
+        }
+    }
+
+    localStorage.setItem(THEME_KEY, theme);
+}
+
+function toggleTheme() {
+    const htmlElement = document.documentElement;
+    const currentTheme = htmlElement.getAttribute('data-theme');
+    const newTheme = currentTheme === 'dark' ? 'light' : 'dark';
+    setTheme(newTheme);
+}
+
+document.addEventListener('DOMContentLoaded', function() {
+    initTheme();
+
+    // Attach theme toggle listener
+    const themeToggle = document.getElementById('theme-toggle');
+    if (themeToggle) {
+        themeToggle.addEventListener('click', toggleTheme);
+    }
+
+    // Smooth scrolling for anchor links
+    document.querySelectorAll('a[href^="#"]').forEach(anchor => {
+        anchor.addEventListener('click', function (e) {
+            e.preventDefault();
+            const target = document.querySelector(this.getAttribute('href'));
+            if (target) {
+                target.scrollIntoView({
+                    behavior: 'smooth',
+                    block: 'start'
+                });
+            }
+        });
+    });
+
+    // Add some animation on scroll
+    const observerOptions = {
+        threshold: 0.1,
+        rootMargin: '0px 0px -50px 0px'
+    };
+
+    const observer = new IntersectionObserver((entries) => {
+        entries.forEach(entry => {
+            if (entry.isIntersecting) {
+                entry.target.style.opacity = '1';
+                entry.target.style.transform = 'translateY(0)';
+            }
+        });
+    }, observerOptions);
+
+    // Animate feature cards and testimonial cards on scroll
+    document.querySelectorAll('.feature-card, .testimonial-card').forEach(card => {
+        card.style.opacity = '0';
+        card.style.transform = 'translateY(30px)';
+        card.style.transition = 'opacity 0.6s ease, transform 0.6s ease';
+        observer.observe(card);
+    });
+
+    // Initialize guest menu (same as in base.html)
+    initGuestMenu();
+});
+
+/* ============================================================
+   GUEST MENU JAVASCRIPT - Dropdown Menu for Guests
+   Feature: Provides navigation for non-authenticated users
+   ============================================================ */
+
+const GUEST_MENU_ENABLED = true;
+
+function initGuestMenu() {
+    if (!GUEST_MENU_ENABLED) {
+        console.info('[Guest Menu] Feature is disabled via flag');
+        return;
+    }
+
+    const guestMenuToggle = document.getElementById('guest-menu-toggle');
+    const guestMenuDropdown = document.getElementById('guest-menu-dropdown');
+
+    if (!guestMenuToggle || !guestMenuDropdown) {
+        console.debug('[Guest Menu] Guest menu elements not found');
+        return;
+    }
+
+    console.info('[Guest Menu] Initializing guest dropdown menu');
+
+    function toggleGuestMenu(e) {
+        e.preventDefault();
+        e.stopPropagation();
+
+        const isOpen = guestMenuDropdown.classList.contains('guest-menu-show');
+
+        if (isOpen) {
+            guestMenuDropdown.classList.remove('guest-menu-show');
+            guestMenuToggle.setAttribute('aria-expanded', 'false');
+            guestMenuDropdown.setAttribute('aria-hidden', 'true');
+        } else {
+            guestMenuDropdown.classList.add('guest-menu-show');
+            guestMenuToggle.setAttribute('aria-expanded', 'true');
+            guestMenuDropdown.setAttribute('aria-hidden', 'false');
+        }
+    }
+
+    function closeGuestMenu(e) {
+        if (guestMenuToggle.contains(e.target) || guestMenuToggle.closest('.guest-menu-container').contains(e.target)) {
+            return;
+        }
+
+        if (guestMenuDropdown.classList.contains('guest-menu-show')) {
+            guestMenuDropdown.classList.remove('guest-menu-show');
+            guestMenuToggle.setAttribute('aria-expanded', 'false');
+            guestMenuDropdown.setAttribute('aria-hidden', 'true');
+        }
+    }
+
+    function handleKeyboardNavigation(e) {
+        const isOpen = guestMenuDropdown.classList.contains('guest-menu-show');
+
+        if (e.key === 'Escape' && isOpen) {
+            e.preventDefault();
+            guestMenuDropdown.classList.remove('guest-menu-show');
+            guestMenuToggle.setAttribute('aria-expanded', 'false');
+            guestMenuDropdown.setAttribute('aria-hidden', 'true');
+            guestMenuToggle.focus();
+            return;
+        }
+
+        if ((e.key === 'Enter' || e.key === ' ') && document.activeElement === guestMenuToggle && !isOpen) {
+            e.preventDefault();
+            toggleGuestMenu(e);
+        }
+    }
+
+    guestMenuToggle.addEventListener('click', toggleGuestMenu);
+    document.addEventListener('click', closeGuestMenu);
+    guestMenuDropdown.querySelectorAll('.guest-menu-item').forEach(item => {
+        item.addEventListener('click', function() {
+            // Let the link navigate naturally
+        });
+    });
+    document.addEventListener('keydown', handleKeyboardNavigation);
+
+    console.debug('[Guest Menu] Event listeners attached successfully');
+}
@@ -0,0 +1,355 @@
+"""
+Сборка CSS/JS бандлов из исходников в dogs/assets.
+
+Бандлы пишутся в static/dogs/bundles и коммитятся, как и заглушки из
+render_placeholders. collectstatic через CompressedManifestStaticFilesStorage
+добавляет к имени хэш содержимого и сжимает файлы gzip и brotli, а WhiteNoise
+отдает хэшированные имена с Cache-Control: immutable — повторные просмотры
+страниц загружают только HTML.
+"""
+
+import hashlib
+import logging
+import re
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+ASSETS_DIR = Path(__file__).resolve().parent / "assets"
+BUNDLES_STATIC_DIR = "dogs/bundles"
+
+# Имя бандла -> исходники в порядке подключения. Кортеж (файл, media)
+# оборачивает стили в @media, как атрибут media у <link>.
+BUNDLES = {
+    "app.css": [
+        ("css/mobile.css", "screen and (max-width: 1024px)"),
+        "css/base.css",
+    ],
+    "app.js": [
+        "js/base.js",
+        "js/mobile-optimization.js",
+        "js/mobile-responsive-fix.js",
+    ],
+    "landing.css": ["css/landing.css"],
+    "landing.js": ["js/landing.js"],
+}
+
+# Строки и комментарии CSS; все остальное — код, который можно сжимать
+_CSS_TOKEN_RE = re.compile(
+    r"""(?P<string>"(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|(?P<comment>/\*.*?\*/)""",
+    re.DOTALL,
+)
+_CSS_SPACE_RE = re.compile(r"\s+")
+_CSS_PUNCTUATION_RE = re.compile(r"\s*([{};,>])\s*")
+_CSS_COLON_RE = re.compile(r":\s+")
+
+
+def _minify_css_code(code):
+    code = _CSS_SPACE_RE.sub(" ", code)
+    code = _CSS_PUNCTUATION_RE.sub(r"\1", code)
+    # Только пробел после ":" — пробел перед ним значим в селекторах (a :hover)
+    return _CSS_COLON_RE.sub(":", code)
+
+
+def minify_css(source):
+    """
+    Удаляет комментарии и лишние пробелы из CSS
+
+    Пробелы убираются только вокруг { } ; , > и после :, где они не
+    значимы; строки в кавычках не меняются.
+    """
+    parts = []
+    position = 0
+    for match in _CSS_TOKEN_RE.finditer(source):
+        parts.append(_minify_css_code(source[position : match.start()]))
+        if match.group("string"):
+            parts.append(match.group("string"))
+        position = match.end()
+    parts.append(_minify_css_code(source[position:]))
+    return "".join(parts).replace(";}", "}").strip()
+
+
+def minify_js(source):
+    """
+    Консервативно сжимает JavaScript без парсера
+
+    Удаляются отступы, пустые строки и строки, целиком состоящие из
+    комментария //. Переводы строк сохраняются (автоподстановка ;),
+    а строки внутри шаблонных литералов `...` и после \\ не трогаются.
+    """
+    lines = []
+    in_template = False
+    continued = False
+    for line in source.splitlines():
+        stripped = line.strip()
+        if in_template or continued:
+            lines.append(line)
+        elif stripped.startswith("//"):
+            continue
+        elif stripped:
+            lines.append(stripped)
+        in_template ^= len(re.findall(r"(?<!\\)`", line)) % 2 == 1
+        continued = line.endswith("\\")
+    return "\n".join(lines)
+
+
+def _read_source(source):
+    path, media = source if isinstance(source, tuple) else (source, None)
+    text = (ASSETS_DIR / path).read_text(encoding="utf-8")
+    return text, media
+
+
+def build_bundle(name):
+    """Возвращает содержимое бандла ``name`` из BUNDLES"""
+    chunks = []
+    for source in BUNDLES[name]:
+        text, media = _read_source(source)
+        if name.endswith(".css"):
+            text = minify_css(text)
+            if media:
+                text = f"@media {media}{{{text}}}"
+        else:
+            # ; на стыке файлов: исходник может не заканчиваться точкой с запятой
+            text = minify_js(text) + "\n;"
+        chunks.append(text)
+    return "\n".join(chunks) + "\n"
+
+
+# Критический CSS: страница -> (шаблон, бандл стилей)
+CRITICAL_PAGES = {
+    "landing": ("dogs/landing.html", "landing.css"),
+    "dog_list": ("dogs/dog_list.html", "app.css"),
+    "dog_detail": ("dogs/dog_detail.html", "app.css"),
+    "dashboard": ("dogs/dashboard.html", "app.css"),
+}
+CRITICAL_STATIC_DIR = f"{BUNDLES_STATIC_DIR}/critical"
+# Шаблоны, которые теги рендерят внутри страницы
+TAG_TEMPLATES = {
+    "draw_menu": ("menu/menu.html", "menu/menu_item.html"),
+    "dog_cards": (
+        "dogs/components/dog_card.html",
+        "dogs/components/dog_card_landing.html",
+    ),
+}
+# Состояния взаимодействия и анимации не нужны для первой отрисовки
+# Состояния взаимодействия, декоративные псевдоэлементы и полосы прокрутки
+# тоже можно дорисовать после загрузки полного бандла
+NON_CRITICAL_SELECTOR_RE = re.compile(
+    r":(?:hover|focus|focus-visible|focus-within|active|visited)\b"
+    r"|::?(?:selection|before|after|placeholder)\b|::-webkit-scrollbar"
+)
+NON_CRITICAL_AT_RULES = ("@keyframes", "@-webkit-keyframes", "@media print")
+# Разметка шаблона после этой метки не видна при первой отрисовке
+# (подвал, вторые карточки); без метки учитывается весь шаблон
+FOLD_MARKER = "{# critical:fold #}"
+# Разметка между {# critical:hidden ... #} и {# critical:endhidden #} скрыта
+# до действия пользователя (выпадающие меню)
+_HIDDEN_MARKUP_RE = re.compile(
+    r"{#\s*critical:hidden\b.*?#}.*?{#\s*critical:endhidden\s*#}", re.DOTALL
+)
+# Уточнения для отдельных устройств и настроек, не меняющие раскладку
+NON_CRITICAL_MEDIA_RE = re.compile(
+    r"@media\s*\((?:prefers-reduced-motion|-webkit-min-device-pixel-ratio|pointer)"
+)
+
+_TEMPLATE_REFERENCE_RE = re.compile(r"""{%\s*(?:extends|include)\s+["']([^"']+)["']""")
+_ATTRIBUTE_RE = re.compile(r"""\b(?:class|id)\s*=\s*(["'])(.*?)\1""", re.DOTALL)
+_TOKEN_RE = re.compile(r"[\w-]+")
+_TAG_RE = re.compile(r"<([a-zA-Z][\w-]*)")
+# Есть на любой странице, даже если шаблон их не содержит
+ALWAYS_PRESENT_TAGS = {"html", "body"}
+_SELECTOR_PSEUDO_RE = re.compile(r"::?[\w-]+(?:\([^)]*\))?")
+_SELECTOR_TAG_RE = re.compile(r"(?<![\w.#-])([a-zA-Z][\w-]*)")
+_SELECTOR_NAME_RE = re.compile(r"[.#](-?[_a-zA-Z][\w-]*)")
+_SELECTOR_NOISE_RE = re.compile(r"\[[^\]]*\]|\"[^\"]*\"|'[^']*'")
+
+
+def template_sources(name):
+    """
+    Разметка первого экрана: шаблон и все, что он расширяет или включает
+
+    Каждый исходник обрезается по FOLD_MARKER, скрытые участки
+    (critical:hidden) вырезаются; включения в отброшенной разметке не
+    учитываются. Возвращает {имя: (путь к файлу, исходник)}.
+    """
+    from django.template.loader import get_template
+
+    sources = {}
+    pending = [name]
+    while pending:
+        current = pending.pop()
+        if current in sources:
+            continue
+        template = get_template(current).template
+        source = _HIDDEN_MARKUP_RE.sub("", template.source.partition(FOLD_MARKER)[0])
+        sources[current] = (template.origin.name, source)
+        pending.extend(_TEMPLATE_REFERENCE_RE.findall(source))
+        for tag, templates in TAG_TEMPLATES.items():
+            if "{% " + tag in source:
+                pending.extend(templates)
+    return sources
+
+
+def used_names(markup):
+    """
+    Классы и id, которые встречаются в атрибутах class/id разметки
+
+    Значения с тегами шаблона ({% if %}active{% endif %}) просто
+    разбиваются на слова: лишнее имя лишь оставит лишнее правило.
+    """
+    names = set()
+    for _, value in _ATTRIBUTE_RE.findall(markup):
+        names.update(_TOKEN_RE.findall(value))
+    return names
+
+
+def used_tags(markup):
+    """Имена HTML-элементов, которые встречаются в разметке"""
+    return {tag.lower() for tag in _TAG_RE.findall(markup)} | ALWAYS_PRESENT_TAGS
+
+
+def _split_blocks(css):
+    """Разбивает CSS верхнего уровня на пары (прелюдия, тело блока)"""
+    blocks = []
+    depth = 0
+    quote = None
+    start = body_start = 0
+    for index, char in enumerate(css):
+        if quote:
+            if char == quote and css[index - 1] != "\\":
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == "{":
+            if depth == 0:
+                body_start = index
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                blocks.append(
+                    (css[start:body_start].strip(), css[body_start + 1 : index])
+                )
+                start = index + 1
+    return blocks
+
+
+def _selector_is_critical(selector, names, tags):
+    if NON_CRITICAL_SELECTOR_RE.search(selector):
+        return False
+    cleaned = _SELECTOR_NOISE_RE.sub("", selector)
+    if not all(name in names for name in _SELECTOR_NAME_RE.findall(cleaned)):
+        return False
+    if tags is None:
+        return True
+    elements = _SELECTOR_PSEUDO_RE.sub("", _SELECTOR_NAME_RE.sub("", cleaned))
+    return all(tag.lower() in tags for tag in _SELECTOR_TAG_RE.findall(elements))
+
+
+def extract_critical_css(css, names, tags=None):
+    """
+    Оставляет правила, селекторы которых ссылаются только на ``names``
+
+    Без браузера «первый экран» определяется статически: правило нужно,
+    если все его классы и id (и элементы, если заданы ``tags``) есть в
+    разметке до FOLD_MARKER. Состояния :hover и т.п., псевдоэлементы,
+    @keyframes и стили печати отбрасываются; @media и @supports
+    сохраняются с отобранными вложенными правилами.
+    """
+    rules = []
+    for prelude, body in _split_blocks(css):
+        if prelude.startswith(NON_CRITICAL_AT_RULES) or NON_CRITICAL_MEDIA_RE.match(
+            prelude
+        ):
+            continue
+        if prelude.startswith(("@media", "@supports")):
+            inner = extract_critical_css(body, names, tags)
+            if inner:
+                rules.append(f"{prelude}{{{inner}}}")
+        elif prelude.startswith("@"):
+            rules.append(f"{prelude}{{{body}}}")
+        else:
+            selectors = [
+                selector
+                for selector in prelude.split(",")
+                if _selector_is_critical(selector, names, tags)
+            ]
+            if selectors:
+                rules.append(f"{','.join(selectors)}{{{body}}}")
+    return "".join(rules)
+
+
+def critical_fingerprint(page):
+    """Хэш разметки первого экрана и бандла: меняется вместе с шаблонами"""
+    template_name, bundle = CRITICAL_PAGES[page]
+    digest = hashlib.blake2b(digest_size=8)
+    for name, (_, source) in sorted(template_sources(template_name).items()):
+        digest.update(name.encode())
+        digest.update(source.encode())
+    digest.update(build_bundle(bundle).encode())
+    return digest.hexdigest()
+
+
+def build_critical_css(page):
+    """Критический CSS страницы с отпечатком исходников в первой строке"""
+    template_name, bundle = CRITICAL_PAGES[page]
+    markup = "".join(source for _, source in template_sources(template_name).values())
+    css = extract_critical_css(
+        build_bundle(bundle), used_names(markup), used_tags(markup)
+    )
+    return f"/* {critical_fingerprint(page)} */\n{css}\n"
+
+
+def _source_paths(page):
+    """Файлы, из которых получается критический CSS страницы"""
+    template_name, bundle = CRITICAL_PAGES[page]
+    paths = [path for path, _ in template_sources(template_name).values()]
+    for source in BUNDLES[bundle]:
+        paths.append(ASSETS_DIR / (source[0] if isinstance(source, tuple) else source))
+    return paths
+
+
+def _mtimes(paths):
+    mtimes = []
+    for path in paths:
+        try:
+            mtimes.append(Path(path).stat().st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+
+# страница -> (файлы-источники, их mtime, CSS)
+_critical_css = {}
+
+
+def get_critical_css(page):
+    """
+    Критический CSS страницы для вставки в <style>
+
+    Файл из build_bundles используется, пока его отпечаток совпадает с
+    текущими шаблонами и бандлом; иначе CSS пересчитывается в памяти,
+    чтобы правка шаблона не требовала ручной пересборки. Результат
+    кэшируется на процесс; с DEBUG он пересчитывается, только когда
+    меняется mtime одного из исходников.
+    """
+    from django.conf import settings
+    from django.contrib.staticfiles import finders
+
+    if page in _critical_css:
+        paths, mtimes, css = _critical_css[page]
+        if not settings.DEBUG or _mtimes(paths) == mtimes:
+            return css
+
+    path = finders.find(f"{CRITICAL_STATIC_DIR}/{page}.css")
+    paths = _source_paths(page)
+    if path:
+        paths.append(path)
+    mtimes = _mtimes(paths)
+    content = Path(path).read_text(encoding="utf-8") if path else ""
+    header, _, css = content.partition("\n")
+    if header != f"/* {critical_fingerprint(page)} */":
+        logger.info("Critical CSS for %s is stale, rebuilding", page)
+        header, _, css = build_critical_css(page).partition("\n")
+    _critical_css[page] = (paths, mtimes, css.strip())
+    return _critical_css[page][2]
@@ -94,9 +94,16 @@ class UserLoginForm(AuthenticationForm):
 class DogForm(forms.ModelForm):
     """Форма для создания/редактирования профиля собаки"""
 
-    photo = forms.ImageField(
+    # FileField, а не ImageField: формат и разрешение проверяет валидатор
+    # модели validate_image_upload по заголовку, без декодирования картинки
+    photo = forms.FileField(
         required=False,
-        widget=forms.FileInput(attrs={"class": "form-control", "accept": "image/*"}),
+        widget=forms.FileInput(
+            attrs={
+                "class": "form-control",
+                "accept": "image/jpeg,image/png,image/webp",
+            }
+        ),
         label="Фото",
         help_text="Рекомендуемый размер: 400x400 пикселей",
     )
@@ -178,21 +185,6 @@ class DogForm(forms.ModelForm):
             raise ValidationError("Возраст должен быть от 0 до 20 лет")
         return age
 
-    def clean_photo(self):
-        photo = self.cleaned_data.get("photo")
-        if not photo:
-            return photo
-
-        max_mb = 5
-        if getattr(photo, "size", 0) > max_mb * 1024 * 1024:
-            raise ValidationError(f"Размер изображения не должен превышать {max_mb} МБ")
-
-        content_type = getattr(photo, "content_type", "")
-        if content_type not in {"image/jpeg", "image/png", "image/webp"}:
-            raise ValidationError("Допустимые форматы изображения: JPEG, PNG, WebP")
-
-        return photo
-
 
 class UserProfileForm(forms.ModelForm):
     """Форма для редактирования профиля пользователя"""
@@ -200,6 +192,8 @@ class UserProfileForm(forms.ModelForm):
     class Meta:
         model = UserProfile
         fields = ["bio", "location", "phone", "avatar"]
+        # Аватар проверяет validate_image_upload (см. DogForm.photo)
+        field_classes = {"avatar": forms.FileField}
         widgets = {
             "bio": forms.Textarea(
                 attrs={
@@ -219,7 +213,10 @@ class UserProfileForm(forms.ModelForm):
                 }
             ),
             "avatar": forms.FileInput(
-                attrs={"class": "form-control", "accept": "image/*"}
+                attrs={
+                    "class": "form-control",
+                    "accept": "image/jpeg,image/png,image/webp",
+                }
             ),
         }
         labels = {
@@ -282,6 +279,18 @@ class AccountDeletionForm(forms.Form):
 class DogSearchForm(forms.Form):
     """Форма поиска собак"""
 
+    q = forms.CharField(
+        required=False,
+        max_length=200,
+        widget=forms.TextInput(
+            attrs={
+                "class": "form-control",
+                "placeholder": "Порода, характер, описание...",
+                "type": "search",
+            }
+        ),
+        label="Поиск",
+    )
     breed = forms.CharField(
         required=False,
         widget=forms.TextInput(
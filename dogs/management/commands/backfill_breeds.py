@@ -0,0 +1,38 @@
+"""
+Django management command to link dogs to the normalized breed catalog.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from dogs.models import normalize_breed_name
+from services.breed_service import add_breed_alias, backfill_breeds, resolve_breed
+
+
+class Command(BaseCommand):
+    help = "Create Breed entries from Dog.breed and link every dog to its breed"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--alias",
+            action="append",
+            default=[],
+            metavar="ALIAS=BREED",
+            help="Register an alias before linking, e.g. --alias Labrador=Лабрадор",
+        )
+
+    def handle(self, *args, **options):
+        for pair in options["alias"]:
+            alias, sep, breed_name = pair.partition("=")
+            if not sep or not normalize_breed_name(alias):
+                raise CommandError(f"Invalid alias '{pair}', expected ALIAS=BREED")
+            breed = resolve_breed(breed_name, create=True)
+            add_breed_alias(breed, alias.strip())
+            self.stdout.write(f"Alias '{alias.strip()}' → {breed.name}")
+
+        stats = backfill_breeds()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {stats['breeds_created']} breeds, "
+                f"linked {stats['dogs_linked']} dogs."
+            )
+        )
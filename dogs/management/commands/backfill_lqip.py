@@ -0,0 +1,50 @@
+"""
+Django management command to compute LQIP previews for existing dog photos.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from services.image_service import backfill_lqip
+from services.photo_queue_service import init_worker
+
+
+class Command(BaseCommand):
+    help = "Compute tiny inline previews (LQIP) of dog photos in worker processes"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=getattr(settings, "IMAGE_WORKER_PROCESSES", 2),
+            help="Number of worker processes (0 computes in this process)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=200,
+            help="How many photos to fetch and compute per batch",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Recompute previews that already exist",
+        )
+
+    def handle(self, *args, **options):
+        workers = max(options["workers"], 0)
+        executor = (
+            ProcessPoolExecutor(max_workers=workers, initializer=init_worker)
+            if workers
+            else None
+        )
+        try:
+            updated = backfill_lqip(
+                executor, force=options["force"], batch_size=options["batch_size"]
+            )
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        self.stdout.write(self.style.SUCCESS(f"Stored {updated} photo previews."))
@@ -0,0 +1,35 @@
+"""
+Django management command to generate WebP/JPEG renditions for existing media.
+"""
+
+from django.core.management.base import BaseCommand
+
+from services.image_service import backfill_renditions
+
+
+class Command(BaseCommand):
+    help = "Generate resized WebP/JPEG copies of dog photos and avatars"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Re-render images that already have renditions",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=200,
+            help="How many rows to fetch per query",
+        )
+
+    def handle(self, *args, **options):
+        processed = backfill_renditions(
+            force=options["force"], batch_size=options["batch_size"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rendered {processed['dogs']} dog photos "
+                f"and {processed['avatars']} avatars."
+            )
+        )
@@ -0,0 +1,58 @@
+"""
+Django management command to build minified CSS/JS bundles into static files.
+"""
+
+from pathlib import Path
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from dogs.bundling import (
+    BUNDLES,
+    BUNDLES_STATIC_DIR,
+    CRITICAL_PAGES,
+    build_bundle,
+    build_critical_css,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Concatenate and minify dogs/assets into bundles picked up by collectstatic "
+        "and extract the critical CSS of each page"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output-dir",
+            default=None,
+            help="Directory to write to (default: the dogs app static directory)",
+        )
+
+    def handle(self, *args, **options):
+        output_dir = Path(
+            options["output_dir"]
+            or Path(apps.get_app_config("dogs").path) / "static" / BUNDLES_STATIC_DIR
+        )
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        for name in BUNDLES:
+            path = output_dir / name
+            content = build_bundle(name)
+            path.write_text(content, encoding="utf-8")
+            self.stdout.write(f"Wrote {path} ({len(content.encode()) // 1024} KB)")
+
+        critical_dir = output_dir / "critical"
+        critical_dir.mkdir(exist_ok=True)
+        for page in CRITICAL_PAGES:
+            path = critical_dir / f"{page}.css"
+            content = build_critical_css(page)
+            path.write_text(content, encoding="utf-8")
+            self.stdout.write(f"Wrote {path} ({len(content.encode())} bytes)")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Built {len(BUNDLES)} bundles and "
+                f"{len(CRITICAL_PAGES)} critical stylesheets."
+            )
+        )
@@ -0,0 +1,49 @@
+"""
+Django management command to delete media files no longer used by any record.
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.template.defaultfilters import filesizeformat
+
+from services.media_service import collect_orphaned_media
+
+
+class Command(BaseCommand):
+    help = "Delete orphaned dog photos, avatars and renditions from MEDIA_ROOT"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--grace-hours",
+            type=float,
+            default=24,
+            help="Keep files modified within this many hours",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="How many file names to check per query",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report what would be deleted",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        stats = collect_orphaned_media(
+            grace_period=timedelta(hours=options["grace_hours"]),
+            batch_size=options["batch_size"],
+            dry_run=dry_run,
+        )
+
+        prefix = "Would delete" if dry_run else "Deleted"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Scanned {stats['scanned']} files. {prefix} {stats['deleted']} "
+                f"orphans, reclaiming {filesizeformat(stats['bytes'])}."
+            )
+        )
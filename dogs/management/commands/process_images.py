@@ -0,0 +1,91 @@
+"""
+Django management command that renders queued dog photos in a process pool.
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from services.photo_queue_service import (
+    init_worker,
+    max_attempts,
+    process_photo_queue,
+    requeue_stuck_jobs,
+)
+
+
+class Command(BaseCommand):
+    help = "Render WebP/JPEG copies of uploaded dog photos in worker processes"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=getattr(settings, "IMAGE_WORKER_PROCESSES", 2),
+            help="Number of worker processes (0 renders in this process)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="Photos claimed per batch (default: 4 per worker)",
+        )
+        parser.add_argument(
+            "--max-attempts",
+            type=int,
+            default=max_attempts(),
+            help="Mark a photo as failed after this many errors",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Drain the queue and exit instead of polling",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=5.0,
+            help="Seconds to wait when the queue is empty",
+        )
+        parser.add_argument(
+            "--requeue-stuck",
+            action="store_true",
+            help="Requeue photos left in 'processing' by a killed worker",
+        )
+
+    def handle(self, *args, **options):
+        workers = max(options["workers"], 0)
+        batch_size = options["batch_size"] or max(workers, 1) * 4
+
+        if options["requeue_stuck"]:
+            self.stdout.write(f"Requeued {requeue_stuck_jobs()} stuck photos.")
+
+        executor = (
+            ProcessPoolExecutor(max_workers=workers, initializer=init_worker)
+            if workers
+            else None
+        )
+        try:
+            while True:
+                stats = process_photo_queue(
+                    executor,
+                    batch_size=batch_size,
+                    attempts_limit=options["max_attempts"],
+                )
+                if stats:
+                    self.stdout.write(
+                        self.style.SUCCESS(
+                            f"Ready: {stats['ready']}, retried: {stats['retried']}, "
+                            f"failed: {stats['failed']}, skipped: {stats['skipped']}."
+                        )
+                    )
+                if options["once"]:
+                    break
+                time.sleep(options["poll_interval"])
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if executor is not None:
+                executor.shutdown()
@@ -0,0 +1,15 @@
+"""
+Django management command to rebuild the dog full-text search index.
+"""
+
+from django.core.management.base import BaseCommand
+
+from services.search_service import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index (tsvector or FTS5) for all dogs"
+
+    def handle(self, *args, **options):
+        count = rebuild_search_index()
+        self.stdout.write(self.style.SUCCESS(f"Search index rebuilt for {count} dogs."))
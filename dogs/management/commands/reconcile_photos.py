@@ -0,0 +1,38 @@
+"""
+Django management command to resync Dog.photo_available with media storage.
+"""
+
+from django.core.management.base import BaseCommand
+
+from services.media_service import reconcile_photo_flags
+
+
+class Command(BaseCommand):
+    help = "Mark dogs whose photo file exists and unmark those whose file is gone"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="How many files or dogs to process per query",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report what would change",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        result = reconcile_photo_flags(
+            batch_size=options["batch_size"], dry_run=dry_run
+        )
+
+        prefix = "Would mark" if dry_run else "Marked"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{prefix} {result['marked']} photos available, "
+                f"{result['cleared']} missing."
+            )
+        )
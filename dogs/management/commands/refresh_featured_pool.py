@@ -0,0 +1,17 @@
+"""
+Django management command to resample the landing page featured dog pool.
+
+The pool lives in the shared cache, so one run refreshes it for every worker.
+"""
+
+from django.core.management.base import BaseCommand
+
+from services.featured_service import refresh_featured_pool
+
+
+class Command(BaseCommand):
+    help = "Resample the featured dogs shown on the landing page"
+
+    def handle(self, *args, **options):
+        pool = refresh_featured_pool()
+        self.stdout.write(self.style.SUCCESS(f"Featured pool has {len(pool)} dogs."))
@@ -0,0 +1,39 @@
+"""
+Django management command to render placeholder images into static files.
+"""
+
+from pathlib import Path
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from dogs.utils import PLACEHOLDER_STATIC_DIR, PLACEHOLDERS, render_placeholder_svg
+
+
+class Command(BaseCommand):
+    help = "Render dog/avatar placeholders to SVG files picked up by collectstatic"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output-dir",
+            default=None,
+            help="Directory to write to (default: the dogs app static directory)",
+        )
+
+    def handle(self, *args, **options):
+        output_dir = Path(
+            options["output_dir"]
+            or Path(apps.get_app_config("dogs").path)
+            / "static"
+            / PLACEHOLDER_STATIC_DIR
+        )
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        for variant in PLACEHOLDERS:
+            path = output_dir / f"{variant}.svg"
+            path.write_text(render_placeholder_svg(variant), encoding="utf-8")
+            self.stdout.write(f"Wrote {path}")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Rendered {len(PLACEHOLDERS)} placeholders.")
+        )
@@ -0,0 +1,149 @@
+"""
+Django management command to normalize existing dog photos in a process pool.
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from datetime import time as dt_time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.template.defaultfilters import filesizeformat
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from services.photo_queue_service import init_worker
+from services.photo_reprocess_service import DEFAULT_REPROCESS_QUALITY, reprocess_photos
+
+STATE_FILE_NAME = ".reprocess_photos.json"
+
+
+def parse_since(value):
+    moment = parse_datetime(value)
+    if moment is None:
+        day = parse_date(value)
+        if day is None:
+            raise CommandError(f"Invalid --since value: {value!r}")
+        moment = datetime.combine(day, dt_time.min)
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+class Command(BaseCommand):
+    help = (
+        "Apply EXIF orientation, strip metadata and re-encode dog photos "
+        "in worker processes"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=getattr(settings, "IMAGE_WORKER_PROCESSES", 2),
+            help="Number of worker processes (0 re-encodes in this process)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=32,
+            help="Photos per batch; progress is saved after each batch",
+        )
+        parser.add_argument(
+            "--quality",
+            type=int,
+            default=DEFAULT_REPROCESS_QUALITY,
+            help="JPEG/WebP quality of the re-encoded photos",
+        )
+        parser.add_argument(
+            "--since",
+            help="Only dogs updated at or after this date/datetime (ISO 8601)",
+        )
+        parser.add_argument(
+            "--state-file",
+            default=None,
+            help=f"Progress file (default: MEDIA_ROOT/{STATE_FILE_NAME})",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignore saved progress and start from the first dog",
+        )
+
+    def handle(self, *args, **options):
+        since = parse_since(options["since"]) if options["since"] else None
+        state_file = options["state_file"] or os.path.join(
+            settings.MEDIA_ROOT, STATE_FILE_NAME
+        )
+        state = {"since": options["since"], "last_pk": 0}
+        if not options["restart"]:
+            saved = self.load_state(state_file)
+            if saved.get("since") == options["since"]:
+                state["last_pk"] = saved.get("last_pk", 0)
+        if state["last_pk"]:
+            self.stdout.write(f"Resuming after dog #{state['last_pk']}.")
+
+        started = time.monotonic()
+
+        def on_batch(last_pk, stats):
+            state["last_pk"] = last_pk
+            self.save_state(state_file, state)
+            done = stats["processed"] + stats["skipped"] + stats["failed"]
+            rate = done / max(time.monotonic() - started, 1e-6)
+            self.stdout.write(
+                f"Up to dog #{last_pk}: processed {stats['processed']}, "
+                f"skipped {stats['skipped']}, failed {stats['failed']} "
+                f"({rate:.1f} photos/s)"
+            )
+
+        workers = max(options["workers"], 0)
+        executor = (
+            ProcessPoolExecutor(max_workers=workers, initializer=init_worker)
+            if workers
+            else None
+        )
+        try:
+            stats = reprocess_photos(
+                executor,
+                since=since,
+                quality=options["quality"],
+                batch_size=options["batch_size"],
+                start_after=state["last_pk"],
+                on_batch=on_batch,
+            )
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        if os.path.exists(state_file):
+            os.remove(state_file)
+        elapsed = time.monotonic() - started
+        done = stats["processed"] + stats["skipped"] + stats["failed"]
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Processed {stats['processed']}, skipped {stats['skipped']}, "
+                f"failed {stats['failed']}, stale {stats['stale']} photos "
+                f"in {elapsed:.1f}s ({done / max(elapsed, 1e-6):.1f} photos/s). "
+                f"Size {filesizeformat(stats['bytes_before'])} -> "
+                f"{filesizeformat(stats['bytes_after'])}."
+            )
+        )
+
+    @staticmethod
+    def load_state(path):
+        try:
+            with open(path) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def save_state(path, state):
+        # Write a temp file first so an interrupted write keeps old progress
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w") as file:
+            json.dump(state, file)
+        os.replace(temp_path, path)
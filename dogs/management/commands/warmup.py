@@ -0,0 +1,18 @@
+"""
+Django management command to run the startup warmup and report its timings.
+"""
+
+from django.core.management.base import BaseCommand
+
+from services.warmup_service import warm_up
+
+
+class Command(BaseCommand):
+    help = "Compile templates, populate the URL resolver and build menu caches"
+
+    def handle(self, *args, **options):
+        timings = warm_up()
+        for step, (items, seconds) in timings.items():
+            self.stdout.write(f"{step}: {items} in {seconds * 1000:.1f} ms")
+        total = sum(seconds for _, seconds in timings.values())
+        self.stdout.write(self.style.SUCCESS(f"Warmup took {total * 1000:.1f} ms."))
@@ -0,0 +1,157 @@
+import mimetypes
+import os
+import posixpath
+import re
+import stat
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from django.views.decorators.http import require_safe
+
+from .storage import is_content_addressed
+
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+DEFAULT_MEDIA_MAX_AGE = 60 * 60
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def parse_range(header, size):
+    """Разбирает заголовок Range с одним диапазоном байт.
+
+    Возвращает (start, end) включительно или None, если заголовок нужно
+    проигнорировать и отдать файл целиком (нет заголовка, несколько
+    диапазонов, другая единица). Диапазон за концом файла — 416.
+    """
+    match = _RANGE_RE.match((header or "").strip())
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+
+    if not first:
+        # bytes=-500: последние 500 байт
+        length = int(last)
+        if length == 0 or size == 0:
+            raise RangeNotSatisfiable
+        return max(size - length, 0), size - 1
+
+    start = int(first)
+    end = int(last) if last else size - 1
+    if start >= size or end < start:
+        raise RangeNotSatisfiable
+    return start, min(end, size - 1)
+
+
+def _iter_file_range(path, start, length):
+    """Читает файл кусками: память не зависит от размера диапазона"""
+    with open(path, "rb") as file:
+        file.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = file.read(min(STREAM_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def _cache_control(path):
+    if is_content_addressed(path):
+        # Имя — хэш содержимого, файл по этому адресу никогда не изменится
+        return f"public, max-age={IMMUTABLE_MAX_AGE}, immutable"
+    max_age = getattr(settings, "MEDIA_CACHE_MAX_AGE", DEFAULT_MEDIA_MAX_AGE)
+    return f"public, max-age={max_age}"
+
+
+@require_safe
+def serve_media(request, path):
+    """Отдает файл из MEDIA_ROOT в production.
+
+    Поддерживает условные запросы (ETag/Last-Modified → 304), один диапазон
+    Range (206/416) и долгий кэш для контентно-адресуемых имен. Если задан
+    MEDIA_ACCEL_REDIRECT_PREFIX, тело отдает nginx по X-Accel-Redirect,
+    и воркер gunicorn не занят передачей байт.
+    """
+    path = posixpath.normpath(path).lstrip("/")
+    if posixpath.basename(path).startswith("."):
+        # Скрытые и временные файлы (.upload-*) не отдаем
+        raise Http404
+    try:
+        full_path = safe_join(settings.MEDIA_ROOT, path)
+        file_stat = os.stat(full_path)
+    except (SuspiciousFileOperation, OSError):
+        raise Http404
+    if not stat.S_ISREG(file_stat.st_mode):
+        raise Http404
+
+    size = file_stat.st_size
+    mtime = int(file_stat.st_mtime)
+    etag = f'"{size:x}-{file_stat.st_mtime_ns:x}"'
+    headers = {
+        "ETag": etag,
+        "Last-Modified": http_date(mtime),
+        "Cache-Control": _cache_control(path),
+        "Accept-Ranges": "bytes",
+    }
+
+    response = get_conditional_response(request, etag=etag, last_modified=mtime)
+    if response is not None:
+        for name, value in headers.items():
+            response[name] = value
+        return response
+
+    content_type, encoding = mimetypes.guess_type(full_path)
+    content_type = content_type or "application/octet-stream"
+
+    accel_prefix = getattr(settings, "MEDIA_ACCEL_REDIRECT_PREFIX", "")
+    if accel_prefix:
+        # nginx сам обработает Range и отдаст файл из internal-локации
+        response = HttpResponse(content_type=content_type)
+        response["X-Accel-Redirect"] = f"{accel_prefix.rstrip('/')}/{quote(path)}"
+        for name, value in headers.items():
+            response[name] = value
+        return response
+
+    byte_range = None
+    if_range = request.headers.get("If-Range")
+    if if_range is None or if_range in (etag, headers["Last-Modified"]):
+        try:
+            byte_range = parse_range(request.headers.get("Range"), size)
+        except RangeNotSatisfiable:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            return response
+
+    if request.method == "HEAD":
+        response = HttpResponse(content_type=content_type)
+        response["Content-Length"] = str(size)
+    elif byte_range is None:
+        response = FileResponse(open(full_path, "rb"), content_type=content_type)
+    else:
+        start, end = byte_range
+        length = end - start + 1
+        response = StreamingHttpResponse(
+            _iter_file_range(full_path, start, length),
+            status=206,
+            content_type=content_type,
+        )
+        response["Content-Length"] = str(length)
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+    if encoding:
+        response["Content-Encoding"] = encoding
+    for name, value in headers.items():
+        response[name] = value
+    return response
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:49
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dogs", "0002_alter_favorite_unique_together_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="dog",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["-created_at"],
+                name="idx_dog_active_created",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="dog",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["gender", "size", "age"],
+                name="idx_dog_active_gender_size_age",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="dog",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["size", "age"],
+                name="idx_dog_active_size_age",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="dog",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["age"],
+                name="idx_dog_active_age",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="dog",
+            index=models.Index(
+                fields=["owner", "is_active"], name="idx_dog_owner_active"
+            ),
+        ),
+    ]
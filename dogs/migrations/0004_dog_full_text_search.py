@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:50
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+FTS_TABLE = "dogs_dog_fts"
+
+
+def create_full_text_index(apps, schema_editor):
+    """GIN-индекс на PostgreSQL, FTS5-таблица на SQLite; оба заполняются сразу."""
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute(
+            "UPDATE dogs_dog SET search_vector = "
+            "setweight(to_tsvector('russian', coalesce(breed, '')), 'A') || "
+            "setweight(to_tsvector('russian', coalesce(temperament, '')), 'B') || "
+            "setweight(to_tsvector('russian', coalesce(description, '')), 'C')"
+        )
+        schema_editor.execute(
+            "CREATE INDEX idx_dog_search_vector ON dogs_dog USING gin (search_vector)"
+        )
+    elif vendor == "sqlite":
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+            "breed, temperament, description, tokenize='unicode61 remove_diacritics 2')"
+        )
+        schema_editor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, breed, temperament, description) "
+            "SELECT id, breed, temperament, description FROM dogs_dog"
+        )
+
+
+def drop_full_text_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute("DROP INDEX IF EXISTS idx_dog_search_vector")
+    elif vendor == "sqlite":
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dogs", "0003_dog_search_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dog",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(create_full_text_index, drop_full_text_index),
+    ]
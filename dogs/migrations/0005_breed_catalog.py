@@ -0,0 +1,153 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:52
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def normalize_breed_name(name):
+    """Копия dogs.models.normalize_breed_name на момент миграции.
+
+    Миграция не импортирует код приложения: последующие изменения модели
+    не должны менять то, что она делает с уже существующими данными.
+    """
+    return " ".join((name or "").replace("ё", "е").replace("Ё", "Е").casefold().split())
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """Триграммные индексы для автодополнения пород (только PostgreSQL)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        "CREATE INDEX idx_breed_name_trgm ON dogs_breed "
+        "USING gin (normalized_name gin_trgm_ops)"
+    )
+    schema_editor.execute(
+        "CREATE INDEX idx_breed_alias_trgm ON dogs_breedalias "
+        "USING gin (normalized_alias gin_trgm_ops)"
+    )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS idx_breed_name_trgm")
+    schema_editor.execute("DROP INDEX IF EXISTS idx_breed_alias_trgm")
+
+
+def link_existing_dogs(apps, schema_editor):
+    """Заполняет справочник из уже существующих собак (как backfill_breeds)."""
+    Breed = apps.get_model("dogs", "Breed")
+    Dog = apps.get_model("dogs", "Dog")
+
+    breeds = {}
+    for breed_text in Dog.objects.order_by().values_list("breed", flat=True).distinct():
+        key = normalize_breed_name(breed_text)
+        if not key:
+            continue
+        if key not in breeds:
+            breeds[key], _ = Breed.objects.get_or_create(
+                normalized_name=key, defaults={"name": " ".join(breed_text.split())}
+            )
+        Dog.objects.filter(breed=breed_text).update(canonical_breed=breeds[key])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dogs", "0004_dog_full_text_search"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Breed",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=100, verbose_name="Название")),
+                (
+                    "normalized_name",
+                    models.CharField(
+                        editable=False,
+                        max_length=100,
+                        unique=True,
+                        verbose_name="Ключ поиска",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Порода",
+                "verbose_name_plural": "Породы",
+                "ordering": ["name"],
+            },
+        ),
+        migrations.CreateModel(
+            name="BreedAlias",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("alias", models.CharField(max_length=100, verbose_name="Синоним")),
+                (
+                    "normalized_alias",
+                    models.CharField(
+                        editable=False,
+                        max_length=100,
+                        unique=True,
+                        verbose_name="Ключ поиска",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Синоним породы",
+                "verbose_name_plural": "Синонимы пород",
+            },
+        ),
+        migrations.AddField(
+            model_name="dog",
+            name="canonical_breed",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="dogs",
+                to="dogs.breed",
+                verbose_name="Порода (справочник)",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="dog",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["canonical_breed", "age"],
+                name="idx_dog_active_breed_age",
+            ),
+        ),
+        migrations.AddField(
+            model_name="breedalias",
+            name="breed",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="aliases",
+                to="dogs.breed",
+                verbose_name="Порода",
+            ),
+        ),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+        migrations.RunPython(link_existing_dogs, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:58
+
+from django.db import migrations, models
+
+
+def mark_existing_photos(apps, schema_editor):
+    """Существующие фото считаем доступными; расхождения исправит reconcile_photos."""
+    Dog = apps.get_model("dogs", "Dog")
+    Dog.objects.exclude(photo="").exclude(photo__isnull=True).update(
+        photo_available=True
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dogs", "0005_breed_catalog"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dog",
+            name="photo_available",
+            field=models.BooleanField(
+                default=False, editable=False, verbose_name="Фото доступно"
+            ),
+        ),
+        migrations.RunPython(mark_existing_photos, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dogs", "0006_dog_photo_available"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dog",
+            name="photo_renditions",
+            field=models.JSONField(
+                blank=True, default=dict, editable=False, verbose_name="Копии фото"
+            ),
+        ),
+        migrations.AddField(
+            model_name="userprofile",
+            name="avatar_renditions",
+            field=models.JSONField(
+                blank=True, default=dict, editable=False, verbose_name="Копии аватара"
+            ),
+        ),
+    ]
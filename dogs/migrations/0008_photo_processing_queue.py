@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:03
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def enqueue_existing_photos(apps, schema_editor):
+    """Фото с готовыми копиями помечаем готовыми, остальные ставим в очередь."""
+    Dog = apps.get_model("dogs", "Dog")
+    photos = Dog.objects.filter(photo_available=True)
+    photos.exclude(photo_renditions={}).update(photo_status="ready")
+    photos.filter(photo_renditions={}).update(photo_status="pending")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dogs", "0007_image_renditions"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dog",
+            name="photo_attempts",
+            field=models.PositiveSmallIntegerField(
+                default=0, editable=False, verbose_name="Попыток обработки"
+            ),
+        ),
+        migrations.AddField(
+            model_name="dog",
+            name="photo_status",
+            field=models.CharField(
+                choices=[
+                    ("none", "Нет фото"),
+                    ("pending", "В очереди"),
+                    ("processing", "Обрабатывается"),
+                    ("ready", "Готово"),
+                    ("failed", "Ошибка"),
+                ],
+                default="none",
+                editable=False,
+                max_length=10,
+                verbose_name="Обработка фото",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="dog",
+            index=models.Index(
+                condition=models.Q(("photo_status", "pending")),
+                fields=["updated_at"],
+                name="idx_dog_photo_pending",
+            ),
+        ),
+        migrations.RunPython(enqueue_existing_photos, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:08
+
+from django.db import migrations, models
+
+import dogs.validators
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dogs", "0009_stored_files"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="userprofile",
+            name="avatar",
+            field=models.ImageField(
+                blank=True,
+                null=True,
+                upload_to="avatars/",
+                validators=[dogs.validators.validate_image_upload],
+                verbose_name="Аватар",
+            ),
+        ),
+    ]
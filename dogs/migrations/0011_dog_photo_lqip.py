@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dogs", "0010_image_upload_validator"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dog",
+            name="photo_lqip",
+            field=models.TextField(
+                blank=True, default="", editable=False, verbose_name="Превью фото"
+            ),
+        ),
+    ]
@@ -1,30 +1,61 @@
 from django.contrib.auth.models import User
-from django.core.exceptions import ValidationError
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
-from django.utils.translation import gettext_lazy as _
 
-ALLOWED_DOG_IMAGE_MIME_TYPES = {"image/jpeg", "image/png", "image/webp"}
-MAX_DOG_IMAGE_SIZE_MB = 5
+from .validators import validate_image_upload
 
+# Прежнее имя валидатора, на него ссылается миграция 0002
+validate_dog_image = validate_image_upload
 
-def validate_dog_image(image):
-    """Validate uploaded dog images for size and MIME type."""
-    if not image:
-        return
 
-    size = getattr(image, "size", None)
-    if size is not None and size > MAX_DOG_IMAGE_SIZE_MB * 1024 * 1024:
-        raise ValidationError(
-            _("Размер изображения не должен превышать %(size)s МБ."),
-            params={"size": MAX_DOG_IMAGE_SIZE_MB},
-        )
+def normalize_breed_name(name):
+    """Normalize breed text for lookups: case, spacing and "ё" are ignored."""
+    return " ".join((name or "").replace("ё", "е").replace("Ё", "Е").casefold().split())
 
-    content_type = getattr(image, "content_type", None)
-    if content_type and content_type not in ALLOWED_DOG_IMAGE_MIME_TYPES:
-        raise ValidationError(
-            _("Допустимые форматы изображения: JPEG, PNG, WebP."),
-        )
+
+class Breed(models.Model):
+    """Справочник пород"""
+
+    name = models.CharField(max_length=100, verbose_name="Название")
+    normalized_name = models.CharField(
+        max_length=100, unique=True, editable=False, verbose_name="Ключ поиска"
+    )
+
+    class Meta:
+        verbose_name = "Порода"
+        verbose_name_plural = "Породы"
+        ordering = ["name"]
+
+    def __str__(self):
+        return self.name
+
+    def save(self, *args, **kwargs):
+        self.normalized_name = normalize_breed_name(self.name)
+        super().save(*args, **kwargs)
+
+
+class BreedAlias(models.Model):
+    """Альтернативное написание породы (например, латиницей)"""
+
+    breed = models.ForeignKey(
+        Breed, on_delete=models.CASCADE, related_name="aliases", verbose_name="Порода"
+    )
+    alias = models.CharField(max_length=100, verbose_name="Синоним")
+    normalized_alias = models.CharField(
+        max_length=100, unique=True, editable=False, verbose_name="Ключ поиска"
+    )
+
+    class Meta:
+        verbose_name = "Синоним породы"
+        verbose_name_plural = "Синонимы пород"
+
+    def __str__(self):
+        return f"{self.alias} → {self.breed.name}"
+
+    def save(self, *args, **kwargs):
+        self.normalized_alias = normalize_breed_name(self.alias)
+        super().save(*args, **kwargs)
 
 
 class Dog(models.Model):
@@ -48,11 +79,33 @@ class Dog(models.Model):
         ("friendship", "Дружбы"),
     ]
 
+    PHOTO_STATUS_NONE = "none"
+    PHOTO_STATUS_PENDING = "pending"
+    PHOTO_STATUS_PROCESSING = "processing"
+    PHOTO_STATUS_READY = "ready"
+    PHOTO_STATUS_FAILED = "failed"
+    PHOTO_STATUS_CHOICES = [
+        (PHOTO_STATUS_NONE, "Нет фото"),
+        (PHOTO_STATUS_PENDING, "В очереди"),
+        (PHOTO_STATUS_PROCESSING, "Обрабатывается"),
+        (PHOTO_STATUS_READY, "Готово"),
+        (PHOTO_STATUS_FAILED, "Ошибка"),
+    ]
+
     owner = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name="dogs", verbose_name="Владелец"
     )
     name = models.CharField(max_length=100, verbose_name="Кличка")
     breed = models.CharField(max_length=100, verbose_name="Порода")
+    # Заполняется из breed при сохранении (см. dogs.signals)
+    canonical_breed = models.ForeignKey(
+        Breed,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="dogs",
+        verbose_name="Порода (справочник)",
+    )
     age = models.PositiveIntegerField(
         verbose_name="Возраст (в годах)",
         validators=[MinValueValidator(0), MaxValueValidator(20)],
@@ -79,13 +132,39 @@ class Dog(models.Model):
         blank=True,
         null=True,
         verbose_name="Фото",
-        validators=[validate_dog_image],
+        validators=[validate_image_upload],
+    )
+    # Файл фото существует в хранилище (см. Dog.has_photo)
+    photo_available = models.BooleanField(
+        default=False, editable=False, verbose_name="Фото доступно"
+    )
+    # Уменьшенные копии фото в WebP/JPEG (см. services.image_service)
+    photo_renditions = models.JSONField(
+        default=dict, blank=True, editable=False, verbose_name="Копии фото"
+    )
+    # Крошечное размытое превью (data: URI) для мгновенной отрисовки карточек
+    photo_lqip = models.TextField(
+        blank=True, default="", editable=False, verbose_name="Превью фото"
+    )
+    # Очередь обработки фото: копии создает команда process_images
+    photo_status = models.CharField(
+        max_length=10,
+        choices=PHOTO_STATUS_CHOICES,
+        default=PHOTO_STATUS_NONE,
+        editable=False,
+        verbose_name="Обработка фото",
+    )
+    photo_attempts = models.PositiveSmallIntegerField(
+        default=0, editable=False, verbose_name="Попыток обработки"
     )
     created_at = models.DateTimeField(
         auto_now_add=True, verbose_name="Дата регистрации"
     )
     updated_at = models.DateTimeField(auto_now=True, verbose_name="Дата обновления")
     is_active = models.BooleanField(default=True, verbose_name="Активный профиль")
+    # Поддерживается сигналами; на PostgreSQL индексируется GIN (см. миграцию 0004),
+    # на остальных СУБД полнотекстовый поиск идет через FTS5-таблицу dogs_dog_fts
+    search_vector = SearchVectorField(null=True, editable=False)
 
     class Meta:
         verbose_name = "Собака"
@@ -97,29 +176,61 @@ class Dog(models.Model):
                 name="unique_dog_name_per_owner",
             ),
         ]
+        # Частичные индексы покрывают только активные профили: именно их
+        # фильтрует dog_list (равенство по полу/размеру, затем диапазон возраста)
+        indexes = [
+            models.Index(
+                fields=["-created_at"],
+                name="idx_dog_active_created",
+                condition=models.Q(is_active=True),
+            ),
+            models.Index(
+                fields=["gender", "size", "age"],
+                name="idx_dog_active_gender_size_age",
+                condition=models.Q(is_active=True),
+            ),
+            models.Index(
+                fields=["size", "age"],
+                name="idx_dog_active_size_age",
+                condition=models.Q(is_active=True),
+            ),
+            models.Index(
+                fields=["age"],
+                name="idx_dog_active_age",
+                condition=models.Q(is_active=True),
+            ),
+            models.Index(
+                fields=["canonical_breed", "age"],
+                name="idx_dog_active_breed_age",
+                condition=models.Q(is_active=True),
+            ),
+            models.Index(fields=["owner", "is_active"], name="idx_dog_owner_active"),
+            # Очередь process_images: только фото, ожидающие обработки
+            models.Index(
+                fields=["updated_at"],
+                name="idx_dog_photo_pending",
+                condition=models.Q(photo_status="pending"),
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.owner.username})"
 
     @property
     def has_photo(self) -> bool:
-        """Return True only if a photo is set and the underlying file exists.
+        """Return True only if a photo is set, exists and has been processed.
 
-        This helps avoid broken image links when media files were cleaned up or
-        not copied, while still showing real photos when they are present on disk.
+        Reads the stored ``photo_available`` flag instead of touching storage,
+        so rendering a card costs no filesystem or network call. The flag is
+        set on upload and kept honest by the ``reconcile_photos`` command.
+        Until ``process_images`` has built the renditions the placeholder is
+        shown instead of the full-size original.
         """
-        if not self.photo:
-            return False
-
-        storage = getattr(self.photo, "storage", None)
-        name = getattr(self.photo, "name", None)
-        if not storage or not name:
-            return False
-
-        try:
-            return storage.exists(name)
-        except Exception:
-            return False
+        return (
+            bool(self.photo)
+            and self.photo_available
+            and self.photo_status == self.PHOTO_STATUS_READY
+        )
 
 
 class UserProfile(models.Model):
@@ -135,7 +246,15 @@ class UserProfile(models.Model):
     location = models.CharField(max_length=100, blank=True, verbose_name="Город")
     phone = models.CharField(max_length=20, blank=True, verbose_name="Телефон")
     avatar = models.ImageField(
-        upload_to="avatars/", blank=True, null=True, verbose_name="Аватар"
+        upload_to="avatars/",
+        blank=True,
+        null=True,
+        verbose_name="Аватар",
+        validators=[validate_image_upload],
+    )
+    # Уменьшенные копии аватара в WebP/JPEG (см. services.image_service)
+    avatar_renditions = models.JSONField(
+        default=dict, blank=True, editable=False, verbose_name="Копии аватара"
     )
     created_at = models.DateTimeField(
         auto_now_add=True, verbose_name="Дата регистрации"
@@ -266,3 +385,19 @@ class Favorite(models.Model):
 
     def __str__(self):
         return f"{self.user.username} добавил в избранное {self.dog.name}"
+
+
+class StoredFile(models.Model):
+    """Файл в контентно-адресуемом хранилище и число ссылок на него"""
+
+    name = models.CharField(max_length=255, unique=True, verbose_name="Имя файла")
+    size = models.PositiveBigIntegerField(verbose_name="Размер, байт")
+    refcount = models.PositiveIntegerField(default=0, verbose_name="Число ссылок")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Дата загрузки")
+
+    class Meta:
+        verbose_name = "Файл хранилища"
+        verbose_name_plural = "Файлы хранилища"
+
+    def __str__(self):
+        return f"{self.name} ({self.refcount})"
@@ -0,0 +1,169 @@
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from services.breed_service import bump_breed_version, resolve_breed
+from services.cache_service import DOG_VERSION, bump_version
+from services.favorites_service import bump_favorites_version
+from services.image_service import process_avatar
+from services.search_service import remove_from_search_index, update_search_index
+
+from .models import Breed, BreedAlias, Dog, Favorite, UserProfile
+from .storage import is_content_addressed
+
+# Поля, от которых зависит полнотекстовый индекс
+SEARCH_FIELDS = {"breed", "temperament", "description"}
+
+
+@receiver(pre_save, sender=Dog)
+def link_dog_breed(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Связывает собаку со справочником пород по введенному тексту"""
+    if raw or (update_fields is not None and "breed" not in update_fields):
+        return
+    instance.canonical_breed = resolve_breed(instance.breed, create=True)
+
+
+@receiver(pre_save, sender=Dog)
+def track_photo_availability(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Отмечает наличие файла фото и ставит новую загрузку в очередь обработки"""
+    if raw or (update_fields is not None and "photo" not in update_fields):
+        return
+    if not instance.photo:
+        instance.photo_available = False
+        instance.photo_renditions = {}
+        instance.photo_lqip = ""
+        instance.photo_status = Dog.PHOTO_STATUS_NONE
+    elif not instance.photo._committed:
+        # Файл будет записан в хранилище в pre_save поля photo, а копии
+        # создаст process_images — запрос не ждет работы Pillow
+        instance.photo_available = True
+        instance.photo_renditions = {}
+        instance.photo_lqip = ""
+        instance.photo_status = Dog.PHOTO_STATUS_PENDING
+        instance.photo_attempts = 0
+
+
+@receiver(post_save, sender=Dog)
+def sync_dog_search_index(sender, instance, created, update_fields=None, **kwargs):
+    """Обновляет полнотекстовый индекс после сохранения собаки"""
+    if update_fields is not None and not SEARCH_FIELDS.intersection(update_fields):
+        return
+    update_search_index(instance)
+
+
+@receiver(post_delete, sender=Dog)
+def drop_dog_search_index(sender, instance, **kwargs):
+    """Удаляет собаку из полнотекстового индекса"""
+    remove_from_search_index(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=Dog)
+def invalidate_dog_caches(sender, **kwargs):
+    """Сбрасывает кэши поиска (фасеты и т.п.) при любом изменении собак"""
+    bump_version(DOG_VERSION)
+
+
+@receiver(pre_save, sender=User)
+def touch_dogs_on_rename(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Обновляет updated_at собак при смене имени владельца.
+
+    Имя выводится на странице собаки, а ее Last-Modified берется из
+    updated_at собаки и профиля (профиля у владельца может не быть).
+    """
+    if raw or instance.pk is None:
+        return
+    if update_fields is not None and "username" not in update_fields:
+        return
+    old_username = (
+        User.objects.filter(pk=instance.pk).values_list("username", flat=True).first()
+    )
+    if old_username is not None and old_username != instance.username:
+        Dog.objects.filter(owner_id=instance.pk).update(updated_at=timezone.now())
+
+
+@receiver([post_save, post_delete], sender=Favorite)
+def invalidate_user_favorites(sender, instance, **kwargs):
+    """Меняет ETag страниц, где видно избранное пользователя"""
+    bump_favorites_version(instance.user_id)
+
+
+@receiver(pre_save, sender=UserProfile)
+def reset_avatar_renditions(sender, instance, raw=False, **kwargs):
+    """Сбрасывает копии аватара при загрузке нового или его удалении"""
+    if raw:
+        return
+    if not instance.avatar or not instance.avatar._committed:
+        instance.avatar_renditions = {}
+
+
+@receiver(post_save, sender=UserProfile)
+def render_avatar(sender, instance, raw=False, **kwargs):
+    """Создает уменьшенные копии аватара, если их еще нет"""
+    if not raw and instance.avatar and not instance.avatar_renditions:
+        process_avatar(instance)
+
+
+def _release_file_on_commit(field_file, name):
+    """Снимает ссылку на файл хранилища после коммита транзакции"""
+    if name and is_content_addressed(name):
+        storage = field_file.field.storage
+        transaction.on_commit(lambda: storage.delete(name))
+
+
+def _image_field_name(sender):
+    return "photo" if sender is Dog else "avatar"
+
+
+@receiver(pre_save, sender=Dog)
+@receiver(pre_save, sender=UserProfile)
+def remember_replaced_image(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Запоминает прежний файл фото/аватара при загрузке нового или очистке"""
+    instance._replaced_image_name = None
+    field_name = _image_field_name(sender)
+    if raw or instance.pk is None:
+        return
+    if update_fields is not None and field_name not in update_fields:
+        return
+    field_file = getattr(instance, field_name)
+    if field_file and field_file._committed:
+        return
+    old_name = (
+        sender.objects.filter(pk=instance.pk).values_list(field_name, flat=True).first()
+    )
+    if old_name != field_file.name:
+        instance._replaced_image_name = old_name
+
+
+@receiver(post_save, sender=Dog)
+@receiver(post_save, sender=UserProfile)
+def release_replaced_image(sender, instance, raw=False, **kwargs):
+    """Освобождает прежний файл только после успешного сохранения.
+
+    Без ATOMIC_REQUESTS on_commit в pre_save сработал бы сразу, и при
+    ошибке save (например, IntegrityError) строка ссылалась бы на
+    освобожденный файл.
+    """
+    old_name = getattr(instance, "_replaced_image_name", None)
+    instance._replaced_image_name = None
+    if not raw and old_name:
+        field_file = getattr(instance, _image_field_name(sender))
+        _release_file_on_commit(field_file, old_name)
+
+
+@receiver(post_delete, sender=Dog)
+def release_dog_photo(sender, instance, **kwargs):
+    _release_file_on_commit(instance.photo, instance.photo.name)
+
+
+@receiver(post_delete, sender=UserProfile)
+def release_avatar(sender, instance, **kwargs):
+    _release_file_on_commit(instance.avatar, instance.avatar.name)
+
+
+@receiver([post_save, post_delete], sender=Breed)
+@receiver([post_save, post_delete], sender=BreedAlias)
+def invalidate_breed_index(sender, **kwargs):
+    """Сбрасывает индекс автодополнения пород во всех процессах"""
+    bump_breed_version()
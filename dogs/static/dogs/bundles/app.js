@@ -0,0 +1,690 @@
+const THEME_KEY = 'dog-dating-theme';
+const themeToggle = document.getElementById('theme-toggle');
+const htmlElement = document.documentElement;
+function initTheme() {
+const savedTheme = localStorage.getItem(THEME_KEY) || 'dark';
+setTheme(savedTheme);
+}
+function setTheme(theme) {
+htmlElement.setAttribute('data-theme', theme);
+document.body.setAttribute('data-theme', theme);
+const icon = themeToggle.querySelector('i');
+const label = themeToggle.querySelector('.theme-label');
+if (theme === 'light') {
+icon.className = 'bi bi-sun-fill';
+label.textContent = 'Светлая';
+} else {
+icon.className = 'bi bi-moon-fill';
+label.textContent = 'Темная';
+}
+localStorage.setItem(THEME_KEY, theme);
+}
+function toggleTheme() {
+const currentTheme = htmlElement.getAttribute('data-theme');
+const newTheme = currentTheme === 'dark' ? 'light' : 'dark';
+setTheme(newTheme);
+}
+themeToggle.addEventListener('click', toggleTheme);
+document.addEventListener('DOMContentLoaded', initTheme);
+function getCookie(name) {
+let cookieValue = null;
+if (document.cookie && document.cookie !== '') {
+const cookies = document.cookie.split(';');
+for (let i = 0; i < cookies.length; i++) {
+const cookie = cookies[i].trim();
+if (cookie.substring(0, name.length + 1) === (name + '=')) {
+cookieValue = decodeURIComponent(cookie.substring(name.length + 1));
+break;
+}
+}
+}
+return cookieValue;
+}
+function showToast(message, type = 'success') {
+const container = document.getElementById('toast-container') || document.body;
+const toast = document.createElement('div');
+toast.className = `toast toast-${type}`;
+const icon = type === 'success' ? '✅' :
+type === 'error' ? '❌' :
+type === 'info' ? 'ℹ️' : '✅';
+toast.innerHTML = `
+        <span>${icon}</span>
+        <span>${message}</span>
+        <button onclick="this.parentElement.remove()" style="border: none; background: none; cursor: pointer; font-size: 1.2rem;">&times;</button>
+    `;
+container.appendChild(toast);
+setTimeout(() => {
+if (toast.parentElement) {
+toast.remove();
+}
+}, 5000);
+}
+document.querySelectorAll('.btn').forEach(btn => {
+btn.addEventListener('click', function() {
+this.classList.add('loading');
+});
+});
+function toggleMobileMenu() {
+const sidebar = document.querySelector('.sidebar');
+if (sidebar) {
+sidebar.classList.toggle('active');
+}
+}
+function toggleFavorite(dogId, button = null) {
+if (!button) button = event.target.closest('.favorite-btn');
+if (!button) return;
+button.disabled = true;
+fetch(`/dogs/${dogId}/favorite/`, {
+method: 'POST',
+headers: {
+'X-CSRFToken': getCookie('csrftoken'),
+'Content-Type': 'application/json',
+},
+})
+.then(response => response.json())
+.then(data => {
+if (data.is_favorite) {
+button.innerHTML = '<i class="bi bi-heart-fill"></i>';
+button.dataset.isFavorite = 'true';
+showToast(data.message || 'Добавлено в избранное', 'success');
+} else {
+button.innerHTML = '<i class="bi bi-heart"></i>';
+button.dataset.isFavorite = 'false';
+showToast(data.message || 'Удалено из избранного', 'info');
+}
+})
+.catch(error => {
+console.error('Error:', error);
+showToast('Произошла ошибка', 'error');
+})
+.finally(() => {
+button.disabled = false;
+});
+}
+function removeFavorite(button, dogId) {
+const cardContainer = button.closest('div[style*="border: 1px solid"]') || button.closest('div').closest('div');
+fetch(`/dogs/${dogId}/favorite/`, {
+method: 'POST',
+headers: {
+'X-CSRFToken': getCookie('csrftoken'),
+'Content-Type': 'application/json',
+},
+})
+.then(response => response.json())
+.then(data => {
+if (!data.is_favorite) {
+if (cardContainer) {
+cardContainer.style.opacity = '0';
+cardContainer.style.transform = 'scale(0.95)';
+cardContainer.style.transition = 'all 0.3s ease';
+setTimeout(() => {
+cardContainer.remove();
+const gridContainer = document.querySelector('[style*="grid-template-columns"]');
+if (gridContainer && gridContainer.children.length === 0) {
+location.reload();
+}
+}, 300);
+}
+showToast(data.message, 'success');
+}
+})
+.catch(error => {
+console.error('Error:', error);
+showToast('Произошла ошибка', 'error');
+});
+}
+document.addEventListener('DOMContentLoaded', function() {
+initTheme();
+document.querySelectorAll('.favorite-btn').forEach(btn => {
+if (!btn.dataset.listenerAdded) {
+btn.addEventListener('click', function(e) {
+e.preventDefault();
+const dogId = this.dataset.dogId;
+toggleFavorite(dogId, this);
+});
+btn.dataset.listenerAdded = true;
+}
+});
+});
+document.addEventListener('DOMContentLoaded', function() {
+document.addEventListener('click', function(e) {
+if (e.target.closest('.menu-link.header-nav-top-link')) {
+e.preventDefault();
+e.stopPropagation();
+const menuLink = e.target.closest('.menu-link');
+const menuItem = menuLink.closest('.menu-item');
+const submenu = menuItem.querySelector('.submenu');
+if (submenu) {
+const isExpanded = !submenu.classList.contains('collapsed');
+if (isExpanded) {
+submenu.classList.add('collapsed');
+} else {
+submenu.classList.remove('collapsed');
+}
+}
+}
+if (e.target.closest('.menu-link')) {
+e.stopPropagation();
+}
+});
+});
+document.addEventListener('DOMContentLoaded', function() {
+const scrollableAreas = document.querySelectorAll('.submenu, .scrollable-content');
+scrollableAreas.forEach(area => {
+area.addEventListener('wheel', function(e) {
+const canScrollUp = this.scrollTop > 0;
+const canScrollDown = this.scrollTop < this.scrollHeight - this.clientHeight;
+const atTop = !canScrollUp && e.deltaY < 0;
+const atBottom = !canScrollDown && e.deltaY > 0;
+if (atTop || atBottom) {
+e.preventDefault();
+e.stopPropagation();
+}
+}, { passive: false });
+area.addEventListener('touchstart', function(e) {
+this._touchStartY = e.touches[0].clientY;
+}, { passive: true });
+area.addEventListener('touchmove', function(e) {
+const touchY = e.touches[0].clientY;
+const touchDelta = this._touchStartY - touchY;
+const canScrollUp = this.scrollTop > 0;
+const canScrollDown = this.scrollTop < this.scrollHeight - this.clientHeight;
+const atTop = !canScrollUp && touchDelta < 0;
+const atBottom = !canScrollDown && touchDelta > 0;
+if (atTop || atBottom) {
+e.preventDefault();
+e.stopPropagation();
+}
+}, { passive: false });
+});
+});
+/* ============================================================
+GUEST MENU JAVASCRIPT - Dropdown Menu for Guests
+Feature: Provides navigation for non-authenticated users
+Safety: Uses unique class names and IDs to avoid conflicts
+Flag: GUEST_MENU_ENABLED = true (set to false to disable)
+============================================================ */
+const GUEST_MENU_ENABLED = true;
+function initGuestMenu() {
+if (!GUEST_MENU_ENABLED) {
+console.info('[Guest Menu] Feature is disabled via flag');
+return;
+}
+const guestMenuToggle = document.getElementById('guest-menu-toggle');
+const guestMenuDropdown = document.getElementById('guest-menu-dropdown');
+if (!guestMenuToggle || !guestMenuDropdown) {
+console.debug('[Guest Menu] Guest menu elements not found (likely authenticated user)');
+return;
+}
+console.info('[Guest Menu] Initializing guest dropdown menu');
+function toggleGuestMenu(e) {
+e.preventDefault();
+e.stopPropagation();
+const isOpen = guestMenuDropdown.classList.contains('guest-menu-show');
+if (isOpen) {
+guestMenuDropdown.classList.remove('guest-menu-show');
+guestMenuToggle.setAttribute('aria-expanded', 'false');
+guestMenuDropdown.setAttribute('aria-hidden', 'true');
+} else {
+guestMenuDropdown.classList.add('guest-menu-show');
+guestMenuToggle.setAttribute('aria-expanded', 'true');
+guestMenuDropdown.setAttribute('aria-hidden', 'false');
+}
+}
+function closeGuestMenu(e) {
+if (guestMenuToggle.contains(e.target) || guestMenuToggle.closest('.guest-menu-container').contains(e.target)) {
+return;
+}
+if (guestMenuDropdown.classList.contains('guest-menu-show')) {
+guestMenuDropdown.classList.remove('guest-menu-show');
+guestMenuToggle.setAttribute('aria-expanded', 'false');
+guestMenuDropdown.setAttribute('aria-hidden', 'true');
+}
+}
+function handleMenuItemClick(e) {
+}
+function handleKeyboardNavigation(e) {
+const isOpen = guestMenuDropdown.classList.contains('guest-menu-show');
+if (e.key === 'Escape' && isOpen) {
+e.preventDefault();
+guestMenuDropdown.classList.remove('guest-menu-show');
+guestMenuToggle.setAttribute('aria-expanded', 'false');
+guestMenuDropdown.setAttribute('aria-hidden', 'true');
+guestMenuToggle.focus();
+return;
+}
+if ((e.key === 'Enter' || e.key === ' ') && document.activeElement === guestMenuToggle && !isOpen) {
+e.preventDefault();
+toggleGuestMenu(e);
+}
+}
+guestMenuToggle.addEventListener('click', toggleGuestMenu);
+document.addEventListener('click', closeGuestMenu);
+guestMenuDropdown.querySelectorAll('.guest-menu-item').forEach(item => {
+item.addEventListener('click', handleMenuItemClick);
+});
+document.addEventListener('keydown', handleKeyboardNavigation);
+console.debug('[Guest Menu] Event listeners attached successfully');
+}
+if (document.readyState === 'loading') {
+document.addEventListener('DOMContentLoaded', initGuestMenu);
+} else {
+initGuestMenu();
+}
+function disableGuestMenu() {
+console.info('[Guest Menu] Disabling guest menu');
+const guestMenuToggle = document.getElementById('guest-menu-toggle');
+const guestMenuDropdown = document.getElementById('guest-menu-dropdown');
+if (guestMenuToggle) {
+guestMenuToggle.style.display = 'none';
+}
+if (guestMenuDropdown) {
+guestMenuDropdown.style.display = 'none';
+}
+}
+;
+/**
+* Mobile Optimization JavaScript
+* Handles mobile-specific optimizations and interactions
+*/
+(function () {
+'use strict';
+const config = {
+debug: false,
+enableLogging: false
+};
+const log = config.enableLogging ? console.log : () => { };
+const warn = config.enableLogging ? console.warn : () => { };
+/**
+* Detect if device is mobile
+*/
+function isMobileDevice() {
+return /Android|webOS|iPhone|iPad|iPod|BlackBerry|IEMobile|Opera Mini/i.test(navigator.userAgent);
+}
+/**
+* Detect if device has touch capability
+*/
+function isTouchDevice() {
+return (
+('ontouchstart' in window) ||
+(navigator.maxTouchPoints > 0) ||
+(navigator.msMaxTouchPoints > 0)
+);
+}
+/**
+* Fix viewport height for mobile browsers
+* Handles address bar hide/show on scroll
+*/
+function fixViewportHeight() {
+if (!window.visualViewport) return;
+function updateVH() {
+const vh = window.innerHeight * 0.01;
+document.documentElement.style.setProperty('--vh', vh + 'px');
+}
+window.visualViewport.addEventListener('resize', updateVH);
+updateVH();
+}
+/**
+* Prevent zoom on double-tap
+*/
+function preventDoubleTapZoom() {
+let lastTouchEnd = 0;
+document.addEventListener('touchend', function (event) {
+const now = Date.now();
+if (now - lastTouchEnd <= 300) {
+event.preventDefault();
+}
+lastTouchEnd = now;
+}, false);
+}
+/**
+* Optimize form inputs for mobile
+*/
+function optimizeFormInputs() {
+const inputs = document.querySelectorAll('input, textarea, select');
+inputs.forEach(input => {
+input.setAttribute('autocorrect', 'off');
+input.setAttribute('autocapitalize', 'off');
+const type = input.type;
+if (type === 'text') {
+const name = input.name || '';
+if (name.includes('email')) {
+input.type = 'email';
+} else if (name.includes('phone') || name.includes('tel')) {
+input.type = 'tel';
+} else if (name.includes('url') || name.includes('website')) {
+input.type = 'url';
+} else if (name.includes('number') || name.includes('count')) {
+input.type = 'number';
+}
+}
+});
+}
+/**
+* Handle safe area insets for notched devices
+*/
+function handleSafeAreaInsets() {
+const hasNotch = CSS.supports('padding: max(0px)');
+if (!hasNotch) return;
+const styles = `
+            body {
+                padding-left: max(1rem, env(safe-area-inset-left));
+                padding-right: max(1rem, env(safe-area-inset-right));
+                padding-top: max(0px, env(safe-area-inset-top));
+                padding-bottom: max(1rem, env(safe-area-inset-bottom));
+            }
+            .main-header {
+                padding-left: max(0.5rem, env(safe-area-inset-left));
+                padding-right: max(0.5rem, env(safe-area-inset-right));
+            }
+            .main-footer {
+                padding-bottom: max(1rem, env(safe-area-inset-bottom));
+            }
+        `;
+const styleElement = document.createElement('style');
+styleElement.textContent = styles;
+document.head.appendChild(styleElement);
+}
+/**
+* Smooth scroll polyfill for older browsers
+*/
+function enableSmoothScroll() {
+if (!CSS.supports('scroll-behavior: smooth')) {
+const style = document.createElement('style');
+style.textContent = `
+                html {
+                    scroll-behavior: auto !important;
+                }
+            `;
+document.head.appendChild(style);
+}
+}
+/**
+* Optimize images for mobile
+*/
+function optimizeImages() {
+const images = document.querySelectorAll('img');
+images.forEach(img => {
+if (!img.hasAttribute('loading')) {
+img.setAttribute('loading', 'lazy');
+}
+img.style.webkitTouchCallout = 'none';
+img.style.webkitUserSelect = 'none';
+img.style.userSelect = 'none';
+});
+}
+/**
+* Handle mobile menu toggle
+*/
+function setupMobileMenuToggle() {
+const mobileMenuToggle = document.getElementById('mobile-menu-toggle');
+const sidebar = document.querySelector('.sidebar');
+if (!mobileMenuToggle || !sidebar) return;
+mobileMenuToggle.addEventListener('click', function (e) {
+e.preventDefault();
+sidebar.classList.toggle('active');
+const isActive = sidebar.classList.contains('active');
+mobileMenuToggle.setAttribute('aria-expanded', isActive);
+});
+const leafMenuLinks = sidebar.querySelectorAll('.menu-link.header-nav-link');
+leafMenuLinks.forEach(link => {
+link.addEventListener('click', function () {
+sidebar.classList.remove('active');
+mobileMenuToggle.setAttribute('aria-expanded', 'false');
+});
+});
+document.addEventListener('click', function (e) {
+if (!sidebar.contains(e.target) && !mobileMenuToggle.contains(e.target)) {
+sidebar.classList.remove('active');
+mobileMenuToggle.setAttribute('aria-expanded', 'false');
+}
+});
+sidebar.addEventListener('touchmove', function (e) {
+if (this.classList.contains('active')) {
+if (e.target === this || !this.contains(e.target)) {
+e.preventDefault();
+}
+}
+}, { passive: false });
+}
+/**
+* Optimize tooltips for mobile
+*/
+function optimizeTooltips() {
+const tooltips = document.querySelectorAll('[title]');
+tooltips.forEach(element => {
+if (isTouchDevice()) {
+const title = element.getAttribute('title');
+element.setAttribute('aria-label', title);
+element.removeAttribute('title');
+}
+});
+}
+/**
+* Handle viewport orientation changes
+*/
+function handleOrientationChange() {
+window.addEventListener('orientationchange', function () {
+setTimeout(function () {
+window.dispatchEvent(new Event('resize'));
+log('Orientation changed to: ' + window.innerWidth + 'x' + window.innerHeight);
+}, 100);
+});
+}
+/**
+* Performance optimization: Debounce resize events
+*/
+function debounce(func, wait) {
+let timeout;
+return function executedFunction(...args) {
+const later = () => {
+clearTimeout(timeout);
+func(...args);
+};
+clearTimeout(timeout);
+timeout = setTimeout(later, wait);
+};
+}
+/**
+* Lazy load below-the-fold images (fallback for older browsers)
+*/
+function setupIntersectionObserver() {
+if (!('IntersectionObserver' in window)) {
+const images = document.querySelectorAll('img[loading="lazy"]');
+images.forEach(img => {
+img.loading = '';
+});
+return;
+}
+const imageObserver = new IntersectionObserver((entries, observer) => {
+entries.forEach(entry => {
+if (entry.isIntersecting) {
+const img = entry.target;
+if (img.dataset.src) {
+img.src = img.dataset.src;
+img.removeAttribute('data-src');
+}
+observer.unobserve(img);
+}
+});
+}, {
+rootMargin: '50px'
+});
+const lazyImages = document.querySelectorAll('img[data-src]');
+lazyImages.forEach(img => imageObserver.observe(img));
+}
+/**
+* Fix input zoom on focus (iOS Safari)
+*/
+function fixInputZoom() {
+if (!isMobileDevice()) return;
+const inputs = document.querySelectorAll('input, select, textarea');
+inputs.forEach(input => {
+input.addEventListener('focus', function () {
+const originalSize = this.style.fontSize;
+this.style.fontSize = '16px';
+setTimeout(() => {
+this.style.fontSize = originalSize;
+}, 0);
+});
+});
+}
+/**
+* Prevent body scroll when modal is open
+*/
+function setupModalScrollPrevention() {
+const modals = document.querySelectorAll('.modal');
+modals.forEach(modal => {
+const observer = new MutationObserver(function (mutations) {
+mutations.forEach(function (mutation) {
+if (mutation.attributeName === 'class') {
+const isOpen = modal.classList.contains('show');
+if (isOpen) {
+document.body.style.overflow = 'hidden';
+} else {
+document.body.style.overflow = '';
+}
+}
+});
+});
+observer.observe(modal, { attributes: true, attributeFilter: ['class'] });
+});
+}
+/**
+* Initialize all mobile optimizations
+*/
+function init() {
+log('Initializing mobile optimizations...');
+fixViewportHeight();
+preventDoubleTapZoom();
+enableSmoothScroll();
+handleSafeAreaInsets();
+optimizeFormInputs();
+optimizeImages();
+optimizeTooltips();
+setupMobileMenuToggle();
+handleOrientationChange();
+fixInputZoom();
+if ('IntersectionObserver' in window) {
+setupIntersectionObserver();
+}
+if (document.querySelectorAll('.modal').length > 0) {
+setupModalScrollPrevention();
+}
+log('Mobile optimizations initialized successfully');
+}
+/**
+* Run initialization when DOM is ready
+*/
+if (document.readyState === 'loading') {
+document.addEventListener('DOMContentLoaded', init);
+} else {
+init();
+}
+if (config.debug) {
+window.mobileOptimizations = {
+isMobileDevice,
+isTouchDevice,
+config
+};
+}
+})();
+;
+/**
+* Mobile Optimization Script
+* Automatically fixes responsive issues for mobile devices
+*/
+(function () {
+'use strict';
+function isMobileViewport() {
+return window.innerWidth <= 1024;
+}
+function fixResponsiveIssues() {
+const isMobile = isMobileViewport();
+if (!isMobile) return;
+const gridContainers = document.querySelectorAll('[style*="grid-template-columns"]');
+gridContainers.forEach(container => {
+const style = container.getAttribute('style');
+if (style.includes('300px') || style.includes('400px') || style.includes('250px')) {
+if (container.parentElement) {
+container.parentElement.style.width = '100%';
+container.parentElement.style.overflowX = 'hidden';
+}
+}
+});
+const cards = document.querySelectorAll('.card');
+cards.forEach(card => {
+card.style.width = '100%';
+});
+const rows = document.querySelectorAll('.row, [style*="display: grid"]');
+rows.forEach(row => {
+const style = row.getAttribute('style');
+if (style && (style.includes('300px') || style.includes('400px'))) {
+row.style.width = '100%';
+row.style.display = 'block'; // Let CSS media queries handle
+}
+});
+const allElements = document.querySelectorAll('[style*="width: 300px"], [style*="width: 400px"], [style*="max-width: 1000px"], [style*="max-width: 1200px"]');
+allElements.forEach(el => {
+const rect = el.getBoundingClientRect();
+if (rect.width > window.innerWidth - 40) { // 40px for padding
+el.style.width = '100%';
+el.style.maxWidth = '100%';
+}
+});
+}
+if (document.readyState === 'loading') {
+document.addEventListener('DOMContentLoaded', fixResponsiveIssues);
+} else {
+fixResponsiveIssues();
+}
+let resizeTimer;
+window.addEventListener('resize', () => {
+clearTimeout(resizeTimer);
+resizeTimer = setTimeout(fixResponsiveIssues, 250);
+});
+window.addEventListener('orientationchange', () => {
+setTimeout(fixResponsiveIssues, 100);
+});
+if ('MutationObserver' in window) {
+const observer = new MutationObserver((mutations) => {
+let hasLayoutChanges = false;
+mutations.forEach(mutation => {
+if (mutation.type === 'childList' || mutation.type === 'attributes') {
+if (mutation.attributeName === 'style' || mutation.target.style) {
+hasLayoutChanges = true;
+}
+}
+});
+if (hasLayoutChanges && isMobileViewport()) {
+fixResponsiveIssues();
+}
+});
+observer.observe(document.body, {
+childList: true,
+subtree: true,
+attributes: true,
+attributeFilter: ['style'],
+});
+}
+function preventHorizontalScroll() {
+const body = document.body;
+if (body.scrollWidth > window.innerWidth) {
+const elements = document.querySelectorAll('*');
+elements.forEach(el => {
+const rect = el.getBoundingClientRect();
+if (rect.width > window.innerWidth) {
+if (el.style.width && el.style.width.includes('px')) {
+el.style.maxWidth = '100vw';
+}
+if (el.style.minWidth && el.style.minWidth.includes('px')) {
+el.style.minWidth = 'auto';
+}
+}
+});
+}
+}
+window.addEventListener('load', preventHorizontalScroll);
+window.addEventListener('resize', preventHorizontalScroll);
+})();
+;
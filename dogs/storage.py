@@ -0,0 +1,128 @@
+import hashlib
+import os
+import posixpath
+import re
+import tempfile
+
+from django.core.files.storage import FileSystemStorage
+from django.db import transaction
+from django.db.models import F
+
+# Каталоги upload_to, файлы в которых хранятся по хэшу содержимого
+DEFAULT_ADDRESSED_DIRS = ("dogs", "avatars")
+DIGEST_SIZE = 20
+CONTENT_ADDRESSED_NAME_RE = re.compile(
+    rf"(?:^|/)[0-9a-f]{{2}}/[0-9a-f]{{2}}/[0-9a-f]{{{DIGEST_SIZE * 2}}}\.\w+$"
+)
+
+
+def is_content_addressed(name):
+    """Имя вида dogs/ab/cd/<blake2b>.jpg — содержимое по нему никогда не меняется"""
+    return bool(CONTENT_ADDRESSED_NAME_RE.search(name or ""))
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    Файловое хранилище с дедупликацией по содержимому.
+
+    Загрузки в ``addressed_dirs`` хэшируются BLAKE2b во время записи на диск
+    и сохраняются как ``<dir>/ab/cd/<hash><ext>``. Если такой файл уже есть,
+    новая копия не пишется, а счетчик ссылок в ``StoredFile`` растет;
+    ``delete()`` уменьшает счетчик и удаляет файл только при нуле ссылок.
+    Остальные имена (например, renditions/) сохраняются как обычно.
+    """
+
+    def __init__(self, addressed_dirs=DEFAULT_ADDRESSED_DIRS, **kwargs):
+        super().__init__(**kwargs)
+        self.addressed_dirs = tuple(addressed_dirs)
+
+    def is_addressed(self, name):
+        return name.replace("\\", "/").split("/", 1)[0] in self.addressed_dirs
+
+    def get_available_name(self, name, max_length=None):
+        if self.is_addressed(name):
+            # Итоговое имя зависит от содержимого и выбирается в _save()
+            return name
+        return super().get_available_name(name, max_length)
+
+    def _save(self, name, content):
+        if not self.is_addressed(name):
+            return super()._save(name, content)
+
+        directory, basename = posixpath.split(name.replace("\\", "/"))
+        extension = os.path.splitext(basename)[1].lower()
+        upload_dir = self.path(directory)
+        os.makedirs(upload_dir, exist_ok=True)
+
+        hasher = hashlib.blake2b(digest_size=DIGEST_SIZE)
+        size = 0
+        fd, temp_path = tempfile.mkstemp(dir=upload_dir, prefix=".upload-")
+        try:
+            with os.fdopen(fd, "wb") as temp_file:
+                for chunk in content.chunks():
+                    if isinstance(chunk, str):
+                        chunk = chunk.encode()
+                    hasher.update(chunk)
+                    temp_file.write(chunk)
+                    size += len(chunk)
+
+            digest = hasher.hexdigest()
+            final_name = f"{directory}/{digest[:2]}/{digest[2:4]}/{digest}{extension}"
+            self._acquire(final_name, size, temp_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+        return final_name
+
+    def delete(self, name):
+        if not is_content_addressed(name):
+            return super().delete(name)
+        self._release(name)
+
+    def _acquire(self, name, size, temp_path):
+        """
+        Добавляет ссылку на ``name`` и кладет файл на место при необходимости
+
+        Проверка файла и запись счетчика идут под блокировкой строки
+        StoredFile, как и удаление в _release: параллельный delete() того же
+        содержимого не может удалить файл между проверкой и новой ссылкой.
+        """
+        from .models import StoredFile
+
+        final_path = self.path(name)
+        with transaction.atomic():
+            stored, created = StoredFile.objects.select_for_update().get_or_create(
+                name=name, defaults={"size": size, "refcount": 1}
+            )
+            if not created:
+                StoredFile.objects.filter(pk=stored.pk).update(
+                    refcount=F("refcount") + 1
+                )
+            if os.path.exists(final_path):
+                os.unlink(temp_path)
+                # Свежий mtime: gc_media не удалит файл в пределах grace period,
+                # пока транзакция с новой ссылкой на него не завершилась
+                os.utime(final_path)
+            else:
+                os.makedirs(os.path.dirname(final_path), exist_ok=True)
+                # Атомарно: параллельная запись того же содержимого безопасна
+                os.replace(temp_path, final_path)
+                if self.file_permissions_mode is not None:
+                    os.chmod(final_path, self.file_permissions_mode)
+
+    def _release(self, name):
+        """Уменьшает счетчик ссылок и удаляет файл, когда ссылок не осталось"""
+        from .models import StoredFile
+
+        with transaction.atomic():
+            stored = StoredFile.objects.select_for_update().filter(name=name).first()
+            if stored is not None and stored.refcount > 1:
+                StoredFile.objects.filter(pk=stored.pk).update(
+                    refcount=F("refcount") - 1
+                )
+                return
+            if stored is not None:
+                stored.delete()
+            # Под той же блокировкой, что и проверка файла в _acquire
+            super().delete(name)
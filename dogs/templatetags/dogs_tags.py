@@ -1,4 +1,13 @@
 from django import template
+from django.contrib.auth.models import AnonymousUser
+from django.http import QueryDict
+from django.templatetags.static import static
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
+
+from dogs.bundling import BUNDLES_STATIC_DIR, get_critical_css
+from dogs.utils import PLACEHOLDER_STATIC_DIR, PLACEHOLDERS
+from services.dog_card_service import render_dog_cards
 
 register = template.Library()
 
@@ -19,3 +28,138 @@ def get_years_string(age):
         return "года"
     else:
         return "лет"
+
+
+def _srcset(storage, renditions, image_format):
+    return ", ".join(
+        f"{storage.url(entry[image_format])} {entry['width']}w"
+        for entry in renditions.values()
+        if entry.get(image_format)
+    )
+
+
+@register.simple_tag
+def responsive_image(
+    field_file,
+    renditions,
+    size="card",
+    alt="",
+    style="",
+    css_class="",
+    lazy=True,
+    placeholder="",
+):
+    """Выводит <picture> с WebP/JPEG копиями изображения и srcset.
+
+    Пример: {% responsive_image dog.photo dog.photo_renditions "card" alt=dog.name %}
+    Пока копии не созданы, выводится обычный <img> с оригиналом.
+    ``placeholder`` — data: URI превью (LQIP), которое видно фоном,
+    пока загружается само изображение.
+    """
+    if not field_file:
+        return ""
+
+    if placeholder:
+        style = f"{style} background: url({placeholder}) center / cover no-repeat;"
+
+    attrs = format_html(
+        'alt="{}" style="{}" class="{}"{}',
+        alt,
+        style,
+        css_class,
+        mark_safe(' loading="lazy" decoding="async"') if lazy else "",
+    )
+    entry = (renditions or {}).get(size)
+    if not entry or not entry.get("jpeg"):
+        return format_html('<img src="{}" {}>', field_file.url, attrs)
+
+    storage = field_file.storage
+    sizes = f"(max-width: {entry['width']}px) 100vw, {entry['width']}px"
+    return format_html(
+        '<picture><source type="image/webp" srcset="{}" sizes="{}">'
+        '<img src="{}" srcset="{}" sizes="{}" width="{}" height="{}" {}></picture>',
+        _srcset(storage, renditions, "webp"),
+        sizes,
+        storage.url(entry["jpeg"]),
+        _srcset(storage, renditions, "jpeg"),
+        sizes,
+        entry["width"],
+        entry["height"],
+        attrs,
+    )
+
+
+@register.simple_tag
+def placeholder_image(variant="dog", alt="", style="", css_class=""):
+    """Выводит <img> со статической SVG-заглушкой (dog или avatar).
+
+    Файл заранее создан командой render_placeholders, а collectstatic
+    хэширует и сжимает его, так что заглушка не стоит CPU на запрос.
+    """
+    spec = PLACEHOLDERS[variant]
+    return format_html(
+        '<img src="{}" alt="{}" width="{}" height="{}" style="{}" class="{}">',
+        static(f"{PLACEHOLDER_STATIC_DIR}/{variant}.svg"),
+        alt,
+        spec["width"],
+        spec["height"],
+        style,
+        css_class,
+    )
+
+
+@register.simple_tag
+def bundle_css(name, critical=None):
+    """Подключает CSS-бандл ``name``.
+
+    С ``critical`` (ключ CRITICAL_PAGES) стили первого экрана страницы
+    встраиваются в <style>, а полный бандл грузится без блокировки
+    отрисовки: preload с переключением rel по onload, <noscript> — для
+    браузеров без JS.
+    """
+    href = static(f"{BUNDLES_STATIC_DIR}/{name}")
+    css = get_critical_css(critical) if critical else ""
+    if not css:
+        return format_html('<link rel="stylesheet" href="{}">', href)
+    return format_html(
+        "<style>{}</style>\n"
+        '<link rel="preload" href="{}" as="style" '
+        "onload=\"this.onload=null;this.rel='stylesheet'\">\n"
+        '<noscript><link rel="stylesheet" href="{}"></noscript>',
+        # CSS из собственных исходников; экранирование сломало бы селекторы >
+        mark_safe(css.replace("</", "<\\/")),
+        href,
+        href,
+    )
+
+
+@register.simple_tag(takes_context=True)
+def dog_cards(context, dogs, variant="list"):
+    """Выводит карточки собак, взятые из кэша фрагментов.
+
+    Карточка зависит только от собаки (ключ включает updated_at) и флагов
+    зрителя, поэтому одна и та же запись используется в списке собак и в
+    избранном; отрисовываются только отсутствующие в кэше карточки.
+    """
+    request = context.get("request")
+    user = request.user if request is not None else AnonymousUser()
+    return mark_safe("\n".join(render_dog_cards(dogs, user, variant)))
+
+
+@register.simple_tag(takes_context=True)
+def query_replace(context, **params):
+    """Строка запроса текущей страницы с заменёнными параметрами.
+
+    Переданные параметры заменяют одноимённые (а не добавляются ещё раз),
+    пустое значение или None удаляет параметр; номер страницы сбрасывается,
+    так как при смене фильтра прежняя страница теряет смысл.
+    """
+    request = context.get("request")
+    query = request.GET.copy() if request is not None else QueryDict(mutable=True)
+    query.pop("page", None)
+    for name, value in params.items():
+        if value in (None, ""):
+            query.pop(name, None)
+        else:
+            query[name] = value
+    return query.urlencode()
@@ -36,6 +36,11 @@ urlpatterns = [
     # Информационные страницы
     path("about/", views.about, name="about"),
     path("breeds/", views.breeds, name="breeds"),
+    path(
+        "breeds/autocomplete/",
+        views.breed_autocomplete,
+        name="breed_autocomplete",
+    ),
     path("events/", views.events, name="events"),
     path("tips/", views.tips, name="tips"),
     # Дополнительные страницы для меню - FIX 404 ERRORS
@@ -1,5 +1,7 @@
+import base64
 import os
 import uuid
+from functools import lru_cache
 from io import BytesIO
 
 from django.core.files.base import ContentFile
@@ -301,7 +303,64 @@ def get_match_statistics(user):
 
 
 # Image Optimization and Default Image Functions
-def optimize_image(image_field, max_width=800, max_height=600, quality=85):
+IMAGE_FORMATS = {
+    # format: (Pillow format name, extension, content type)
+    "jpeg": ("JPEG", "jpg", "image/jpeg"),
+    "webp": ("WEBP", "webp", "image/webp"),
+}
+
+
+def resize_image(image, max_width, max_height):
+    """
+    Return a copy of a Pillow image scaled down to fit the given box
+
+    The aspect ratio is kept and images smaller than the box are not upscaled.
+    """
+    resized = image.copy()
+    resized.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
+    return resized
+
+
+def encode_image(image, image_format="jpeg", quality=85):
+    """
+    Encode a Pillow image as JPEG or WebP
+
+    Returns:
+        BytesIO positioned at the start of the encoded data
+    """
+    pillow_format = IMAGE_FORMATS[image_format][0]
+    if image.mode not in ("RGB", "L") and not (
+        image_format == "webp" and image.mode == "RGBA"
+    ):
+        image = image.convert("RGB")
+
+    output = BytesIO()
+    if image_format == "webp":
+        image.save(output, format=pillow_format, quality=quality, method=4)
+    else:
+        image.save(output, format=pillow_format, quality=quality, optimize=True)
+    output.seek(0)
+    return output
+
+
+def make_lqip(image, max_size=16, quality=40):
+    """
+    Build a low-quality image placeholder (LQIP) for inline use
+
+    The image is shrunk to at most ``max_size`` pixels per side and encoded
+    as WebP; the browser scales it up blurred while the real photo loads.
+
+    Returns:
+        data: URI string, usually well under 200 bytes
+    """
+    tiny = resize_image(image, max_size, max_size)
+    data = encode_image(tiny, "webp", quality).getvalue()
+    return "data:image/webp;base64," + base64.b64encode(data).decode("ascii")
+
+
+def optimize_image(
+    image_field, max_width=800, max_height=600, quality=85, image_format="jpeg"
+):
     """
     Optimize uploaded image by resizing and compressing
 
@@ -309,7 +368,8 @@ def optimize_image(image_field, max_width=800, max_height=600, quality=85):
         image_field: Django ImageField instance
         max_width: Maximum width in pixels
         max_height: Maximum height in pixels
-        quality: JPEG quality (1-100)
+        quality: JPEG/WebP quality (1-100)
+        image_format: Output format, "jpeg" or "webp"
 
     Returns:
         Optimized image file
@@ -318,33 +378,21 @@ def optimize_image(image_field, max_width=800, max_height=600, quality=85):
         return None
 
     try:
-        # Open the image
-        image = Image.open(image_field)
-
-        # Convert to RGB if necessary (for JPEG)
-        if image.mode in ("RGBA", "P"):
-            image = image.convert("RGB")
-
-        # Calculate new size maintaining aspect ratio
-        image.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
-
-        # Create a new image with optimized dimensions
-        output = BytesIO()
-
-        # Save optimized image
-        image.save(output, format="JPEG", quality=quality, optimize=True)
-        output.seek(0)
+        # Open the image and fit it into the target box
+        image = resize_image(Image.open(image_field), max_width, max_height)
+        output = encode_image(image, image_format, quality)
 
         # Create new filename
+        _, extension, content_type = IMAGE_FORMATS[image_format]
         name, ext = os.path.splitext(image_field.name)
-        new_filename = f"{name}_{uuid.uuid4().hex[:8]}.jpg"
+        new_filename = f"{name}_{uuid.uuid4().hex[:8]}.{extension}"
 
         # Create new InMemoryUploadedFile
         return InMemoryUploadedFile(
             output,
             "ImageField",
             new_filename,
-            "image/jpeg",
+            content_type,
             len(output.getvalue()),
             None,
         )
@@ -353,51 +401,98 @@ def optimize_image(image_field, max_width=800, max_height=600, quality=85):
         return image_field
 
 
-def create_default_dog_image():
+# Заглушки для собак без фото и пользователей без аватара. SVG не зависит
+# от размера, поэтому на каждый вариант хватает одного статического файла;
+# render_placeholders записывает их в static/, а collectstatic хэширует и сжимает.
+PLACEHOLDER_STATIC_DIR = "dogs/img/placeholders"
+PLACEHOLDERS = {
+    "dog": {
+        "width": 400,
+        "height": 300,
+        "background": "url(#bg)",
+        "text": "🐕",
+        "font_size": 96,
+    },
+    "avatar": {
+        "width": 120,
+        "height": 120,
+        "background": "rgba(59,130,246,0.2)",
+        "text": "👤",
+        "font_size": 48,
+    },
+}
+
+
+def render_placeholder_svg(variant):
     """
-    Create a default dog image placeholder
+    Render a placeholder variant from PLACEHOLDERS as an SVG document
 
     Returns:
-        ContentFile with default dog image data
+        str with the SVG markup
     """
-    # Create a simple placeholder image
-    img = Image.new("RGB", (400, 300), color="#e2e8f0")
+    spec = PLACEHOLDERS[variant]
+    width, height = spec["width"], spec["height"]
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
+        f'width="{width}" height="{height}" preserveAspectRatio="xMidYMid slice">'
+        '<defs><linearGradient id="bg" x1="0" y1="1" x2="1" y2="0">'
+        '<stop offset="0" stop-color="#3b82f6" stop-opacity="0.2"/>'
+        '<stop offset="1" stop-color="#2563eb" stop-opacity="0.1"/>'
+        "</linearGradient></defs>"
+        f'<rect width="{width}" height="{height}" fill="{spec["background"]}"/>'
+        f'<text x="{width // 2}" y="{height // 2}" font-size="{spec["font_size"]}" '
+        'text-anchor="middle" dominant-baseline="central" opacity="0.6">'
+        f'{spec["text"]}</text></svg>\n'
+    )
+
 
-    # Add text
+@lru_cache(maxsize=None)
+def _render_placeholder_png(width, height, background, text, font_size):
+    """
+    Draw a PNG placeholder once per process; later calls reuse the bytes
+    """
     from PIL import ImageDraw, ImageFont
 
+    img = Image.new("RGB", (width, height), color=background)
     draw = ImageDraw.Draw(img)
 
     try:
         # Try to use a larger font
-        font = ImageFont.truetype("arial.ttf", 36)
-    except:
+        font = ImageFont.truetype("arial.ttf", font_size)
+    except OSError:
         try:
             # Fallback to default font
             font = ImageFont.load_default()
-        except:
+        except OSError:
             font = None
 
     # Add text in center
-    text = "🐕"
     if font:
         # Get text bounding box
         bbox = draw.textbbox((0, 0), text, font=font)
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
     else:
-        text_width, text_height = 100, 100
+        text_width, text_height = width // 4, height // 3
 
-    x = (400 - text_width) // 2
-    y = (300 - text_height) // 2
+    x = (width - text_width) // 2
+    y = (height - text_height) // 2
     draw.text((x, y), text, fill="#64748b", font=font)
 
-    # Save to BytesIO
     output = BytesIO()
-    img.save(output, format="PNG", quality=90)
-    output.seek(0)
+    img.save(output, format="PNG", optimize=True)
+    return output.getvalue()
+
 
-    return ContentFile(output.getvalue(), name="default_dog.png")
+def create_default_dog_image():
+    """
+    Create a default dog image placeholder
+
+    Returns:
+        ContentFile with default dog image data
+    """
+    data = _render_placeholder_png(400, 300, "#e2e8f0", "🐕", 36)
+    return ContentFile(data, name="default_dog.png")
 
 
 def create_default_avatar():
@@ -407,41 +502,5 @@ def create_default_avatar():
     Returns:
         ContentFile with default avatar image data
     """
-    # Create a simple placeholder avatar
-    img = Image.new("RGB", (200, 200), color="#f1f5f9")
-
-    # Add text
-    from PIL import ImageDraw, ImageFont
-
-    draw = ImageDraw.Draw(img)
-
-    try:
-        # Try to use a larger font
-        font = ImageFont.truetype("arial.ttf", 60)
-    except:
-        try:
-            # Fallback to default font
-            font = ImageFont.load_default()
-        except:
-            font = None
-
-    # Add text in center
-    text = "👤"
-    if font:
-        # Get text bounding box
-        bbox = draw.textbbox((0, 0), text, font=font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
-    else:
-        text_width, text_height = 50, 50
-
-    x = (200 - text_width) // 2
-    y = (200 - text_height) // 2
-    draw.text((x, y), text, fill="#64748b", font=font)
-
-    # Save to BytesIO
-    output = BytesIO()
-    img.save(output, format="PNG", quality=90)
-    output.seek(0)
-
-    return ContentFile(output.getvalue(), name="default_avatar.png")
+    data = _render_placeholder_png(200, 200, "#f1f5f9", "👤", 60)
+    return ContentFile(data, name="default_avatar.png")
@@ -0,0 +1,87 @@
+from django.core.exceptions import ValidationError
+from django.utils.translation import gettext_lazy as _
+from PIL import Image, UnidentifiedImageError
+
+ALLOWED_IMAGE_MIME_TYPES = {"image/jpeg", "image/png", "image/webp"}
+MAX_IMAGE_SIZE_MB = 5
+# 40 Мп: больше любой фотографии с телефона, но не «бомба» на гигабайты RAM
+MAX_IMAGE_PIXELS = 40_000_000
+# Сколько байт начала файла нужно для распознавания формата
+SIGNATURE_BYTES = 12
+
+# content type -> формат Pillow
+PILLOW_FORMATS = {
+    "image/jpeg": "JPEG",
+    "image/png": "PNG",
+    "image/webp": "WEBP",
+}
+
+
+def sniff_image_type(head):
+    """Определяет тип изображения по сигнатуре (magic bytes) начала файла."""
+    if head.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+def read_image_header(file, content_type):
+    """Возвращает (ширина, высота), прочитав только заголовок файла.
+
+    ``Image.open`` ленив: пиксели не декодируются, пока не вызван ``load()``,
+    поэтому память не зависит от размера картинки.
+    """
+    file.seek(0)
+    try:
+        with Image.open(file, formats=[PILLOW_FORMATS[content_type]]) as image:
+            return image.size
+    except Image.DecompressionBombError:
+        raise ValidationError(
+            _("Слишком большое разрешение изображения."), code="image_too_many_pixels"
+        )
+    except (UnidentifiedImageError, OSError, SyntaxError, ValueError):
+        raise ValidationError(
+            _("Файл поврежден или не является изображением."), code="invalid_image"
+        )
+    finally:
+        file.seek(0)
+
+
+def validate_image_upload(image):
+    """Проверяет загружаемое изображение за один проход по началу файла.
+
+    Размер берется из метаданных загрузки, тип — из сигнатуры первых байт
+    (``content_type`` от клиента не учитывается), разрешение — из заголовка.
+    Число пикселей ограничивается до какого-либо декодирования, так что
+    «декомпрессионные бомбы» отсекаются, а расход памяти не зависит от
+    размера файла. Уже сохраненные файлы повторно не проверяются.
+    """
+    if not image or getattr(image, "_committed", False):
+        return
+
+    size = getattr(image, "size", None)
+    if size is not None and size > MAX_IMAGE_SIZE_MB * 1024 * 1024:
+        raise ValidationError(
+            _("Размер изображения не должен превышать %(size)s МБ."),
+            params={"size": MAX_IMAGE_SIZE_MB},
+            code="image_too_large",
+        )
+
+    image.seek(0)
+    content_type = sniff_image_type(image.read(SIGNATURE_BYTES))
+    if content_type not in ALLOWED_IMAGE_MIME_TYPES:
+        raise ValidationError(
+            _("Допустимые форматы изображения: JPEG, PNG, WebP."),
+            code="invalid_image_type",
+        )
+
+    width, height = read_image_header(image, content_type)
+    if width * height > MAX_IMAGE_PIXELS:
+        raise ValidationError(
+            _("Разрешение изображения не должно превышать %(pixels)s Мп."),
+            params={"pixels": MAX_IMAGE_PIXELS // 1_000_000},
+            code="image_too_many_pixels",
+        )
@@ -7,8 +7,20 @@ from django.core.paginator import Paginator
 from django.db.models import Count, Q
 from django.http import HttpResponseForbidden, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
-
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
+
+from services.breed_service import autocomplete_breeds
+from services.conditional_service import (
+    dog_detail_etag,
+    dog_detail_last_modified,
+    dog_list_etag,
+    favorites_list_etag,
+)
+from services.facet_service import get_facets
 from services.favorites_service import toggle_favorite_for_user
+from services.featured_service import get_featured_dogs
+from services.result_cache_service import get_dog_page
 
 from .forms import (
     AccountDeletionForm,
@@ -35,8 +47,8 @@ def landing_page(request):
     if request.user.is_authenticated:
         return redirect("dogs:dashboard")
 
-    # Получаем несколько случайных собак для демонстрации
-    featured_dogs = Dog.objects.filter(is_active=True).order_by("?")[:6]
+    # Случайные собаки с фото из заранее выбранного пула (без ORDER BY RANDOM())
+    featured_dogs = get_featured_dogs(6)
 
     return render(request, "dogs/landing.html", {"featured_dogs": featured_dogs})
 
@@ -140,38 +152,19 @@ def home(request):
     return render(request, "dogs/home.html")
 
 
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=dog_list_etag)
 def dog_list(request):
     """Список всех собак с фильтрами"""
-    dogs = Dog.objects.filter(is_active=True).select_related("owner")
     search_form = DogSearchForm(request.GET)
+    filters = search_form.cleaned_data if search_form.is_valid() else {}
 
-    if search_form.is_valid():
-        # Применяем фильтры
-        breed = search_form.cleaned_data.get("breed")
-        age_min = search_form.cleaned_data.get("age_min")
-        age_max = search_form.cleaned_data.get("age_max")
-        gender = search_form.cleaned_data.get("gender")
-        size = search_form.cleaned_data.get("size")
-
-        if breed:
-            dogs = dogs.filter(breed__icontains=breed)
-
-        if age_min is not None:
-            dogs = dogs.filter(age__gte=age_min)
-
-        if age_max is not None:
-            dogs = dogs.filter(age__lte=age_max)
-
-        if gender:
-            dogs = dogs.filter(gender=gender)
+    # Страница берется из кэша результатов (ID + количество), 12 собак на страницу
+    page_obj = get_dog_page(filters, request.GET.get("page"), per_page=12)
 
-        if size:
-            dogs = dogs.filter(size=size)
-
-    # Пагинация
-    paginator = Paginator(dogs, 12)  # 12 собак на страницу
-    page_number = request.GET.get("page")
-    page_obj = paginator.get_page(page_number)
+    # Параметры поиска сохраняются в ссылках пагинации
+    query_params = request.GET.copy()
+    query_params.pop("page", None)
 
     return render(
         request,
@@ -179,11 +172,15 @@ def dog_list(request):
         {
             "page_obj": page_obj,
             "search_form": search_form,
-            "total_results": dogs.count(),
+            "total_results": page_obj.paginator.count,
+            "query_string": query_params.urlencode(),
+            "facets": get_facets(filters),
         },
     )
 
 
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=dog_detail_etag, last_modified_func=dog_detail_last_modified)
 def dog_detail(request, pk):
     """Подробная информация о собаке"""
     dog = get_object_or_404(Dog.objects.select_related("owner"), pk=pk, is_active=True)
@@ -404,6 +401,8 @@ def matches_list(request):
 
 
 @login_required
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=favorites_list_etag)
 def favorites_list(request):
     """Список избранных собак"""
     favorites_qs = Favorite.objects.filter(user=request.user).select_related("dog")
@@ -417,6 +416,7 @@ def favorites_list(request):
         "dogs/favorites.html",
         {
             "favorites": page_obj.object_list,
+            "favorite_dogs": [favorite.dog for favorite in page_obj.object_list],
             "page_obj": page_obj,
             "page_title": "Избранное",
         },
@@ -433,6 +433,12 @@ def breeds(request):
     return render(request, "dogs/breeds.html", {"page_title": "Породы собак"})
 
 
+def breed_autocomplete(request):
+    """Подсказки пород для поля поиска (AJAX)"""
+    prefix = request.GET.get("q", "")
+    return JsonResponse({"results": autocomplete_breeds(prefix)})
+
+
 def events(request):
     """Мероприятия"""
     return render(request, "dogs/events.html", {"page_title": "Мероприятия"})
@@ -0,0 +1,23 @@
+"""
+Gunicorn settings shared by the Dockerfile and docker-compose commands.
+
+Gunicorn reads ./gunicorn.conf.py automatically; command-line flags still
+override the values below.
+"""
+
+import os
+
+
+def post_worker_init(worker):
+    """Warm up a fresh worker before it accepts its first request.
+
+    Templates, the URL resolver and menu caches live in process memory, so
+    without this the first request of every worker pays for building them.
+    """
+    if os.environ.get("WARMUP_ON_STARTUP", "1") in ("0", "false", "False"):
+        return
+    from services.warmup_service import warm_up
+
+    timings = warm_up()
+    total = sum(seconds for _, seconds in timings.values())
+    worker.log.info("Worker %s warmed up in %.3fs", worker.pid, total)
@@ -16,6 +16,9 @@ class MenuItemAdmin(admin.ModelAdmin):
     search_fields = ("title", "url", "named_url")
     list_editable = ("order",)
     raw_id_fields = ("parent",)
+    readonly_fields = ("path",)
+    # По материализованному пути: поддеревья идут подряд
+    ordering = ("menu", "path")
 
     def formfield_for_foreignkey(self, db_field, request, **kwargs):
         """Фильтруем родительские элементы по текущему меню"""
@@ -5,3 +5,6 @@ class MenuAppConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "menu_app"
     verbose_name = "Меню"
+
+    def ready(self):
+        from . import signals  # noqa: F401
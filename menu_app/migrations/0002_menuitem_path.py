@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:21
+
+from django.db import migrations, models
+
+
+def fill_paths(apps, schema_editor):
+    """Строит материализованные пути существующих пунктов, от корней вниз."""
+    MenuItem = apps.get_model("menu_app", "MenuItem")
+    parents = dict(MenuItem.objects.values_list("pk", "parent_id"))
+    paths = {}
+
+    def build(pk):
+        if pk not in paths:
+            parent_id = parents[pk]
+            prefix = build(parent_id) if parent_id in parents else ""
+            paths[pk] = f"{prefix}{pk}/"
+        return paths[pk]
+
+    for pk in parents:
+        MenuItem.objects.filter(pk=pk).update(path=build(pk))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("menu_app", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="menuitem",
+            name="path",
+            field=models.CharField(
+                blank=True, editable=False, max_length=255, verbose_name="Путь в дереве"
+            ),
+        ),
+        migrations.RunPython(fill_paths, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="menuitem",
+            index=models.Index(
+                fields=["path"],
+                name="idx_menuitem_path",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ),
+    ]
@@ -1,6 +1,12 @@
-from django.db import models
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.db.models import Value
+from django.db.models.functions import Concat, Substr
 from django.urls import reverse
 
+# Разделитель сегментов материализованного пути: "1/5/12/"
+PATH_SEPARATOR = "/"
+
 
 class Menu(models.Model):
     """Модель для хранения меню"""
@@ -34,11 +40,24 @@ class MenuItem(models.Model):
     url = models.CharField(max_length=200, blank=True, verbose_name="URL")
     named_url = models.CharField(max_length=100, blank=True, verbose_name="Named URL")
     order = models.IntegerField(default=0, verbose_name="Порядок сортировки")
+    # Материализованный путь: id всех предков и самого пункта, "1/5/12/".
+    # Поддерево — один диапазонный запрос path LIKE '1/5/%' по индексу
+    path = models.CharField(
+        max_length=255, blank=True, editable=False, verbose_name="Путь в дереве"
+    )
 
     class Meta:
         verbose_name = "Пункт меню"
         verbose_name_plural = "Пункты меню"
         ordering = ["order", "id"]
+        indexes = [
+            # varchar_pattern_ops: LIKE 'prefix%' по индексу при любой collation
+            models.Index(
+                fields=["path"],
+                name="idx_menuitem_path",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ]
 
     def __str__(self):
         return self.title
@@ -52,8 +71,69 @@ class MenuItem(models.Model):
                 pass
         return self.url or "#"
 
+    @property
+    def depth(self):
+        """Уровень вложенности: 0 у корневых пунктов"""
+        return self.path.count(PATH_SEPARATOR) - 1
+
+    def get_ancestor_ids(self):
+        return [int(pk) for pk in self.path.split(PATH_SEPARATOR)[:-2]]
+
+    def get_ancestors(self):
+        """Предки от корня к родителю (для хлебных крошек) одним запросом"""
+        ancestors = MenuItem.objects.in_bulk(self.get_ancestor_ids())
+        return [ancestors[pk] for pk in self.get_ancestor_ids() if pk in ancestors]
+
+    def get_descendants(self):
+        """Все потомки пункта — диапазонный запрос по индексу path"""
+        return MenuItem.objects.filter(path__startswith=self.path).exclude(pk=self.pk)
+
+    def clean(self):
+        super().clean()
+        if self.parent_id is None:
+            return
+        if self.parent.menu_id != self.menu_id:
+            raise ValidationError(
+                {"parent": "Родительский пункт должен быть из того же меню."}
+            )
+        if self.pk and self.parent.path.startswith(self.path):
+            raise ValidationError(
+                {"parent": "Пункт нельзя вложить в самого себя или своего потомка."}
+            )
+
+    def _build_path(self):
+        parent_path = ""
+        if self.parent_id:
+            parent_path = (
+                MenuItem.objects.filter(pk=self.parent_id)
+                .values_list("path", flat=True)
+                .first()
+                or ""
+            )
+        return f"{parent_path}{self.pk}{PATH_SEPARATOR}"
+
     def save(self, *args, **kwargs):
-        """Валидация: должен быть указан либо url, либо named_url"""
+        """Валидация: должен быть указан либо url, либо named_url.
+
+        После сохранения пересчитывает материализованный путь; при переносе
+        пункта пути всего поддерева обновляются одним UPDATE.
+        """
         if not self.url and not self.named_url:
             self.url = "#"
-        super().save(*args, **kwargs)
+        old_path = self.path
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            new_path = self._build_path()
+            if new_path == old_path:
+                return
+            if old_path:
+                MenuItem.objects.filter(path__startswith=old_path).update(
+                    path=Concat(
+                        Value(new_path),
+                        Substr("path", len(old_path) + 1),
+                        output_field=models.CharField(),
+                    )
+                )
+            else:
+                MenuItem.objects.filter(pk=self.pk).update(path=new_path)
+            self.path = new_path
@@ -0,0 +1,13 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from services.menu_service import bump_menu_version
+
+from .models import Menu, MenuItem
+
+
+@receiver([post_save, post_delete], sender=Menu)
+@receiver([post_save, post_delete], sender=MenuItem)
+def invalidate_menu_trees(sender, **kwargs):
+    """Сбрасывает закэшированные деревья меню во всех процессах"""
+    bump_menu_version()
@@ -86,6 +86,19 @@ DATABASES = {
 }
 
 
+# ---------------------------------------------------------------------------
+# Cache (env-driven, in-memory fallback for development)
+# ---------------------------------------------------------------------------
+# Cache versions (services.cache_service), cached result pages and hit/miss
+# counters need one cache shared by every gunicorn worker and management
+# command, with an atomic incr(): Redis or Memcached. production.py refuses
+# to start without one. The per-process LocMem fallback only suits a single
+# runserver; commands run beside it do not invalidate its caches.
+CACHES = {
+    "default": env.cache("CACHE_URL", default="locmemcache://"),
+}
+
+
 # ---------------------------------------------------------------------------
 # Authentication & passwords
 # ---------------------------------------------------------------------------
@@ -112,9 +125,12 @@ STATIC_ROOT = BASE_DIR / "staticfiles"
 
 # WhiteNoise configuration for serving static files efficiently
 STORAGES = {
+    # Uploads are stored once per content hash (see dogs.storage)
     "default": {
-        "BACKEND": "django.core.files.storage.FileSystemStorage",
+        "BACKEND": "dogs.storage.ContentAddressedStorage",
     },
+    # collectstatic hashes names and writes .gz/.br copies; WhiteNoise serves
+    # hashed names (e.g. the dogs/bundles built by build_bundles) as immutable
     "staticfiles": {
         "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
     },
@@ -123,9 +139,44 @@ STORAGES = {
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# dogs.media_views.serve_media handles MEDIA_URL (conditional GET, Range).
+# Set MEDIA_ACCEL_REDIRECT_PREFIX to an nginx "internal" location aliased to
+# MEDIA_ROOT to let nginx send the bytes instead of a gunicorn worker.
+SERVE_MEDIA = env.bool("SERVE_MEDIA", default=True)
+MEDIA_CACHE_MAX_AGE = env.int("MEDIA_CACHE_MAX_AGE", default=3600)
+MEDIA_ACCEL_REDIRECT_PREFIX = env.str("MEDIA_ACCEL_REDIRECT_PREFIX", default="")
+
+# Uploaded dog photos are resized by the process_images worker command
+IMAGE_WORKER_PROCESSES = env.int("IMAGE_WORKER_PROCESSES", default=2)
+IMAGE_WORKER_MAX_ATTEMPTS = env.int("IMAGE_WORKER_MAX_ATTEMPTS", default=3)
+
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 
+# ---------------------------------------------------------------------------
+# Search
+# ---------------------------------------------------------------------------
+# Above this many rows dog_list and the admin show an estimated result count
+SEARCH_COUNT_EXACT_THRESHOLD = env.int("SEARCH_COUNT_EXACT_THRESHOLD", default=1000)
+SEARCH_COUNT_SAMPLE_SIZE = env.int("SEARCH_COUNT_SAMPLE_SIZE", default=2000)
+SEARCH_COUNT_CACHE_TIMEOUT = env.int("SEARCH_COUNT_CACHE_TIMEOUT", default=300)
+SEARCH_COUNT_TOTAL_TIMEOUT = env.int("SEARCH_COUNT_TOTAL_TIMEOUT", default=3600)
+# Facet counts are cached per filter signature and invalidated on dog changes
+SEARCH_FACETS_CACHE_TIMEOUT = env.int("SEARCH_FACETS_CACHE_TIMEOUT", default=600)
+# dog_list pages cache ordered dog IDs per filter signature and page
+SEARCH_RESULTS_CACHE_TIMEOUT = env.int("SEARCH_RESULTS_CACHE_TIMEOUT", default=300)
+# Rendered dog cards are keyed by updated_at, so the timeout only bounds memory
+DOG_CARD_CACHE_TIMEOUT = env.int("DOG_CARD_CACHE_TIMEOUT", default=86400)
+
+
+# ---------------------------------------------------------------------------
+# Landing page
+# ---------------------------------------------------------------------------
+# Featured dogs are picked from a periodically resampled pool of IDs
+FEATURED_POOL_SIZE = env.int("FEATURED_POOL_SIZE", default=60)
+FEATURED_POOL_TIMEOUT = env.int("FEATURED_POOL_TIMEOUT", default=600)
+
+
 # ---------------------------------------------------------------------------
 # Auth URLs
 # ---------------------------------------------------------------------------
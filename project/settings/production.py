@@ -1,3 +1,5 @@
+from django.core.exceptions import ImproperlyConfigured
+
 from .base import *  # noqa
 
 
@@ -23,3 +25,12 @@ CORS_ALLOWED_ORIGINS = [
     "https://localhost:8000",
 ]
 CORS_ALLOW_CREDENTIALS = True
+
+# Cache versions and counters need a shared cache with atomic incr()
+if not env.str("CACHE_URL", default="") or not any(
+    name in CACHES["default"]["BACKEND"] for name in ("redis", "memcached")
+):
+    raise ImproperlyConfigured(
+        "Set CACHE_URL to a Redis or Memcached cache shared by all workers, "
+        "e.g. redis://localhost:6379/1"
+    )
@@ -21,6 +21,13 @@ DATABASES = {
 # Disable debug mode in tests for performance
 DEBUG = False
 
+# Tests run in one process, so a local cache behaves like the shared one
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
 # Simplify password hashing for faster tests
 PASSWORD_HASHERS = [
     "django.contrib.auth.hashers.MD5PasswordHasher",
@@ -48,8 +55,9 @@ MEDIA_ROOT = BASE_DIR / "test_media"
 
 # Disable whitenoise for tests (faster)
 STORAGES = {
+    # Uploads are stored once per content hash (see dogs.storage)
     "default": {
-        "BACKEND": "django.core.files.storage.FileSystemStorage",
+        "BACKEND": "dogs.storage.ContentAddressedStorage",
     },
     "staticfiles": {
         "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
@@ -1,15 +1,25 @@
+import re
+
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
 from django.conf import settings
-from django.conf.urls.static import static
+
+from dogs.media_views import serve_media
 
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("", include("dogs.urls")),
 ]
 
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+# Media is served by Django unless the front proxy serves MEDIA_ROOT itself
+if settings.SERVE_MEDIA:
+    urlpatterns += [
+        re_path(
+            rf"^{re.escape(settings.MEDIA_URL.lstrip('/'))}(?P<path>.+)$",
+            serve_media,
+            name="media",
+        ),
+    ]
 
 # Custom error handlers
 handler404 = "dogs.views.handler404"
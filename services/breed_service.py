@@ -0,0 +1,173 @@
+from bisect import bisect_left
+from collections import Counter, defaultdict
+
+from django.db import connection, transaction
+from django.db.models import Count, Q
+
+from dogs.models import Breed, BreedAlias, Dog, normalize_breed_name
+from services.cache_service import (
+    BREED_VERSION,
+    DOG_VERSION,
+    bump_version,
+    get_version,
+)
+
+
+def resolve_breed(name: str, *, create: bool = False) -> Breed | None:
+    """Return the catalog breed for free-text ``name`` (alias or spelling).
+
+    With ``create=True`` an unknown spelling becomes a new catalog entry.
+    """
+    key = normalize_breed_name(name)
+    if not key:
+        return None
+
+    breed = (
+        Breed.objects.filter(Q(normalized_name=key) | Q(aliases__normalized_alias=key))
+        .distinct()
+        .first()
+    )
+    if breed is None and create:
+        breed, _ = Breed.objects.get_or_create(
+            normalized_name=key, defaults={"name": " ".join(name.split())}
+        )
+    return breed
+
+
+def add_breed_alias(breed: Breed, alias: str) -> BreedAlias:
+    """Register ``alias`` for ``breed`` and merge a same-named catalog entry.
+
+    Dogs pointing at a breed that was auto-created for this spelling are moved
+    to ``breed`` and the duplicate entry is removed.
+    """
+    key = normalize_breed_name(alias)
+    with transaction.atomic():
+        duplicate = Breed.objects.filter(normalized_name=key).exclude(pk=breed.pk)
+        Dog.objects.filter(canonical_breed__in=duplicate).update(canonical_breed=breed)
+        duplicate.delete()
+        breed_alias, _ = BreedAlias.objects.update_or_create(
+            normalized_alias=key, defaults={"breed": breed, "alias": alias}
+        )
+    # queryset.update() bypasses the Dog signals
+    bump_version(DOG_VERSION)
+    return breed_alias
+
+
+def backfill_breeds() -> dict:
+    """Link every dog to the breed catalog, creating entries as needed.
+
+    Distinct spellings are read with one grouped query and grouped by their
+    normalized key, so there is one ``UPDATE`` per key regardless of the
+    number of dogs.
+    """
+    spellings = defaultdict(Counter)
+    grouped = Dog.objects.order_by().values_list("breed").annotate(total=Count("pk"))
+    for breed_text, total in grouped:
+        spellings[normalize_breed_name(breed_text)][breed_text] = total
+
+    created = linked = 0
+    for key, counter in spellings.items():
+        if not key:
+            continue
+        breed = resolve_breed(key)
+        if breed is None:
+            # The most common spelling becomes the display name
+            breed = Breed.objects.create(
+                name=" ".join(counter.most_common(1)[0][0].split())
+            )
+            created += 1
+        linked += (
+            Dog.objects.filter(breed__in=list(counter))
+            .exclude(canonical_breed=breed)
+            .update(canonical_breed=breed)
+        )
+    if linked:
+        bump_version(DOG_VERSION)
+    return {"breeds_created": created, "dogs_linked": linked}
+
+
+def bump_breed_version() -> None:
+    """Invalidate the in-memory prefix index in every process."""
+    bump_version(BREED_VERSION)
+
+
+class BreedPrefixIndex:
+    """Sorted list of normalized names and aliases searched with bisect.
+
+    Lookups are O(log n + k) over a few hundred entries, i.e. microseconds.
+    """
+
+    def __init__(self, entries):
+        self._entries = sorted(entries)
+        self._keys = [key for key, _, _ in self._entries]
+
+    @classmethod
+    def build(cls):
+        entries = [
+            (normalized_name, pk, name)
+            for pk, name, normalized_name in Breed.objects.values_list(
+                "pk", "name", "normalized_name"
+            )
+        ]
+        entries += [
+            (normalized_alias, breed_id, name)
+            for breed_id, name, normalized_alias in BreedAlias.objects.values_list(
+                "breed_id", "breed__name", "normalized_alias"
+            )
+        ]
+        return cls(entries)
+
+    def search(self, prefix: str, limit: int = 10) -> list[dict]:
+        prefix = normalize_breed_name(prefix)
+        if not prefix:
+            return []
+
+        results = []
+        seen = set()
+        position = bisect_left(self._keys, prefix)
+        for key, pk, name in self._entries[position:]:
+            if not key.startswith(prefix) or len(results) >= limit:
+                break
+            if pk not in seen:
+                seen.add(pk)
+                results.append({"id": pk, "name": name})
+        return results
+
+
+_prefix_index = None
+_prefix_index_version = None
+
+
+def get_breed_prefix_index() -> BreedPrefixIndex:
+    """Return the process-local prefix index, rebuilding it when stale."""
+    global _prefix_index, _prefix_index_version
+
+    version = get_version(BREED_VERSION)
+    if _prefix_index is None or version != _prefix_index_version:
+        _prefix_index = BreedPrefixIndex.build()
+        _prefix_index_version = version
+    return _prefix_index
+
+
+def autocomplete_breeds(prefix: str, limit: int = 10) -> list[dict]:
+    """Return up to ``limit`` breeds whose name or alias starts with ``prefix``.
+
+    PostgreSQL answers from the trigram indexes; other backends use the
+    in-memory :class:`BreedPrefixIndex`.
+    """
+    if connection.vendor != "postgresql":
+        return get_breed_prefix_index().search(prefix, limit)
+
+    key = normalize_breed_name(prefix)
+    if not key:
+        return []
+    breeds = (
+        Breed.objects.filter(
+            Q(normalized_name__startswith=key)
+            | Q(aliases__normalized_alias__startswith=key)
+        )
+        .distinct()
+        .order_by("normalized_name")
+        .values("id", "name")[:limit]
+    )
+    return list(breeds)
@@ -0,0 +1,69 @@
+import hashlib
+import json
+import time
+
+from django.core.cache import cache
+
+DOG_VERSION = "dogs"
+BREED_VERSION = "breeds"
+MENU_VERSION = "menus"
+# Per user: "favorites:<user id>", see services.favorites_service
+FAVORITES_VERSION = "favorites"
+
+
+def _version_key(namespace: str) -> str:
+    return f"{namespace}:version"
+
+
+def _new_generation() -> int:
+    # Clock-based, so a counter lost to eviction or cache.clear() never
+    # restarts at a value that process-local copies may still be keyed by
+    return time.time_ns()
+
+
+def get_version(namespace: str) -> int:
+    """Return the current cache generation for ``namespace``."""
+    key = _version_key(namespace)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _new_generation(), None)
+        version = cache.get(key, 0)
+    return version
+
+
+def increment(key: str) -> int:
+    """Atomically increment a persistent counter, creating it if missing."""
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.add(key, 0, None)
+        return cache.incr(key)
+
+
+def bump_version(namespace: str) -> None:
+    """Start a new cache generation; entries keyed by the old one go stale."""
+    key = _version_key(namespace)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, _new_generation(), None)
+
+
+def filter_signature(filters: dict | None) -> str:
+    """Return a stable digest for ``DogSearchForm.cleaned_data``.
+
+    Empty values are dropped and whitespace in text is collapsed, so
+    "?gender=F&size=" and "?size=&gender=F" share one cache entry.
+    """
+    canonical = {}
+    for name, value in (filters or {}).items():
+        if value in (None, ""):
+            continue
+        if isinstance(value, str):
+            # Case is kept: SQLite compares non-ASCII text case-sensitively
+            value = " ".join(value.split())
+        if value not in (None, ""):
+            canonical[name] = value
+
+    payload = json.dumps(canonical, sort_keys=True, ensure_ascii=False)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
@@ -0,0 +1,128 @@
+import hashlib
+
+from django.contrib import messages
+from django.templatetags.static import static
+
+from dogs.models import Dog, Favorite
+from services.cache_service import BREED_VERSION, DOG_VERSION, get_version
+from services.favorites_service import get_favorites_version
+from services.menu_service import get_request_menu_version
+
+# Validators use only the database and the shared cache (see CACHES), never
+# process-local state: any gunicorn worker must agree on whether a page changed
+
+
+def _page_parts(request) -> tuple:
+    # What every page shares: the viewer shown in the header, the menu and
+    # the hashed bundle name, which changes when a deploy changes the styles
+    user = request.user
+    viewer = (user.pk, user.get_username()) if user.is_authenticated else (None, "")
+    return (
+        *viewer,
+        get_request_menu_version(request),
+        static("dogs/bundles/app.css"),
+    )
+
+
+def _weak_etag(*parts) -> str:
+    payload = "|".join(str(part) for part in parts).encode()
+    return f'W/"{hashlib.blake2b(payload, digest_size=12).hexdigest()}"'
+
+
+def _has_pending_messages(request) -> bool:
+    # A 304 would leave flash messages queued for a later page
+    return bool(len(messages.get_messages(request)))
+
+
+def _dog_detail_state(request, pk) -> dict | None:
+    """Rows the dog_detail page of ``pk`` depends on, read once per request.
+
+    ``photo_available`` and the other fields changed with update() are
+    covered by ``updated_at``, which those updates set as well.
+    """
+    if not hasattr(request, "_dog_detail_state"):
+        row = (
+            Dog.objects.filter(pk=pk, is_active=True)
+            .values_list("updated_at", "owner__profile__updated_at", "owner__username")
+            .first()
+        )
+        state = None
+        if row is not None:
+            favorited_at = None
+            if request.user.is_authenticated:
+                favorited_at = (
+                    Favorite.objects.filter(user=request.user, dog_id=pk)
+                    .values_list("created_at", flat=True)
+                    .first()
+                )
+            state = {
+                "dog": row[0],
+                "profile": row[1],
+                "favorited_at": favorited_at,
+                "owner": row[2],
+            }
+        request._dog_detail_state = state
+    return request._dog_detail_state
+
+
+def dog_detail_last_modified(request, pk):
+    """Latest change of the dog, its owner's profile or the viewer's favorite.
+
+    Renaming the owner touches the dogs' ``updated_at`` (see dogs.signals).
+    None (no conditional handling) for a missing dog, which then gets its
+    404, and while flash messages are waiting to be shown.
+    """
+    state = _dog_detail_state(request, pk)
+    if state is None or _has_pending_messages(request):
+        return None
+    moments = (state["dog"], state["profile"], state["favorited_at"])
+    return max(moment for moment in moments if moment is not None)
+
+
+def dog_detail_etag(request, pk):
+    """Weak ETag of dog_detail for this viewer.
+
+    Removing a favorite deletes its row and cannot move Last-Modified
+    forward; the ETag includes the favorite state, and clients that send
+    If-None-Match have it take precedence over If-Modified-Since.
+    """
+    state = _dog_detail_state(request, pk)
+    if state is None or _has_pending_messages(request):
+        return None
+    return _weak_etag("dog", pk, *state.values(), *_page_parts(request))
+
+
+def dog_list_etag(request):
+    """Weak ETag of dog_list from the shared dog and breed cache generations.
+
+    The URL carries the filters and page; the viewer's favorites version
+    covers the heart state on the cards. Writes that bypass the save
+    signals (the photo queue, backfills, reconcile_photo_flags) bump
+    DOG_VERSION themselves.
+    """
+    if _has_pending_messages(request):
+        return None
+    favorites = (
+        get_favorites_version(request.user.pk)
+        if request.user.is_authenticated
+        else None
+    )
+    return _weak_etag(
+        "dog_list",
+        get_version(DOG_VERSION),
+        get_version(BREED_VERSION),
+        favorites,
+        *_page_parts(request),
+    )
+
+
+def favorites_list_etag(request):
+    """Weak ETag of the viewer's favorites page."""
+    if _has_pending_messages(request) or not request.user.is_authenticated:
+        return None
+    return _weak_etag(
+        "favorites",
+        get_version(DOG_VERSION),
+        get_favorites_version(request.user.pk),
+        *_page_parts(request),
+    )
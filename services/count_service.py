@@ -0,0 +1,162 @@
+import hashlib
+import json
+import random
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+DEFAULT_EXACT_THRESHOLD = 1000
+DEFAULT_SAMPLE_SIZE = 2000
+DEFAULT_ESTIMATE_TIMEOUT = 300
+DEFAULT_TOTAL_TIMEOUT = 3600
+
+
+class ResultCount(int):
+    """An int that remembers whether it is an exact count or an estimate."""
+
+    is_exact: bool = True
+
+    def __new__(cls, value: int, *, is_exact: bool = True):
+        obj = super().__new__(cls, max(int(value), 0))
+        obj.is_exact = is_exact
+        return obj
+
+
+def _threshold() -> int:
+    return getattr(settings, "SEARCH_COUNT_EXACT_THRESHOLD", DEFAULT_EXACT_THRESHOLD)
+
+
+def _bounded_count(queryset, limit: int) -> int:
+    """Count at most ``limit`` rows; the database stops scanning after that."""
+    return queryset.order_by()[:limit].count()
+
+
+def _postgres_estimate(queryset) -> int | None:
+    """Return the planner's row estimate for the query (no rows are read)."""
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    try:
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _table_total(model, using: str) -> int:
+    """Approximate row count of ``model``'s table without scanning it per call.
+
+    PostgreSQL keeps it in ``pg_class.reltuples``; other backends count the
+    table once per ``SEARCH_COUNT_TOTAL_TIMEOUT`` and share it through the
+    cache.
+    """
+    connection = connections[using]
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+                [connection.ops.quote_name(model._meta.db_table)],
+            )
+            row = cursor.fetchone()
+        # -1 until the table is first vacuumed or analyzed
+        if row and row[0] >= 0:
+            return int(row[0])
+
+    key = f"count-total:{using}:{model._meta.label_lower}"
+    total = cache.get(key)
+    if total is None:
+        total = model._default_manager.using(using).count()
+        cache.set(
+            key,
+            total,
+            getattr(settings, "SEARCH_COUNT_TOTAL_TIMEOUT", DEFAULT_TOTAL_TIMEOUT),
+        )
+    return total
+
+
+def _sampled_estimate(queryset) -> int:
+    """Estimate the row count from a contiguous primary-key window.
+
+    A random window of ``SEARCH_COUNT_SAMPLE_SIZE`` rows is taken from the
+    base table, the filter is applied inside that window and the observed
+    selectivity is scaled to the table size. The window and the filter are
+    indexed pk range scans; the table size comes from :func:`_table_total`,
+    so only one full count per its timeout grows with the table.
+    """
+    model = queryset.model
+    base = model._default_manager.using(queryset.db)
+    sample_size = getattr(settings, "SEARCH_COUNT_SAMPLE_SIZE", DEFAULT_SAMPLE_SIZE)
+
+    if _bounded_count(base, sample_size + 1) <= sample_size:
+        return queryset.count()
+    total = _table_total(model, queryset.db)
+
+    bounds = base.order_by("pk").values_list("pk", flat=True)
+    low, high = bounds.first(), bounds.last()
+    start = random.randint(low, max(low, high - sample_size))
+    window = list(bounds.filter(pk__gte=start)[:sample_size])
+    if not window:
+        return queryset.count()
+
+    window_range = {"pk__gte": window[0], "pk__lte": window[-1]}
+    matched = queryset.filter(**window_range).order_by().count()
+    return round(total * matched / len(window))
+
+
+def _estimate_cache_key(queryset) -> str:
+    sql, params = queryset.order_by().query.sql_with_params()
+    digest = hashlib.blake2b(f"{sql}|{params!r}".encode(), digest_size=16).hexdigest()
+    return f"count-estimate:{queryset.model._meta.label_lower}:{digest}"
+
+
+def estimate_count(queryset, *, threshold: int | None = None) -> ResultCount:
+    """Return an exact count for small results and an estimate otherwise.
+
+    Up to ``threshold`` rows are counted exactly with a ``LIMIT``-bounded
+    query. Above that, PostgreSQL answers from the planner statistics
+    (``EXPLAIN``) and other backends use a cached sampled estimate, so the
+    count never costs more than a bounded scan.
+    """
+    if threshold is None:
+        threshold = _threshold()
+
+    bounded = _bounded_count(queryset, threshold + 1)
+    if bounded <= threshold:
+        return ResultCount(bounded)
+
+    estimate = None
+    if connections[queryset.db].vendor == "postgresql":
+        estimate = _postgres_estimate(queryset)
+    else:
+        key = _estimate_cache_key(queryset)
+        estimate = cache.get(key)
+        if estimate is None:
+            estimate = _sampled_estimate(queryset)
+            cache.set(
+                key,
+                estimate,
+                getattr(
+                    settings, "SEARCH_COUNT_CACHE_TIMEOUT", DEFAULT_ESTIMATE_TIMEOUT
+                ),
+            )
+
+    # We already know there are more rows than the threshold.
+    return ResultCount(max(estimate or 0, bounded), is_exact=False)
+
+
+class ApproximateCountPaginator(Paginator):
+    """Paginator whose ``count`` comes from :func:`estimate_count`.
+
+    ``count.is_exact`` tells templates whether to render "about N".
+    """
+
+    @cached_property
+    def count(self) -> ResultCount:
+        if not hasattr(self.object_list, "query"):
+            return ResultCount(len(self.object_list))
+        return estimate_count(self.object_list)
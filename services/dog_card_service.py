@@ -0,0 +1,101 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.template.loader import get_template
+
+from dogs.models import Dog, Favorite
+
+# variant: template; "list" is shared by dog_list and favorites
+DOG_CARD_TEMPLATES = {
+    "list": "dogs/components/dog_card.html",
+    "landing": "dogs/components/dog_card_landing.html",
+}
+DEFAULT_CARD_TIMEOUT = 24 * 60 * 60
+
+
+def card_flags(dog: Dog, user, favorite_ids) -> tuple[bool, bool, bool]:
+    """Viewer-relationship flags a card depends on.
+
+    ``(signed in, owns the dog, has it in favorites)``; everything else on
+    a card comes from the dog row itself.
+    """
+    if not user.is_authenticated:
+        return False, False, False
+    return True, dog.owner_id == user.pk, dog.pk in favorite_ids
+
+
+_fingerprints = {}
+
+
+def template_fingerprint(variant: str) -> str:
+    """Short hash of the card template source.
+
+    Part of every key, so a deploy that changes the template never serves
+    HTML rendered by the old one from the shared cache. Computed once per
+    process, on every call with DEBUG.
+    """
+    if variant not in _fingerprints or settings.DEBUG:
+        source = get_template(DOG_CARD_TEMPLATES[variant]).template.source
+        _fingerprints[variant] = hashlib.blake2b(
+            source.encode(), digest_size=6
+        ).hexdigest()
+    return _fingerprints[variant]
+
+
+def card_cache_key(variant: str, dog: Dog, flags: tuple[bool, bool, bool]) -> str:
+    # updated_at changes on every save and on the update() calls of the photo
+    # pipeline and reconcile_photo_flags, so an edited dog never matches an
+    # old entry
+    stamp = dog.updated_at.timestamp() if dog.updated_at else 0
+    return (
+        f"dog-card:{variant}:{template_fingerprint(variant)}:{dog.pk}:{stamp}"
+        f":{''.join(str(int(f)) for f in flags)}"
+    )
+
+
+def render_dog_cards(dogs, user, variant: str = "list") -> list[str]:
+    """Rendered HTML of each card in ``dogs``, in order.
+
+    Cards are read with one ``get_many`` and only the misses are rendered
+    and stored with ``set_many``, so a fully cached page renders no card
+    templates at all. An entry does not depend on the page it was rendered
+    for: dog_list and favorites share the "list" cards.
+    """
+    dogs = list(dogs)
+    favorite_ids = set()
+    if user.is_authenticated and dogs:
+        favorite_ids = set(
+            Favorite.objects.filter(
+                user=user, dog_id__in=[dog.pk for dog in dogs]
+            ).values_list("dog_id", flat=True)
+        )
+
+    keys = {}
+    for dog in dogs:
+        flags = card_flags(dog, user, favorite_ids)
+        keys[dog.pk] = (card_cache_key(variant, dog, flags), flags)
+    cached = cache.get_many([key for key, _ in keys.values()])
+
+    missing = {}
+    template = None
+    for dog in dogs:
+        key, (signed_in, is_owner, is_favorite) = keys[dog.pk]
+        if key in cached or key in missing:
+            continue
+        template = template or get_template(DOG_CARD_TEMPLATES[variant])
+        missing[key] = template.render(
+            {
+                "dog": dog,
+                "signed_in": signed_in,
+                "is_owner": is_owner,
+                "is_favorite": is_favorite,
+            }
+        )
+    if missing:
+        cache.set_many(
+            missing, getattr(settings, "DOG_CARD_CACHE_TIMEOUT", DEFAULT_CARD_TIMEOUT)
+        )
+
+    cached.update(missing)
+    return [cached[keys[dog.pk][0]] for dog in dogs]
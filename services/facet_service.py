@@ -0,0 +1,171 @@
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Case, CharField, Count, Exists, Q, QuerySet, Value, When
+
+from dogs.models import Breed, Dog, normalize_breed_name
+from services.cache_service import DOG_VERSION, filter_signature, get_version
+from services.search_service import search_dogs
+
+# (key, label, age_min, age_max); the bounds map onto DogSearchForm fields
+AGE_BUCKETS = [
+    ("puppy", "до 1 года", 0, 1),
+    ("young", "2–4 года", 2, 4),
+    ("adult", "5–8 лет", 5, 8),
+    ("senior", "9 лет и старше", 9, None),
+]
+TOP_BREEDS = 10
+DEFAULT_FACETS_TIMEOUT = 600
+# Facet dimension -> (grouped column, DogSearchForm fields filtering on it)
+FACET_DIMENSIONS = {
+    "gender": ("gender", ("gender",)),
+    "size": ("size", ("size",)),
+    "age": ("age_bucket", ("age_min", "age_max")),
+    "breed": ("canonical_breed__name", ("breed",)),
+}
+
+
+def _age_bucket_expression() -> Case:
+    whens = [
+        When(age__lte=age_max, then=Value(key))
+        for key, _, _, age_max in AGE_BUCKETS
+        if age_max is not None
+    ]
+    return Case(*whens, default=Value(AGE_BUCKETS[-1][0]), output_field=CharField())
+
+
+def _facet_list(dimension: str, counts: Counter) -> list[dict]:
+    if dimension == "gender":
+        return [
+            {"value": value, "label": label, "count": counts[value]}
+            for value, label in Dog.GENDER_CHOICES
+        ]
+    if dimension == "size":
+        return [
+            {"value": value, "label": label, "count": counts[value]}
+            for value, label in Dog.SIZE_CHOICES
+        ]
+    if dimension == "age":
+        return [
+            {
+                "value": key,
+                "label": label,
+                "age_min": age_min,
+                "age_max": age_max,
+                "count": counts[key],
+            }
+            for key, label, age_min, age_max in AGE_BUCKETS
+        ]
+    return [
+        {"value": name, "label": name, "count": count}
+        for name, count in counts.most_common(TOP_BREEDS)
+        if name
+    ]
+
+
+def _breed_condition(breed: str) -> Q:
+    """``search_dogs`` breed filter as a condition, resolved inside the query.
+
+    A catalog breed (by name or alias) matches on ``canonical_breed``; an
+    unknown spelling falls back to the substring match on ``breed``.
+    """
+    key = normalize_breed_name(breed)
+    catalog = Breed.objects.filter(
+        Q(normalized_name=key) | Q(aliases__normalized_alias=key)
+    ).values("pk")
+    return Q(canonical_breed__in=catalog) | (
+        ~Exists(catalog) & Q(breed__icontains=breed)
+    )
+
+
+def _facet_conditions(filters: dict) -> dict[str, Q]:
+    """Conditions of the active facet filters, keyed by their dimension."""
+    conditions = {}
+    if filters.get("gender"):
+        conditions["gender"] = Q(gender=filters["gender"])
+    if filters.get("size"):
+        conditions["size"] = Q(size=filters["size"])
+    age = Q()
+    if filters.get("age_min") is not None:
+        age &= Q(age__gte=filters["age_min"])
+    if filters.get("age_max") is not None:
+        age &= Q(age__lte=filters["age_max"])
+    if age:
+        conditions["age"] = age
+    if filters.get("breed"):
+        conditions["breed"] = _breed_condition(filters["breed"])
+    return conditions
+
+
+def compute_facets(
+    dogs: QuerySet, dimensions=tuple(FACET_DIMENSIONS), conditions=None
+) -> dict:
+    """Count dogs of ``dimensions`` (gender, size, age bucket, breed) in one query.
+
+    The database groups by the combination of the dimensions (a few hundred
+    rows at most) and the per-dimension totals are summed in Python. Each
+    dimension counts only the rows matching the ``conditions`` of the other
+    dimensions, so its own filter never narrows it.
+    """
+    conditions = conditions or {}
+    columns = [FACET_DIMENSIONS[dimension][0] for dimension in dimensions]
+    totals = {}
+    for dimension in dimensions:
+        others = [q for name, q in conditions.items() if name != dimension]
+        condition = Q()
+        for q in others:
+            condition &= q
+        totals[f"total_{dimension}"] = Count("pk", filter=condition or None)
+    rows = (
+        dogs.order_by()
+        .annotate(age_bucket=_age_bucket_expression())
+        .values(*columns)
+        .annotate(**totals)
+    )
+
+    counts = {dimension: Counter() for dimension in dimensions}
+    for row in rows:
+        for dimension, column in zip(dimensions, columns):
+            # groups outside the other dimensions' filters count zero
+            if row[f"total_{dimension}"]:
+                counts[dimension][row[column]] += row[f"total_{dimension}"]
+    return {
+        dimension: _facet_list(dimension, counts[dimension]) for dimension in dimensions
+    }
+
+
+def compute_search_facets(filters: dict | None) -> dict:
+    """Facet counts for a search, each dimension without its own filter.
+
+    Disjunctive faceting: with ``gender=F`` the gender facet still counts
+    the males that its "M" link leads to, while size, age and breed count
+    only females. The facet filters become conditional counts over the
+    search without them, so any combination of filters costs one query.
+    """
+    filters = filters or {}
+    facet_fields = {
+        field for _, fields in FACET_DIMENSIONS.values() for field in fields
+    }
+    relaxed = {
+        name: value for name, value in filters.items() if name not in facet_fields
+    }
+    return compute_facets(search_dogs(relaxed), conditions=_facet_conditions(filters))
+
+
+def get_facets(filters: dict | None) -> dict:
+    """Return facet counts for ``filters``, cached per filter signature.
+
+    Keys include the global dog version, so any dog change invalidates all
+    cached facets without having to enumerate them.
+    """
+    key = f"dog-facets:{get_version(DOG_VERSION)}:{filter_signature(filters)}"
+    facets = cache.get(key)
+    if facets is None:
+        facets = compute_search_facets(filters)
+        cache.set(
+            key,
+            facets,
+            getattr(settings, "SEARCH_FACETS_CACHE_TIMEOUT", DEFAULT_FACETS_TIMEOUT),
+        )
+    return facets
@@ -2,6 +2,21 @@ from django.core.exceptions import PermissionDenied
 from django.db import transaction
 
 from dogs.models import Dog, Favorite
+from services.cache_service import FAVORITES_VERSION, bump_version, get_version
+
+
+def _favorites_namespace(user_id: int) -> str:
+    return f"{FAVORITES_VERSION}:{user_id}"
+
+
+def get_favorites_version(user_id: int) -> int:
+    """Cache generation of one user's favorites."""
+    return get_version(_favorites_namespace(user_id))
+
+
+def bump_favorites_version(user_id: int) -> None:
+    """Invalidate pages that show which dogs ``user_id`` has favorited."""
+    bump_version(_favorites_namespace(user_id))
 
 
 def toggle_favorite_for_user(user, dog_id: int) -> tuple[bool, str]:
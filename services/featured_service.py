@@ -0,0 +1,159 @@
+import random
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Q, QuerySet
+
+from dogs.models import Dog
+
+FEATURED_POOL_KEY = "featured-dogs:pool"
+FEATURED_LOCK_KEY = "featured-dogs:refresh-lock"
+FEATURED_FRACTION_KEY = "featured-dogs:eligible-fraction"
+DEFAULT_POOL_SIZE = 60
+DEFAULT_POOL_TIMEOUT = 600
+# The entry outlives FEATURED_POOL_TIMEOUT this many times over, so a stale
+# pool can be served while one request resamples it
+STALE_POOL_FACTOR = 6
+REFRESH_LOCK_TIMEOUT = 60
+# Oversample so that dogs filtered out after sampling do not shrink the pool
+TABLESAMPLE_OVERSAMPLING = 4
+
+
+def _pool_size() -> int:
+    return getattr(settings, "FEATURED_POOL_SIZE", DEFAULT_POOL_SIZE)
+
+
+def eligible_dogs() -> QuerySet:
+    """Active dogs whose photo file exists and has been processed."""
+    return Dog.objects.filter(
+        is_active=True, photo_available=True, photo_status=Dog.PHOTO_STATUS_READY
+    ).filter(Q(photo__isnull=False) & ~Q(photo=""))
+
+
+def _eligible_fraction(estimated_rows: int) -> float:
+    """Share of the table that ``eligible_dogs()`` keeps, cached with the pool.
+
+    Counting eligible dogs scans them, so it runs at most once per pool
+    lifetime, in the request that holds the refresh lock.
+    """
+    fraction = cache.get(FEATURED_FRACTION_KEY)
+    if fraction is None:
+        fraction = min(eligible_dogs().count() / max(estimated_rows, 1), 1.0)
+        cache.set(FEATURED_FRACTION_KEY, fraction, _pool_timeout() * STALE_POOL_FACTOR)
+    return fraction
+
+
+def _sample_percent(size: int, estimated_rows: int, eligible_fraction: float) -> float:
+    """TABLESAMPLE percentage expected to yield ``size`` eligible rows, oversampled."""
+    expected_eligible = max(estimated_rows * eligible_fraction, 1)
+    return min(100.0, 100.0 * size * TABLESAMPLE_OVERSAMPLING / expected_eligible)
+
+
+def _tablesample_ids(size: int) -> list[int]:
+    """Sample candidate IDs with ``TABLESAMPLE BERNOULLI`` on PostgreSQL.
+
+    The sampling percentage is derived from the planner's row estimate
+    scaled by the share of eligible dogs, so only a fraction of the table
+    pages is read. A short sample is retried once with a larger percentage
+    before the caller falls back to a full scan. The statement spells out
+    the conditions of ``eligible_dogs()``, which the ORM cannot attach a
+    TABLESAMPLE clause to.
+    """
+    table = Dog._meta.db_table
+    qn = connection.ops.quote_name
+
+    def column(name):
+        return qn(Dog._meta.get_field(name).column)
+
+    sql = (
+        f"SELECT {qn(Dog._meta.pk.column)} FROM {qn(table)}"
+        " TABLESAMPLE BERNOULLI (%s)"
+        f" WHERE {column('is_active')} AND {column('photo_available')}"
+        f" AND {column('photo_status')} = %s"
+        f" AND {column('photo')} IS NOT NULL AND {column('photo')} <> ''"
+        " LIMIT %s"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT reltuples FROM pg_class WHERE relname = %s", [table])
+        row = cursor.fetchone()
+        estimated_rows = max(int(row[0]) if row else 0, 1)
+        fraction = _eligible_fraction(estimated_rows)
+        if not fraction:
+            return []
+        percent = _sample_percent(size, estimated_rows, fraction)
+        for _ in range(2):
+            cursor.execute(sql, [percent, Dog.PHOTO_STATUS_READY, size])
+            ids = [pk for (pk,) in cursor.fetchall()]
+            if len(ids) >= size or percent >= 100.0:
+                break
+            percent = min(100.0, percent * TABLESAMPLE_OVERSAMPLING)
+        return ids
+
+
+def _reservoir_ids(size: int) -> list[int]:
+    """Uniform sample of IDs in one streaming pass over the pk index."""
+    sample = []
+    pk_stream = eligible_dogs().order_by().values_list("pk", flat=True)
+    for seen, pk in enumerate(pk_stream.iterator(chunk_size=2000)):
+        if seen < size:
+            sample.append(pk)
+        else:
+            slot = random.randint(0, seen)
+            if slot < size:
+                sample[slot] = pk
+    return sample
+
+
+def _pool_timeout() -> int:
+    return getattr(settings, "FEATURED_POOL_TIMEOUT", DEFAULT_POOL_TIMEOUT)
+
+
+def refresh_featured_pool() -> list[int]:
+    """Resample the featured pool and store it in the shared cache.
+
+    The entry records when it goes stale and is kept ``STALE_POOL_FACTOR``
+    times longer, so readers keep serving it while it is being resampled.
+    Every worker reads it from the shared cache, so the
+    ``refresh_featured_pool`` command refreshes the pool of the whole site.
+    """
+    size = _pool_size()
+    candidate_ids = []
+    if connection.vendor == "postgresql":
+        candidate_ids = _tablesample_ids(size)
+    if len(candidate_ids) < size:
+        candidate_ids = _reservoir_ids(size)
+
+    # photo_available is part of eligible_dogs(), so no storage checks here
+    pool = list(candidate_ids)
+
+    timeout = _pool_timeout()
+    cache.set(
+        FEATURED_POOL_KEY,
+        {"ids": pool, "fresh_until": time.time() + timeout},
+        timeout * STALE_POOL_FACTOR,
+    )
+    return pool
+
+
+def get_featured_dogs(count: int = 6) -> list[Dog]:
+    """Pick ``count`` random dogs from the cached pool.
+
+    Only a primary-key lookup hits the database. Once the pool is stale, the
+    one request that takes the ``cache.add`` lock resamples it while the
+    others keep picking from the stale pool; without any pool (cold cache)
+    the others show no featured dogs rather than all sampling at once.
+    """
+    entry = cache.get(FEATURED_POOL_KEY)
+    pool = entry["ids"] if entry else []
+    if entry is None or entry["fresh_until"] <= time.time():
+        if cache.add(FEATURED_LOCK_KEY, True, REFRESH_LOCK_TIMEOUT):
+            try:
+                pool = refresh_featured_pool()
+            finally:
+                cache.delete(FEATURED_LOCK_KEY)
+
+    picked = random.sample(pool, min(count, len(pool)))
+    dogs = Dog.objects.filter(pk__in=picked, is_active=True).in_bulk()
+    return [dogs[pk] for pk in picked if pk in dogs]
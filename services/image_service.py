@@ -0,0 +1,220 @@
+import logging
+import posixpath
+from concurrent.futures import Executor
+from itertools import islice
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db.models.fields.files import FieldFile
+from django.utils import timezone
+from PIL import Image, UnidentifiedImageError
+
+from dogs.models import Dog, UserProfile
+from dogs.utils import IMAGE_FORMATS, encode_image, make_lqip, resize_image
+from services.cache_service import DOG_VERSION, bump_version
+
+logger = logging.getLogger(__name__)
+
+# name: (max width, max height), smallest first
+DOG_RENDITION_SIZES = {
+    "thumb": (160, 160),
+    "card": (400, 400),
+    "detail": (1200, 900),
+}
+AVATAR_RENDITION_SIZES = {
+    "thumb": (80, 80),
+    "card": (240, 240),
+}
+# WebP first: <picture> uses the first <source> the browser supports
+RENDITION_FORMATS = ("webp", "jpeg")
+RENDITIONS_DIR = "renditions"
+DEFAULT_RENDITION_QUALITY = 82
+
+
+def rendition_name(source_name: str, size: str, image_format: str) -> str:
+    """Storage name of one rendition, e.g. ``renditions/dogs/rex/card.webp``."""
+    stem, _ = posixpath.splitext(source_name)
+    extension = IMAGE_FORMATS[image_format][1]
+    return f"{RENDITIONS_DIR}/{stem}/{size}.{extension}"
+
+
+def open_image(field_file: FieldFile, *, fail_silently: bool = True):
+    """Decode ``field_file`` into a Pillow image.
+
+    Returns None for an unreadable file; with ``fail_silently=False`` the
+    error is raised instead, so the photo queue can retry the job.
+    """
+    try:
+        with field_file.open("rb") as source, Image.open(source) as original:
+            original.load()
+    except (OSError, UnidentifiedImageError) as exc:
+        if not fail_silently:
+            raise
+        logger.warning("Cannot read %s for renditions: %s", field_file.name, exc)
+        return None
+    return original
+
+
+def write_renditions(original, source_name: str, storage, sizes: dict) -> dict:
+    """Resize a decoded image to every size/format and save the results.
+
+    Returns the metadata stored next to the image, e.g.::
+
+        {"card": {"width": 400, "height": 300,
+                  "webp": "renditions/dogs/rex/card.webp",
+                  "jpeg": "renditions/dogs/rex/card.jpg"}}
+    """
+    quality = getattr(settings, "IMAGE_RENDITION_QUALITY", DEFAULT_RENDITION_QUALITY)
+    renditions = {}
+    for size, (max_width, max_height) in sizes.items():
+        image = resize_image(original, max_width, max_height)
+        entry = {"width": image.width, "height": image.height}
+        for image_format in RENDITION_FORMATS:
+            name = rendition_name(source_name, size, image_format)
+            if storage.exists(name):
+                storage.delete(name)
+            encoded = encode_image(image, image_format, quality)
+            entry[image_format] = storage.save(name, ContentFile(encoded.read()))
+        renditions[size] = entry
+    return renditions
+
+
+def generate_renditions(
+    field_file: FieldFile, sizes: dict, *, fail_silently: bool = True
+) -> dict:
+    """Write every size/format rendition of ``field_file`` to its storage.
+
+    The original is decoded once and each size is resized from it. An
+    unreadable original yields an empty dict, so callers keep showing the
+    original or the placeholder.
+    """
+    original = open_image(field_file, fail_silently=fail_silently)
+    if original is None:
+        return {}
+    return write_renditions(original, field_file.name, field_file.storage, sizes)
+
+
+def render_dog_photo(
+    field_file: FieldFile, *, fail_silently: bool = True
+) -> tuple[dict, str]:
+    """Renditions and the inline LQIP preview of a dog photo, one decode."""
+    original = open_image(field_file, fail_silently=fail_silently)
+    if original is None:
+        return {}, ""
+    renditions = write_renditions(
+        original, field_file.name, field_file.storage, DOG_RENDITION_SIZES
+    )
+    return renditions, make_lqip(original)
+
+
+def process_dog_photo(dog: Dog) -> dict:
+    """Generate and store renditions for a dog's photo right away.
+
+    Uploads go through the ``process_images`` queue instead; this is for
+    offline tools such as ``backfill_renditions``, which invalidates cached
+    dog listings once at the end.
+    """
+    renditions, lqip = render_dog_photo(dog.photo) if dog.photo else ({}, "")
+    if renditions:
+        status = Dog.PHOTO_STATUS_READY
+    elif dog.photo:
+        status = Dog.PHOTO_STATUS_FAILED
+    else:
+        status = Dog.PHOTO_STATUS_NONE
+    # update() keeps this out of the save signals
+    Dog.objects.filter(pk=dog.pk).update(
+        photo_renditions=renditions,
+        photo_lqip=lqip,
+        photo_status=status,
+        updated_at=timezone.now(),
+    )
+    dog.photo_renditions = renditions
+    dog.photo_lqip = lqip
+    dog.photo_status = status
+    return renditions
+
+
+def process_avatar(profile: UserProfile) -> dict:
+    """Generate and store renditions for a user's avatar."""
+    renditions = (
+        generate_renditions(profile.avatar, AVATAR_RENDITION_SIZES)
+        if profile.avatar
+        else {}
+    )
+    UserProfile.objects.filter(pk=profile.pk).update(avatar_renditions=renditions)
+    profile.avatar_renditions = renditions
+    return renditions
+
+
+def backfill_renditions(*, force: bool = False, batch_size: int = 200) -> dict:
+    """Generate missing renditions for existing dog photos and avatars.
+
+    With ``force`` every image is re-rendered, e.g. after changing sizes.
+    """
+    dogs = Dog.objects.filter(photo_available=True).exclude(photo="")
+    profiles = UserProfile.objects.exclude(avatar="").exclude(avatar__isnull=True)
+    if not force:
+        dogs = dogs.filter(photo_renditions={})
+        profiles = profiles.filter(avatar_renditions={})
+
+    processed = {"dogs": 0, "avatars": 0}
+    for dog in dogs.only("pk", "photo").iterator(chunk_size=batch_size):
+        if process_dog_photo(dog):
+            processed["dogs"] += 1
+    for profile in profiles.only("pk", "avatar").iterator(chunk_size=batch_size):
+        if process_avatar(profile):
+            processed["avatars"] += 1
+    if processed["dogs"]:
+        # update() skips signals, so invalidate cached listings explicitly
+        bump_version(DOG_VERSION)
+    return processed
+
+
+def compute_lqip_job(dog_id: int, photo_name: str, thumb_name: str) -> tuple[int, str]:
+    """Build the LQIP of one dog photo. Runs in a worker process.
+
+    The small JPEG thumb rendition is decoded when it exists, the original
+    only as a fallback. Nothing is written; the parent stores the result.
+    """
+    field = Dog._meta.get_field("photo")
+    if thumb_name:
+        image = open_image(FieldFile(None, field, thumb_name))
+        if image is not None:
+            return dog_id, make_lqip(image)
+    image = open_image(FieldFile(None, field, photo_name))
+    return dog_id, make_lqip(image) if image is not None else ""
+
+
+def backfill_lqip(
+    executor: Executor | None = None, *, force: bool = False, batch_size: int = 200
+) -> int:
+    """Compute missing LQIP previews for ready dog photos.
+
+    Jobs of each batch run on ``executor`` (normally a ``ProcessPoolExecutor``)
+    or inline when it is None; results are written with one UPDATE per photo
+    that is skipped if the photo was replaced meanwhile. Returns the number
+    of previews stored.
+    """
+    dogs = Dog.objects.filter(photo_status=Dog.PHOTO_STATUS_READY).exclude(photo="")
+    if not force:
+        dogs = dogs.filter(photo_lqip="")
+    rows = dogs.order_by("pk").values_list("pk", "photo", "photo_renditions")
+
+    updated = 0
+    rows = rows.iterator(chunk_size=batch_size)
+    while batch := list(islice(rows, batch_size)):
+        photos = {dog_id: photo_name for dog_id, photo_name, _ in batch}
+        jobs = [
+            (dog_id, photo_name, (renditions.get("thumb") or {}).get("jpeg", ""))
+            for dog_id, photo_name, renditions in batch
+        ]
+        run = executor.map if executor is not None else map
+        for dog_id, lqip in run(compute_lqip_job, *zip(*jobs)):
+            if lqip:
+                updated += Dog.objects.filter(pk=dog_id, photo=photos[dog_id]).update(
+                    photo_lqip=lqip, updated_at=timezone.now()
+                )
+    if updated:
+        # update() skips signals, so invalidate cached listings explicitly
+        bump_version(DOG_VERSION)
+    return updated
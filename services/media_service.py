@@ -0,0 +1,219 @@
+import os
+import posixpath
+import time
+from collections.abc import Iterator
+from datetime import timedelta
+from itertools import islice
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from dogs.models import Dog, StoredFile, UserProfile
+from services.cache_service import DOG_VERSION, bump_version
+from services.image_service import RENDITIONS_DIR
+
+DOG_PHOTO_DIR = "dogs"
+AVATAR_DIR = "avatars"
+# Directories gc_media may delete from; anything else in MEDIA_ROOT is left alone
+GC_MEDIA_DIRS = (DOG_PHOTO_DIR, AVATAR_DIR, RENDITIONS_DIR)
+# Temporary files of ContentAddressedStorage uploads in progress
+UPLOAD_TEMP_PREFIX = ".upload-"
+DEFAULT_GC_GRACE_PERIOD = timedelta(hours=24)
+# Extensions an original of a rendition may have: JPEG, PNG and WebP uploads
+# (see dogs.validators), lower case as ContentAddressedStorage stores them and
+# upper case for names saved before it
+ORIGINAL_EXTENSIONS = tuple(
+    extension
+    for lower in (".jpg", ".jpeg", ".jpe", ".jfif", ".png", ".webp")
+    for extension in (lower, lower.upper())
+)
+
+
+def iter_media_files(subdir: str = "", root=None) -> Iterator[os.DirEntry]:
+    """Yield file entries under ``MEDIA_ROOT/subdir`` one at a time.
+
+    Uses ``os.scandir`` so memory stays flat no matter how many files there
+    are. Entry paths can be turned into storage names with
+    :func:`storage_name`.
+    """
+    root = os.fspath(root or settings.MEDIA_ROOT)
+    stack = [os.path.join(root, subdir) if subdir else root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+        except FileNotFoundError:
+            continue
+
+
+def storage_name(path: str, root=None) -> str:
+    """Convert an absolute media path to the name stored in a FileField."""
+    root = os.fspath(root or settings.MEDIA_ROOT)
+    return os.path.relpath(path, root).replace(os.sep, "/")
+
+
+def _batched(iterable, size: int):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def reconcile_photo_flags(*, batch_size: int = 500, dry_run: bool = False) -> dict:
+    """Bring ``Dog.photo_available`` back in line with the media directory.
+
+    Pass 1 streams file names from ``MEDIA_ROOT/dogs`` in batches and marks
+    dogs whose file exists. Pass 2 walks the dogs flagged as available in
+    primary-key batches and clears the flag when their file is gone.
+    Changed dogs get a new ``updated_at``, which keys their cached cards and
+    page validators, and cached dog listings are invalidated.
+    """
+    marked = cleared = 0
+
+    names = (storage_name(entry.path) for entry in iter_media_files(DOG_PHOTO_DIR))
+    for batch in _batched(names, batch_size):
+        stale = Dog.objects.filter(photo__in=batch, photo_available=False)
+        marked += (
+            stale.count()
+            if dry_run
+            else stale.update(photo_available=True, updated_at=timezone.now())
+        )
+
+    flagged = (
+        Dog.objects.filter(photo_available=True)
+        .exclude(Q(photo="") | Q(photo__isnull=True))
+        .order_by("pk")
+    )
+    last_pk = 0
+    while True:
+        batch = list(flagged.filter(pk__gt=last_pk).only("pk", "photo")[:batch_size])
+        if not batch:
+            break
+        last_pk = batch[-1].pk
+        missing = [
+            dog.pk for dog in batch if not dog.photo.storage.exists(dog.photo.name)
+        ]
+        if missing and not dry_run:
+            Dog.objects.filter(pk__in=missing).update(
+                photo_available=False, updated_at=timezone.now()
+            )
+        cleared += len(missing)
+
+    if (marked or cleared) and not dry_run:
+        # update() skips the post_save signal that normally bumps the version
+        bump_version(DOG_VERSION)
+    return {"marked": marked, "cleared": cleared}
+
+
+def _referenced_names(names: list[str]) -> set[str]:
+    """Names from ``names`` still used by a model or holding a storage reference."""
+    return (
+        set(Dog.objects.filter(photo__in=names).values_list("photo", flat=True))
+        | set(
+            UserProfile.objects.filter(avatar__in=names).values_list(
+                "avatar", flat=True
+            )
+        )
+        | set(StoredFile.objects.filter(name__in=names).values_list("name", flat=True))
+    )
+
+
+def _referenced_stems(stems: list[str]) -> set[str]:
+    """Stems from ``stems`` whose original image is still used.
+
+    Renditions live in ``renditions/<stem>/`` and do not record the extension
+    of their original, so the possible original names are derived from
+    ``ORIGINAL_EXTENSIONS`` and matched with one ``IN`` list per model
+    instead of an OR of prefix conditions per stem.
+    """
+    names = [stem + extension for stem in stems for extension in ORIGINAL_EXTENSIONS]
+    photos = Dog.objects.filter(photo__in=names).values_list("photo", flat=True)
+    avatars = UserProfile.objects.filter(avatar__in=names).values_list(
+        "avatar", flat=True
+    )
+    return {posixpath.splitext(name)[0] for name in [*photos, *avatars]}
+
+
+def _find_orphans(batch: list[tuple[os.DirEntry, str]]) -> list[os.DirEntry]:
+    names, stems = [], []
+    for entry, name in batch:
+        if entry.name.startswith(UPLOAD_TEMP_PREFIX):
+            continue
+        if name.startswith(f"{RENDITIONS_DIR}/"):
+            stems.append(posixpath.dirname(name)[len(RENDITIONS_DIR) + 1 :])
+        else:
+            names.append(name)
+
+    referenced = _referenced_names(names) if names else set()
+    referenced_stems = _referenced_stems(stems) if stems else set()
+    orphans = []
+    for entry, name in batch:
+        if entry.name.startswith(UPLOAD_TEMP_PREFIX):
+            # Abandoned upload: the grace period already passed
+            orphans.append(entry)
+        elif name.startswith(f"{RENDITIONS_DIR}/"):
+            stem = posixpath.dirname(name)[len(RENDITIONS_DIR) + 1 :]
+            if stem not in referenced_stems:
+                orphans.append(entry)
+        elif name not in referenced:
+            orphans.append(entry)
+    return orphans
+
+
+def _remove_empty_dirs(path: str, top: str) -> None:
+    """Remove ``path``'s parent directories below ``top`` while they are empty."""
+    directory = os.path.dirname(path)
+    while os.path.normpath(directory) != os.path.normpath(top):
+        try:
+            os.rmdir(directory)
+        except OSError:
+            break
+        directory = os.path.dirname(directory)
+
+
+def collect_orphaned_media(
+    *,
+    grace_period: timedelta = DEFAULT_GC_GRACE_PERIOD,
+    batch_size: int = 500,
+    dry_run: bool = False,
+) -> dict:
+    """Delete media files no longer referenced from the database.
+
+    Dog photos, avatars and renditions are streamed from disk with
+    ``os.scandir`` and checked against the database in batches of
+    ``batch_size`` names, so memory does not grow with the number of files.
+    Originals are kept while a dog, a profile or a ``StoredFile`` refers to
+    them, renditions while their original is used. Files modified within
+    ``grace_period`` are never touched, which protects uploads whose
+    transaction has not committed yet. Returns counts of "scanned" files,
+    "deleted" orphans and reclaimed "bytes" (what would be, with ``dry_run``).
+    """
+    root = os.fspath(settings.MEDIA_ROOT)
+    cutoff = time.time() - grace_period.total_seconds()
+    stats = {"scanned": 0, "deleted": 0, "bytes": 0}
+
+    def candidates():
+        for subdir in GC_MEDIA_DIRS:
+            for entry in iter_media_files(subdir, root):
+                stats["scanned"] += 1
+                if entry.stat().st_mtime < cutoff:
+                    yield entry, storage_name(entry.path, root)
+
+    for batch in _batched(candidates(), batch_size):
+        for entry in _find_orphans(batch):
+            size = entry.stat().st_size
+            if not dry_run:
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    continue
+                top = storage_name(entry.path, root).split("/", 1)[0]
+                _remove_empty_dirs(entry.path, os.path.join(root, top))
+            stats["deleted"] += 1
+            stats["bytes"] += size
+    return stats
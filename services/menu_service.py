@@ -0,0 +1,97 @@
+from django.template.loader import get_template
+
+from menu_app.models import MenuItem
+from services.cache_service import MENU_VERSION, bump_version, get_version
+
+
+def bump_menu_version() -> None:
+    """Invalidate the in-memory menu trees in every process."""
+    bump_version(MENU_VERSION)
+
+
+def build_menu(menu_name: str) -> dict:
+    """Load a menu with one query and precompute everything a request needs.
+
+    Returns ``tree`` (root nodes ``{"id", "title", "url", "children"}`` in
+    display order), the ``active`` index mapping each URL to the ids of the
+    items it activates (the items with that URL plus all their ancestors,
+    read from the materialized path) and an empty ``html`` cache. The state
+    is shared between requests and must not be mutated.
+    """
+    items = (
+        MenuItem.objects.filter(menu__name=menu_name)
+        .only("id", "parent_id", "title", "url", "named_url", "path")
+        .order_by("order", "id")
+    )
+    nodes = {}
+    active = {}
+    for item in items:
+        nodes[item.id] = {
+            "id": item.id,
+            "title": item.title,
+            "url": item.get_url(),
+            "children": [],
+        }
+        active.setdefault(nodes[item.id]["url"], set()).update(
+            [*item.get_ancestor_ids(), item.id]
+        )
+
+    roots = []
+    for item in items:
+        if item.parent_id is None:
+            roots.append(nodes[item.id])
+        elif item.parent_id in nodes:
+            nodes[item.parent_id]["children"].append(nodes[item.id])
+    return {
+        "tree": roots,
+        "active": {url: frozenset(ids) for url, ids in active.items()},
+        "html": {},
+    }
+
+
+_menus = {}
+_menus_version = None
+
+
+def get_request_menu_version(request) -> int:
+    """MENU_VERSION read once per request and shared by all menus on the page."""
+    if request is None:
+        return get_version(MENU_VERSION)
+    if not hasattr(request, "_menu_version"):
+        request._menu_version = get_version(MENU_VERSION)
+    return request._menu_version
+
+
+def get_menu(menu_name: str, version: int | None = None) -> dict:
+    """Return the process-local state of ``menu_name``, rebuilding it when stale.
+
+    See :func:`build_menu`. A fresh menu costs one cache read for the
+    version (none when the caller passes ``version``) and no queries.
+    """
+    global _menus_version
+
+    if version is None:
+        version = get_version(MENU_VERSION)
+    if version != _menus_version:
+        _menus.clear()
+        _menus_version = version
+    if menu_name not in _menus:
+        _menus[menu_name] = build_menu(menu_name)
+    return _menus[menu_name]
+
+
+def render_menu(menu_name: str, current_url: str, version: int | None = None) -> str:
+    """Return the menu HTML with the branch of ``current_url`` expanded.
+
+    HTML is rendered once per distinct active branch, so the number of
+    cached fragments is bounded by the number of menu URLs.
+    """
+    menu = get_menu(menu_name, version)
+    active_ids = menu["active"].get(current_url, frozenset())
+    html = menu["html"].get(active_ids)
+    if html is None:
+        html = get_template("menu/menu.html").render(
+            {"menu_items": menu["tree"], "active_ids": active_ids}
+        )
+        menu["html"][active_ids] = html
+    return html
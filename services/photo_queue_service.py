@@ -0,0 +1,162 @@
+import logging
+from collections import Counter
+from concurrent.futures import Executor, as_completed
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, F, Value, When
+from django.db.models.fields.files import FieldFile
+from django.utils import timezone
+
+from dogs.models import Dog
+from services.cache_service import DOG_VERSION, bump_version
+from services.image_service import render_dog_photo
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ATTEMPTS = 3
+
+
+def max_attempts() -> int:
+    return getattr(settings, "IMAGE_WORKER_MAX_ATTEMPTS", DEFAULT_MAX_ATTEMPTS)
+
+
+def init_worker() -> None:
+    """Process-pool initializer: make Django usable under spawn/forkserver."""
+    import django
+    from django.apps import apps
+
+    if not apps.ready:
+        django.setup()
+
+
+def render_photo_job(dog_id: int, photo_name: str) -> tuple[int, dict, str]:
+    """Render one dog photo. Runs in a worker process.
+
+    Only storage is touched here; all database writes happen in the parent,
+    so workers never share or open database connections.
+    """
+    field_file = FieldFile(None, Dog._meta.get_field("photo"), photo_name)
+    renditions, lqip = render_dog_photo(field_file, fail_silently=False)
+    return dog_id, renditions, lqip
+
+
+def claim_photo_jobs(limit: int) -> list[tuple[int, str]]:
+    """Move up to ``limit`` pending photos to "processing" and return them.
+
+    On PostgreSQL rows locked by another worker are skipped, so several
+    ``process_images`` commands can drain the same queue.
+    """
+    with transaction.atomic():
+        jobs = list(
+            Dog.objects.select_for_update(skip_locked=True)
+            .filter(photo_status=Dog.PHOTO_STATUS_PENDING)
+            .order_by("updated_at")
+            .values_list("pk", "photo")[:limit]
+        )
+        Dog.objects.filter(pk__in=[pk for pk, _ in jobs]).update(
+            photo_status=Dog.PHOTO_STATUS_PROCESSING
+        )
+    return jobs
+
+
+def complete_photo_job(
+    dog_id: int, photo_name: str, renditions: dict, lqip: str = ""
+) -> bool:
+    """Store renditions and LQIP unless the photo was replaced while rendering."""
+    return bool(
+        Dog.objects.filter(
+            pk=dog_id, photo=photo_name, photo_status=Dog.PHOTO_STATUS_PROCESSING
+        ).update(
+            photo_renditions=renditions,
+            photo_lqip=lqip,
+            photo_status=Dog.PHOTO_STATUS_READY,
+            updated_at=timezone.now(),
+        )
+    )
+
+
+def fail_photo_job(dog_id: int, photo_name: str, attempts_limit: int) -> str:
+    """Requeue a failed job, or mark it failed once attempts run out."""
+    Dog.objects.filter(
+        pk=dog_id, photo=photo_name, photo_status=Dog.PHOTO_STATUS_PROCESSING
+    ).update(
+        photo_status=Case(
+            When(
+                photo_attempts__gte=attempts_limit - 1,
+                then=Value(Dog.PHOTO_STATUS_FAILED),
+            ),
+            default=Value(Dog.PHOTO_STATUS_PENDING),
+        ),
+        photo_attempts=F("photo_attempts") + 1,
+        # Retries go to the back of the queue
+        updated_at=timezone.now(),
+    )
+    return (
+        Dog.objects.filter(pk=dog_id).values_list("photo_status", flat=True).first()
+        or Dog.PHOTO_STATUS_NONE
+    )
+
+
+def requeue_stuck_jobs() -> int:
+    """Return "processing" rows left behind by a killed worker to the queue."""
+    return Dog.objects.filter(photo_status=Dog.PHOTO_STATUS_PROCESSING).update(
+        photo_status=Dog.PHOTO_STATUS_PENDING
+    )
+
+
+def _run_jobs(jobs, executor):
+    """Yield ``(dog_id, photo_name, (renditions, lqip), error)`` as jobs finish."""
+    if executor is None:
+        for dog_id, photo_name in jobs:
+            try:
+                yield dog_id, photo_name, render_photo_job(dog_id, photo_name)[1:], None
+            except Exception as exc:
+                yield dog_id, photo_name, None, exc
+        return
+
+    futures = {
+        executor.submit(render_photo_job, dog_id, photo_name): (dog_id, photo_name)
+        for dog_id, photo_name in jobs
+    }
+    for future in as_completed(futures):
+        dog_id, photo_name = futures[future]
+        try:
+            yield dog_id, photo_name, future.result()[1:], None
+        except Exception as exc:
+            yield dog_id, photo_name, None, exc
+
+
+def process_photo_queue(
+    executor: Executor | None = None,
+    *,
+    batch_size: int = 8,
+    attempts_limit: int | None = None,
+) -> Counter:
+    """Drain the photo queue, rendering ``batch_size`` photos at a time.
+
+    Jobs run on ``executor`` (normally a ``ProcessPoolExecutor``) or inline
+    when it is None. At most one batch is in flight, which bounds memory use
+    to ``batch_size`` decoded images. Cached dog listings are invalidated
+    once per batch that stored or failed a photo. Returns counts of "ready",
+    "retried", "failed" and "skipped" (photo replaced while rendering) jobs.
+    """
+    attempts_limit = attempts_limit or max_attempts()
+    stats = Counter()
+    while jobs := claim_photo_jobs(batch_size):
+        changed = False
+        for dog_id, photo_name, result, error in _run_jobs(jobs, executor):
+            if error is None:
+                stored = complete_photo_job(dog_id, photo_name, *result)
+                stats["ready" if stored else "skipped"] += 1
+                changed = changed or stored
+                continue
+
+            logger.warning("Rendering photo of dog %s failed: %s", dog_id, error)
+            status = fail_photo_job(dog_id, photo_name, attempts_limit)
+            stats["failed" if status == Dog.PHOTO_STATUS_FAILED else "retried"] += 1
+            changed = changed or status == Dog.PHOTO_STATUS_FAILED
+        if changed:
+            # update() skips the post_save signal that normally bumps the version
+            bump_version(DOG_VERSION)
+    return stats
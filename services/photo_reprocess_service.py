@@ -0,0 +1,166 @@
+import logging
+import posixpath
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import Executor, as_completed
+from datetime import datetime
+
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.db.models.fields.files import FieldFile
+from django.utils import timezone
+from PIL import Image, ImageOps
+
+from dogs.models import Dog
+from dogs.utils import IMAGE_FORMATS, encode_image
+from services.cache_service import DOG_VERSION, bump_version
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REPROCESS_QUALITY = 85
+# Orientation, camera, GPS: everything a web photo does not need
+METADATA_KEYS = ("exif", "xmp", "XML:com.adobe.xmp", "comment")
+# A photo without metadata is rewritten only if re-encoding saves this share
+# of its size; below that it is already at (or under) the target quality
+MIN_REENCODE_SAVING = 0.1
+
+
+def has_metadata(image: Image.Image) -> bool:
+    return any(image.info.get(key) for key in METADATA_KEYS)
+
+
+def normalize_photo_job(
+    dog_id: int, photo_name: str, quality: int
+) -> tuple[int, bytes | None, str, int]:
+    """Re-encode one dog photo at ``quality`` without metadata.
+
+    Runs in a worker process. The EXIF orientation is applied to the
+    pixels, so the result displays upright everywhere. A photo without
+    metadata whose re-encoding would not save ``MIN_REENCODE_SAVING`` of
+    its size is at the target quality already (e.g. normalized by an
+    earlier run) and comes back with ``None`` instead of data, so repeated
+    runs write nothing. Only storage is read; the parent saves the result
+    and swaps the reference.
+    """
+    field_file = FieldFile(None, Dog._meta.get_field("photo"), photo_name)
+    with field_file.open("rb") as source, Image.open(source) as image:
+        original_size = field_file.size
+        image_format = "webp" if image.format == "WEBP" else "jpeg"
+        upright = ImageOps.exif_transpose(image)
+        data = encode_image(upright, image_format, quality).getvalue()
+        if not has_metadata(image) and len(data) > original_size * (
+            1 - MIN_REENCODE_SAVING
+        ):
+            return dog_id, None, "", original_size
+    return dog_id, data, IMAGE_FORMATS[image_format][1], original_size
+
+
+def swap_photo(dog_id: int, old_name: str, new_name: str) -> bool:
+    """Point the dog at ``new_name`` unless its photo changed meanwhile.
+
+    The swap is a single filtered UPDATE; renditions are queued again so
+    they are re-rendered from the upright image. The old file is released
+    after commit, the new one right away if the swap lost the race.
+    """
+    storage = Dog._meta.get_field("photo").storage
+    with transaction.atomic():
+        swapped = Dog.objects.filter(pk=dog_id, photo=old_name).update(
+            photo=new_name,
+            photo_renditions={},
+            photo_lqip="",
+            photo_status=Dog.PHOTO_STATUS_PENDING,
+            photo_attempts=0,
+            updated_at=timezone.now(),
+        )
+        if swapped:
+            transaction.on_commit(lambda: storage.delete(old_name))
+    if not swapped:
+        storage.delete(new_name)
+    return bool(swapped)
+
+
+def _run_jobs(jobs, executor, quality):
+    """Yield ``(dog_id, photo_name, result, error)`` as jobs finish."""
+    if executor is None:
+        for dog_id, photo_name in jobs:
+            try:
+                result = normalize_photo_job(dog_id, photo_name, quality)
+            except Exception as exc:
+                yield dog_id, photo_name, None, exc
+            else:
+                yield dog_id, photo_name, result[1:], None
+        return
+
+    futures = {
+        executor.submit(normalize_photo_job, dog_id, photo_name, quality): (
+            dog_id,
+            photo_name,
+        )
+        for dog_id, photo_name in jobs
+    }
+    for future in as_completed(futures):
+        dog_id, photo_name = futures[future]
+        try:
+            yield dog_id, photo_name, future.result()[1:], None
+        except Exception as exc:
+            yield dog_id, photo_name, None, exc
+
+
+def reprocess_photos(
+    executor: Executor | None = None,
+    *,
+    since: datetime | None = None,
+    quality: int = DEFAULT_REPROCESS_QUALITY,
+    batch_size: int = 32,
+    start_after: int = 0,
+    on_batch: Callable[[int, Counter], None] | None = None,
+) -> Counter:
+    """Re-encode dog photos upright, without metadata, at ``quality``.
+
+    Dogs are walked in primary-key order after ``start_after`` (optionally
+    only those updated ``since`` a moment). Each batch is decoded and
+    re-encoded on ``executor`` (normally a ``ProcessPoolExecutor``) or inline
+    when it is None; the parent stores the new files and swaps references.
+    ``on_batch(last_pk, stats)`` is called after every batch, which lets the
+    caller save a checkpoint. Returns counts of "processed", "skipped",
+    "failed" and "stale" (photo replaced meanwhile) photos plus the
+    "bytes_before"/"bytes_after" of the processed ones.
+    """
+    field = Dog._meta.get_field("photo")
+    dogs = Dog.objects.exclude(photo="").exclude(photo__isnull=True)
+    if since is not None:
+        dogs = dogs.filter(updated_at__gte=since)
+    dogs = dogs.order_by("pk").values_list("pk", "photo")
+
+    stats = Counter()
+    last_pk = start_after
+    while batch := list(dogs.filter(pk__gt=last_pk)[:batch_size]):
+        last_pk = batch[-1][0]
+        for dog_id, photo_name, result, error in _run_jobs(batch, executor, quality):
+            if error is not None:
+                logger.warning("Reprocessing photo of dog %s failed: %s", dog_id, error)
+                stats["failed"] += 1
+                continue
+
+            data, extension, original_size = result
+            if data is None:
+                stats["skipped"] += 1
+                continue
+            stem = posixpath.splitext(posixpath.basename(photo_name))[0]
+            new_name = field.storage.save(
+                field.generate_filename(None, f"{stem}.{extension}"), ContentFile(data)
+            )
+            if swap_photo(dog_id, photo_name, new_name):
+                stats["processed"] += 1
+                stats["bytes_before"] += original_size
+                stats["bytes_after"] += len(data)
+            else:
+                stats["stale"] += 1
+
+        if on_batch is not None:
+            on_batch(last_pk, stats)
+
+    if stats["processed"]:
+        # update() skips the post_save signal that normally bumps the version
+        bump_version(DOG_VERSION)
+    return stats
@@ -0,0 +1,86 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import Page
+
+from dogs.models import Dog
+from services.cache_service import (
+    DOG_VERSION,
+    filter_signature,
+    get_version,
+    increment,
+)
+from services.count_service import ApproximateCountPaginator, ResultCount
+from services.search_service import search_dogs
+
+DEFAULT_RESULTS_TIMEOUT = 300
+HITS_KEY = "dog-list-cache:hits"
+MISSES_KEY = "dog-list-cache:misses"
+
+
+def _page_number(value) -> int:
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return 1
+    return max(number, 1)
+
+
+def get_cache_stats() -> dict:
+    """Return hit/miss counters of the dog_list result cache."""
+    hits = cache.get(HITS_KEY, 0)
+    misses = cache.get(MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": hits / total if total else 0.0,
+    }
+
+
+def reset_cache_stats() -> None:
+    cache.delete_many([HITS_KEY, MISSES_KEY])
+
+
+def get_dog_page(filters: dict | None, page_number, per_page: int = 12) -> Page:
+    """Return a dog_list page, served from the result cache when possible.
+
+    Only the ordered dog IDs and the result count are cached, keyed by the
+    global dog version, the canonical filter signature and the page. On a hit
+    the rows are hydrated with a single ``in_bulk`` query and no search or
+    count query runs.
+    """
+    number = _page_number(page_number)
+    key = (
+        f"dog-list:{get_version(DOG_VERSION)}:{filter_signature(filters)}"
+        f":{per_page}:{number}"
+    )
+
+    entry = cache.get(key)
+    if entry is not None:
+        increment(HITS_KEY)
+        paginator = ApproximateCountPaginator(Dog.objects.none(), per_page)
+        paginator.count = ResultCount(entry["count"], is_exact=entry["is_exact"])
+        # A dog deactivated after the entry was cached is dropped from the page
+        dogs = (
+            Dog.objects.filter(is_active=True)
+            .select_related("owner")
+            .in_bulk(entry["ids"])
+        )
+        object_list = [dogs[pk] for pk in entry["ids"] if pk in dogs]
+        return Page(object_list, entry["number"], paginator)
+
+    increment(MISSES_KEY)
+    paginator = ApproximateCountPaginator(search_dogs(filters), per_page)
+    page = paginator.get_page(number)
+    page.object_list = list(page.object_list)
+    cache.set(
+        key,
+        {
+            "ids": [dog.pk for dog in page.object_list],
+            "count": int(paginator.count),
+            "is_exact": paginator.count.is_exact,
+            "number": page.number,
+        },
+        getattr(settings, "SEARCH_RESULTS_CACHE_TIMEOUT", DEFAULT_RESULTS_TIMEOUT),
+    )
+    return page
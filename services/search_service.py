@@ -0,0 +1,150 @@
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connection
+from django.db.models import F, QuerySet
+from django.db.models.expressions import RawSQL
+
+from dogs.models import Dog
+from services.breed_service import resolve_breed
+
+SEARCH_CONFIG = "russian"
+FTS_TABLE = "dogs_dog_fts"
+
+# breed > temperament > description, same weights on both backends
+DOG_SEARCH_VECTOR = (
+    SearchVector("breed", weight="A", config=SEARCH_CONFIG)
+    + SearchVector("temperament", weight="B", config=SEARCH_CONFIG)
+    + SearchVector("description", weight="C", config=SEARCH_CONFIG)
+)
+FTS_BM25_WEIGHTS = (10.0, 4.0, 1.0)
+
+_FTS_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _uses_postgres() -> bool:
+    return connection.vendor == "postgresql"
+
+
+def build_fts_query(text: str) -> str:
+    """Turn free user input into a safe FTS5 MATCH expression.
+
+    Every word becomes a quoted prefix term, so FTS5 operators typed by the
+    user are never interpreted and "лабрадор" also finds "лабрадоры".
+    """
+    tokens = _FTS_TOKEN_RE.findall(text.lower())
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def update_search_index(dog: Dog) -> None:
+    """Refresh the full-text index entry for a single dog."""
+    if _uses_postgres():
+        Dog.objects.filter(pk=dog.pk).update(search_vector=DOG_SEARCH_VECTOR)
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [dog.pk])
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, breed, temperament, description) "
+            "VALUES (%s, %s, %s, %s)",
+            [dog.pk, dog.breed, dog.temperament, dog.description],
+        )
+
+
+def remove_from_search_index(dog_id: int) -> None:
+    """Drop a deleted dog from the FTS5 table (PostgreSQL needs nothing)."""
+    if _uses_postgres():
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [dog_id])
+
+
+def rebuild_search_index() -> int:
+    """Rebuild the full-text index for every dog. Returns the row count."""
+    if _uses_postgres():
+        return Dog.objects.update(search_vector=DOG_SEARCH_VECTOR)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE}")
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, breed, temperament, description) "
+            "SELECT id, breed, temperament, description FROM dogs_dog"
+        )
+        return cursor.rowcount
+
+
+def apply_text_search(dogs: QuerySet, text: str) -> QuerySet:
+    """Filter ``dogs`` by full-text ``text`` and order them by relevance."""
+    if _uses_postgres():
+        query = SearchQuery(text, config=SEARCH_CONFIG, search_type="websearch")
+        return (
+            dogs.filter(search_vector=query)
+            .annotate(rank=SearchRank(F("search_vector"), query))
+            .order_by("-rank", "-created_at")
+        )
+
+    match = build_fts_query(text)
+    if not match:
+        return dogs
+
+    weights = ", ".join(str(weight) for weight in FTS_BM25_WEIGHTS)
+    matched_ids = RawSQL(
+        f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [match]
+    )
+    # bm25() is lower for better matches, so negate it to sort like SearchRank
+    rank = RawSQL(
+        f"SELECT -bm25({FTS_TABLE}, {weights}) FROM {FTS_TABLE} "
+        f"WHERE {FTS_TABLE} MATCH %s AND {FTS_TABLE}.rowid = dogs_dog.id",
+        [match],
+    )
+    return (
+        dogs.filter(id__in=matched_ids)
+        .annotate(rank=rank)
+        .order_by("-rank", "-created_at")
+    )
+
+
+def search_dogs(filters: dict | None = None) -> QuerySet:
+    """Return active dogs matching ``DogSearchForm.cleaned_data``.
+
+    Every structured filter combination is served by one of the
+    ``idx_dog_active_*`` partial indexes declared on ``Dog``. A breed known
+    to the catalog (by name or alias) is an equality filter on
+    ``canonical_breed``; free text in ``q`` goes through the full-text index
+    and sorts results by rank.
+    """
+    dogs = Dog.objects.filter(is_active=True).select_related("owner")
+    filters = filters or {}
+
+    text = (filters.get("q") or "").strip()
+    breed = filters.get("breed")
+    age_min = filters.get("age_min")
+    age_max = filters.get("age_max")
+    gender = filters.get("gender")
+    size = filters.get("size")
+
+    if breed:
+        catalog_breed = resolve_breed(breed)
+        if catalog_breed is not None:
+            dogs = dogs.filter(canonical_breed=catalog_breed)
+        else:
+            # Unknown spelling: fall back to the old substring match
+            dogs = dogs.filter(breed__icontains=breed)
+
+    if age_min is not None:
+        dogs = dogs.filter(age__gte=age_min)
+
+    if age_max is not None:
+        dogs = dogs.filter(age__lte=age_max)
+
+    if gender:
+        dogs = dogs.filter(gender=gender)
+
+    if size:
+        dogs = dogs.filter(size=size)
+
+    if text:
+        dogs = apply_text_search(dogs, text)
+
+    return dogs
@@ -0,0 +1,94 @@
+import logging
+import os
+import time
+
+from django.template import TemplateDoesNotExist, TemplateSyntaxError, engines
+from django.urls import get_resolver
+
+from menu_app.models import Menu
+from services.menu_service import get_menu, render_menu
+
+logger = logging.getLogger(__name__)
+
+# Template subdirectories compiled ahead of the first request
+WARMUP_TEMPLATE_DIRS = ("dogs", "menu")
+
+
+def warm_templates(subdirs=WARMUP_TEMPLATE_DIRS) -> int:
+    """Compile every template under ``subdirs`` into the cached loader."""
+    engine = engines["django"]
+    names = set()
+    for template_dir in engine.template_dirs:
+        for subdir in subdirs:
+            top = os.path.join(template_dir, subdir)
+            for directory, _, files in os.walk(top):
+                for filename in files:
+                    if filename.endswith(".html"):
+                        path = os.path.join(directory, filename)
+                        names.add(
+                            os.path.relpath(path, template_dir).replace(os.sep, "/")
+                        )
+    for name in sorted(names):
+        try:
+            engine.get_template(name)
+        except (TemplateDoesNotExist, TemplateSyntaxError) as exc:
+            logger.warning("Cannot warm up template %s: %s", name, exc)
+    return len(names)
+
+
+def warm_urls(resolver=None) -> int:
+    """Populate the reverse lookup tables of the URL resolver and namespaces.
+
+    Namespaced resolvers are populated lazily on their first ``reverse()``,
+    so they are walked explicitly.
+    """
+    resolver = resolver or get_resolver()
+    count = len(resolver.reverse_dict)
+    for _, namespace_resolver in resolver.namespace_dict.values():
+        count += warm_urls(namespace_resolver)
+    return count
+
+
+def warm_menus() -> int:
+    """Build every menu (resolving its named URLs) and render each branch."""
+    names = list(Menu.objects.values_list("name", flat=True))
+    for name in names:
+        for url in get_menu(name)["active"]:
+            render_menu(name, url)
+        render_menu(name, "")
+    return len(names)
+
+
+WARMUP_STEPS = {
+    "urls": warm_urls,
+    "templates": warm_templates,
+    "menus": warm_menus,
+}
+
+
+def warm_up() -> dict:
+    """Run every warmup step in this process.
+
+    Meant for a fresh worker before it takes traffic (see gunicorn.conf.py).
+    Returns ``{step: (items, seconds)}``; a failing step is logged and
+    skipped so warmup never keeps a worker from starting.
+    """
+    timings = {}
+    started = time.perf_counter()
+    for step, func in WARMUP_STEPS.items():
+        step_started = time.perf_counter()
+        try:
+            items = func()
+        except Exception:
+            logger.exception("Warmup step %s failed", step)
+            continue
+        timings[step] = (items, time.perf_counter() - step_started)
+    logger.info(
+        "Warmup finished in %.3fs: %s",
+        time.perf_counter() - started,
+        ", ".join(
+            f"{step} {items} in {seconds:.3f}s"
+            for step, (items, seconds) in timings.items()
+        ),
+    )
+    return timings
@@ -18,6 +18,7 @@ if not settings.configured:
 
 import pytest
 from django.contrib.auth.models import AnonymousUser, User
+from django.core.cache import cache
 from django.test import Client
 
 from dogs.models import Dog, Favorite, Match, Message, UserProfile
@@ -468,3 +469,15 @@ def enable_db_access_for_all_tests(db):
     Can be overridden by specific test functions if needed.
     """
     pass
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """
+    Clear the Django cache around every test.
+    Search results, facets and version counters live there and must not leak
+    between tests that each start from an empty database.
+    """
+    cache.clear()
+    yield
+    cache.clear()
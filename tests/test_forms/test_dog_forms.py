@@ -4,10 +4,19 @@ Dog Form Tests
 Comprehensive validation tests for dog-related forms.
 """
 
+from io import BytesIO
+
 import pytest
 from django.core.files.uploadedfile import SimpleUploadedFile
+from PIL import Image, ImageFile
+
+from dogs.forms import DogForm, DogSearchForm, UserProfileForm
+
 
-from dogs.forms import DogForm, DogSearchForm
+def make_image_upload(name, size=(20, 20), image_format="PNG", mode="RGB"):
+    buffer = BytesIO()
+    Image.new(mode, size).save(buffer, format=image_format)
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/png")
 
 
 @pytest.mark.forms
@@ -197,6 +206,58 @@ class TestDogFormImageValidation:
         assert not form.is_valid()
         assert "photo" in form.errors
 
+    @pytest.mark.parametrize(
+        "name,image_format", [("a.png", "PNG"), ("a.jpg", "JPEG"), ("a.webp", "WEBP")]
+    )
+    def test_dog_form_accepts_real_images(
+        self, user, valid_dog_data, name, image_format
+    ):
+        """Test real JPEG, PNG and WebP files pass validation."""
+        image = make_image_upload(name, image_format=image_format)
+        form = DogForm(data=valid_dog_data, files={"photo": image}, user=user)
+        assert form.is_valid(), form.errors
+
+    def test_dog_form_ignores_client_content_type(self, user, valid_dog_data):
+        """Test the file signature, not the declared MIME type, is checked."""
+        file = SimpleUploadedFile(
+            "evil.png", b"<?php echo 1; ?>", content_type="image/png"
+        )
+        form = DogForm(data=valid_dog_data, files={"photo": file}, user=user)
+        assert not form.is_valid()
+        assert "JPEG, PNG, WebP" in str(form.errors["photo"])
+
+    def test_dog_form_rejects_truncated_image(self, user, valid_dog_data):
+        """Test a file with a valid signature but no image header is rejected."""
+        file = SimpleUploadedFile("bad.png", b"\x89PNG\r\n\x1a\n" + b"\0" * 8)
+        form = DogForm(data=valid_dog_data, files={"photo": file}, user=user)
+        assert not form.is_valid()
+        assert "photo" in form.errors
+
+    def test_dog_form_rejects_too_many_pixels(self, user, valid_dog_data):
+        """Test decompression bombs are rejected from the header alone."""
+        image = make_image_upload("bomb.png", size=(9000, 5000), mode="1")
+        form = DogForm(data=valid_dog_data, files={"photo": image}, user=user)
+        assert not form.is_valid()
+        assert "Мп" in str(form.errors["photo"])
+
+    def test_dog_form_does_not_decode_pixels(self, user, valid_dog_data, monkeypatch):
+        """Test validation reads only the image header."""
+        image = make_image_upload("a.png")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("pixels decoded")
+
+        monkeypatch.setattr(ImageFile.ImageFile, "load", fail)
+        form = DogForm(data=valid_dog_data, files={"photo": image}, user=user)
+        assert form.is_valid(), form.errors
+
+    def test_profile_form_validates_avatar(self, user_profile):
+        """Test the avatar goes through the same validator."""
+        file = SimpleUploadedFile("me.png", b"not an image", content_type="image/png")
+        form = UserProfileForm(data={}, files={"avatar": file}, instance=user_profile)
+        assert not form.is_valid()
+        assert "avatar" in form.errors
+
 
 @pytest.mark.forms
 class TestDogFormUniqueNameValidation:
@@ -5,6 +5,7 @@ Tests for the menu_app models.
 """
 
 import pytest
+from django.core.exceptions import ValidationError
 from django.test import TestCase
 
 from menu_app.models import Menu, MenuItem
@@ -86,3 +87,50 @@ class TestMenuItemModel:
         """Test menu item relationship with menu."""
         item = MenuItem.objects.create(title="Test Item", url="/test/", menu=menu)
         assert item in menu.items.all()
+
+
+@pytest.mark.models
+@pytest.mark.unit
+class TestMenuItemPath:
+    """Test suite for the materialized path of menu items."""
+
+    @pytest.fixture
+    def tree(self, db):
+        """Create root -> child -> grandchild and a second root."""
+        menu = Menu.objects.create(name="Tree Menu")
+        root = MenuItem.objects.create(menu=menu, title="Root", url="/root/")
+        child = MenuItem.objects.create(
+            menu=menu, parent=root, title="Child", url="/child/"
+        )
+        grandchild = MenuItem.objects.create(
+            menu=menu, parent=child, title="Grandchild", url="/grandchild/"
+        )
+        other = MenuItem.objects.create(menu=menu, title="Other", url="/other/")
+        return root, child, grandchild, other
+
+    def test_path_is_built_on_create(self, tree):
+        root, child, grandchild, _ = tree
+        assert root.path == f"{root.pk}/"
+        assert grandchild.path == f"{root.pk}/{child.pk}/{grandchild.pk}/"
+        assert grandchild.depth == 2
+
+    def test_descendants_and_ancestors(self, tree, django_assert_num_queries):
+        root, child, grandchild, _ = tree
+        assert set(root.get_descendants()) == {child, grandchild}
+        with django_assert_num_queries(1):
+            assert grandchild.get_ancestors() == [root, child]
+
+    def test_moving_item_updates_subtree(self, tree):
+        root, child, grandchild, other = tree
+        child.parent = other
+        child.save()
+
+        grandchild.refresh_from_db()
+        assert grandchild.path == f"{other.pk}/{child.pk}/{grandchild.pk}/"
+        assert list(root.get_descendants()) == []
+
+    def test_cannot_move_into_own_subtree(self, tree):
+        root, _, grandchild, _ = tree
+        root.parent = grandchild
+        with pytest.raises(ValidationError):
+            root.full_clean()
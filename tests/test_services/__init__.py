@@ -0,0 +1,5 @@
+"""
+Service Layer Tests Package
+
+Tests for search, caching and media services.
+"""
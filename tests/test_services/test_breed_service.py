@@ -0,0 +1,122 @@
+"""
+Breed Catalog Tests
+
+Tests for breed normalization, aliases, backfill and autocomplete.
+"""
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+
+from dogs.models import Breed, Dog, normalize_breed_name
+from services.breed_service import (
+    BreedPrefixIndex,
+    add_breed_alias,
+    autocomplete_breeds,
+    backfill_breeds,
+    resolve_breed,
+)
+from services.search_service import search_dogs
+
+
+def make_dog(owner, name, breed):
+    return Dog.objects.create(
+        owner=owner,
+        name=name,
+        breed=breed,
+        age=3,
+        gender="M",
+        size="M",
+        temperament="friendly",
+        looking_for="playmate",
+        description="Test dog",
+    )
+
+
+@pytest.mark.services
+class TestBreedCatalog:
+    """Test linking dogs to the catalog."""
+
+    def test_normalize_breed_name(self):
+        assert normalize_breed_name("  Лабрадор   Ретривер ") == "лабрадор ретривер"
+        assert normalize_breed_name("Ёркширский") == "еркширский"
+
+    def test_spelling_variants_share_one_breed(self, user):
+        first = make_dog(user, "A", "Лабрадор")
+        second = make_dog(user, "B", "лабрадор ")
+        assert first.canonical_breed == second.canonical_breed
+        assert Breed.objects.count() == 1
+
+    def test_alias_merges_duplicate_breed(self, user):
+        russian = make_dog(user, "A", "Лабрадор")
+        latin = make_dog(user, "B", "Labrador")
+        add_breed_alias(russian.canonical_breed, "Labrador")
+
+        latin.refresh_from_db()
+        assert latin.canonical_breed == russian.canonical_breed
+        assert Breed.objects.count() == 1
+        assert resolve_breed("LABRADOR") == russian.canonical_breed
+
+    def test_breed_filter_is_equality_on_catalog(self, user):
+        lab = make_dog(user, "A", "Лабрадор")
+        make_dog(user, "B", "Лабрадор ретривер")
+        qs = search_dogs({"breed": "лабрадор"})
+        assert list(qs) == [lab]
+        assert "canonical_breed_id" in str(qs.query)
+
+    def test_backfill_links_unlinked_dogs(self, user):
+        dog = make_dog(user, "A", "Мопс")
+        Dog.objects.update(canonical_breed=None)
+        Breed.objects.all().delete()
+
+        stats = backfill_breeds()
+
+        dog.refresh_from_db()
+        assert stats == {"breeds_created": 1, "dogs_linked": 1}
+        assert dog.canonical_breed.name == "Мопс"
+
+    def test_backfill_command_with_alias(self, user):
+        make_dog(user, "A", "Pug")
+        call_command("backfill_breeds", "--alias", "Pug=Мопс", stdout=None)
+        assert list(Breed.objects.values_list("name", flat=True)) == ["Мопс"]
+
+
+@pytest.mark.services
+class TestBreedAutocomplete:
+    """Test the prefix index and the autocomplete endpoint."""
+
+    def test_prefix_index_search(self):
+        index = BreedPrefixIndex(
+            [
+                ("лабрадор", 1, "Лабрадор"),
+                ("labrador", 1, "Лабрадор"),
+                ("лайка", 2, "Лайка"),
+            ]
+        )
+        assert index.search("ЛА") == [
+            {"id": 1, "name": "Лабрадор"},
+            {"id": 2, "name": "Лайка"},
+        ]
+        assert index.search("lab") == [{"id": 1, "name": "Лабрадор"}]
+        assert index.search("x") == []
+
+    def test_autocomplete_sees_new_breeds(self, user, django_assert_num_queries):
+        make_dog(user, "A", "Бигль")
+        assert autocomplete_breeds("би") == [
+            {"id": Breed.objects.get().pk, "name": "Бигль"}
+        ]
+
+        with django_assert_num_queries(0):
+            autocomplete_breeds("би")
+
+        make_dog(user, "B", "Бишон фризе")
+        assert [b["name"] for b in autocomplete_breeds("би")] == [
+            "Бигль",
+            "Бишон фризе",
+        ]
+
+    def test_autocomplete_endpoint(self, client, user):
+        make_dog(user, "A", "Такса")
+        response = client.get(reverse("dogs:breed_autocomplete"), {"q": "так"})
+        assert response.status_code == 200
+        assert response.json()["results"][0]["name"] == "Такса"
@@ -0,0 +1,165 @@
+"""
+Static Bundle Tests
+
+Tests for the CSS/JS minifiers, critical CSS and the committed bundles built by
+build_bundles.
+"""
+
+import os
+from io import StringIO
+from unittest import mock
+
+import pytest
+from django.contrib.staticfiles import finders
+from django.core.management import call_command
+from django.test import Client
+
+from dogs import bundling
+from dogs.bundling import (
+    BUNDLES,
+    BUNDLES_STATIC_DIR,
+    CRITICAL_PAGES,
+    CRITICAL_STATIC_DIR,
+    build_bundle,
+    build_critical_css,
+    extract_critical_css,
+    get_critical_css,
+    minify_css,
+    minify_js,
+    used_names,
+)
+
+
+@pytest.mark.services
+class TestMinifiers:
+    """Test the conservative CSS/JS minifiers."""
+
+    def test_css_drops_comments_and_whitespace(self):
+        css = "/* theme */\n.card > .title ,\n.a :hover {\n  color: red;\n}\n"
+        assert minify_css(css) == ".card>.title,.a :hover{color:red}"
+
+    def test_css_keeps_strings(self):
+        css = '.x::after { content: "/* not a comment */  ;"; }'
+        assert minify_css(css) == '.x::after{content:"/* not a comment */  ;"}'
+
+    def test_js_drops_indentation_and_line_comments(self):
+        js = "function f() {\n    // explain\n    return 1;\n}\n\n"
+        assert minify_js(js) == "function f() {\nreturn 1;\n}"
+
+    def test_js_keeps_template_literals(self):
+        js = "const html = `\n    <div>\n    // kept\n`;\n    go();"
+        assert minify_js(js) == "const html = `\n    <div>\n    // kept\n`;\ngo();"
+
+
+@pytest.mark.services
+class TestCriticalCss:
+    """Test extraction of the above-the-fold rules of a page."""
+
+    def test_used_names_from_class_and_id_attributes(self):
+        markup = '<nav id="menu" class="navbar {% if x %}open{% endif %}">'
+        assert {"menu", "navbar", "open"} <= used_names(markup)
+
+    def test_keeps_only_rules_for_used_names(self):
+        css = "body{margin:0}.card,.modal{color:red}.modal>.title{color:blue}"
+        assert extract_critical_css(css, {"card"}) == "body{margin:0}.card{color:red}"
+
+    def test_drops_interaction_states_keyframes_and_print(self):
+        css = (
+            ".btn{color:red}.btn:hover{color:blue}@keyframes spin{to{opacity:0}}"
+            "@media print{.btn{display:none}}"
+        )
+        assert extract_critical_css(css, {"btn"}) == ".btn{color:red}"
+
+    def test_filters_inside_media_queries(self):
+        css = '@media (max-width:600px){.card{padding:0}.x{gap:0}}a[href$=".x"]{b:0}'
+        assert extract_critical_css(css, {"card"}) == (
+            '@media (max-width:600px){.card{padding:0}}a[href$=".x"]{b:0}'
+        )
+
+    def test_skips_element_rules_missing_from_markup(self):
+        css = "body{margin:0}table td{padding:0}.card p{gap:0}"
+        assert extract_critical_css(css, {"card"}, {"body", "div"}) == "body{margin:0}"
+
+    def test_uses_only_first_paint_markup(self):
+        css = get_critical_css("dog_list")
+
+        assert ".main-header{" in css and ".dogs-grid" in css
+        # below the fold or hidden until clicked
+        assert ".main-footer" not in css and ".footer-title" not in css
+        assert ".guest-menu-dropdown{" in css and ".guest-menu-item" not in css
+
+    @pytest.mark.parametrize("page", list(CRITICAL_PAGES))
+    def test_critical_css_is_a_fraction_of_the_bundle(self, page):
+        bundle = CRITICAL_PAGES[page][1]
+        assert len(get_critical_css(page)) <= 0.55 * len(build_bundle(bundle))
+
+    def test_debug_rebuilds_only_when_sources_change(self, settings, monkeypatch):
+        settings.DEBUG = True
+        monkeypatch.setattr(bundling, "_critical_css", {})
+        css = get_critical_css("landing")
+
+        with mock.patch.object(
+            bundling, "critical_fingerprint", wraps=bundling.critical_fingerprint
+        ) as fingerprint:
+            assert get_critical_css("landing") == css
+            fingerprint.assert_not_called()
+
+            source = bundling.ASSETS_DIR / BUNDLES["landing.css"][0]
+            stat = source.stat()
+            os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            try:
+                assert get_critical_css("landing") == css
+            finally:
+                os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            fingerprint.assert_called_once()
+
+    def test_stale_file_is_rebuilt_in_memory(self, settings, tmp_path, monkeypatch):
+        settings.DEBUG = True
+        monkeypatch.setattr(bundling, "_critical_css", {})
+        stale = tmp_path / "landing.css"
+        stale.write_text("/* outdated */\n.old{color:red}\n", encoding="utf-8")
+        monkeypatch.setattr(finders, "find", lambda path: str(stale))
+
+        css = get_critical_css("landing")
+        assert ".old" not in css
+        assert css == build_critical_css("landing").partition("\n")[2].strip()
+
+    def test_dog_list_inlines_critical_css_and_preloads_bundle(self, user):
+        client = Client()
+        client.force_login(user)
+        html = client.get("/dogs/").content.decode()
+
+        assert f"<style>{get_critical_css('dog_list')}</style>" in html
+        assert 'rel="preload"' in html and "dogs/bundles/app.css" in html
+        assert '<noscript><link rel="stylesheet"' in html
+
+
+@pytest.mark.services
+class TestBundles:
+    """Test the committed bundles and their use in templates."""
+
+    def test_static_bundles_are_up_to_date(self, tmp_path):
+        call_command("build_bundles", output_dir=tmp_path, stdout=StringIO())
+
+        for name in BUNDLES:
+            committed = finders.find(f"{BUNDLES_STATIC_DIR}/{name}")
+            assert committed, f"{name} missing, run build_bundles"
+            with open(committed, encoding="utf-8") as committed_file:
+                assert committed_file.read() == (tmp_path / name).read_text(
+                    encoding="utf-8"
+                ), f"{name} is stale, run build_bundles"
+
+        for page in CRITICAL_PAGES:
+            committed = finders.find(f"{CRITICAL_STATIC_DIR}/{page}.css")
+            assert committed, f"critical/{page}.css missing, run build_bundles"
+            with open(committed, encoding="utf-8") as committed_file:
+                assert committed_file.read() == (
+                    tmp_path / "critical" / f"{page}.css"
+                ).read_text(encoding="utf-8"), f"{page} critical CSS is stale"
+
+    def test_pages_link_bundles_instead_of_inline_code(self, db):
+        html = Client().get("/").content.decode()
+
+        assert "dogs/bundles/landing.css" in html
+        assert "dogs/bundles/landing.js" in html
+        assert html.count("<style>") == 1
@@ -0,0 +1,160 @@
+"""
+Content-Addressed Storage Tests
+
+Tests for BLAKE2-addressed, reference-counted media storage.
+"""
+
+import hashlib
+from io import BytesIO
+
+import pytest
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import IntegrityError
+from PIL import Image
+
+from dogs.models import StoredFile
+from dogs.storage import (
+    ContentAddressedStorage,
+    is_content_addressed,
+)
+
+
+@pytest.fixture
+def storage(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    return ContentAddressedStorage()
+
+
+@pytest.fixture
+def png_upload():
+    def make(name, color="red"):
+        buffer = BytesIO()
+        Image.new("RGB", (10, 10), color=color).save(buffer, format="PNG")
+        return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/png")
+
+    return make
+
+
+@pytest.mark.services
+class TestContentAddressedStorage:
+    """Test the storage backend itself."""
+
+    def test_name_is_blake2_of_content(self, db, storage):
+        name = storage.save("dogs/Rex.JPG", ContentFile(b"photo bytes"))
+
+        digest = hashlib.blake2b(b"photo bytes", digest_size=20).hexdigest()
+        assert name == f"dogs/{digest[:2]}/{digest[2:4]}/{digest}.jpg"
+        assert is_content_addressed(name)
+        assert storage.open(name).read() == b"photo bytes"
+
+    def test_identical_content_is_stored_once(self, db, storage, tmp_path):
+        first = storage.save("dogs/a.png", ContentFile(b"same"))
+        second = storage.save("dogs/b.png", ContentFile(b"same"))
+
+        assert first == second
+        assert StoredFile.objects.get(name=first).refcount == 2
+        assert not list(tmp_path.glob("dogs/.upload-*"))
+
+    def test_delete_keeps_file_while_referenced(self, db, storage):
+        name = storage.save("dogs/a.png", ContentFile(b"same"))
+        storage.save("dogs/b.png", ContentFile(b"same"))
+
+        storage.delete(name)
+        assert storage.exists(name)
+        assert StoredFile.objects.get(name=name).refcount == 1
+
+        storage.delete(name)
+        assert not storage.exists(name)
+        assert not StoredFile.objects.filter(name=name).exists()
+
+    def test_save_restores_file_missing_under_a_reference(self, db, storage):
+        name = storage.save("dogs/a.png", ContentFile(b"same"))
+        # The decision to keep the upload is taken under the StoredFile row
+        # lock, so a file removed behind the row's back is written again
+        super(ContentAddressedStorage, storage).delete(name)
+
+        assert storage.save("dogs/b.png", ContentFile(b"same")) == name
+        assert storage.open(name).read() == b"same"
+        assert StoredFile.objects.get(name=name).refcount == 2
+
+    def test_other_directories_are_not_addressed(self, db, storage):
+        name = storage.save("renditions/x/card.webp", ContentFile(b"webp"))
+
+        assert name == "renditions/x/card.webp"
+        assert not StoredFile.objects.exists()
+
+    def test_is_content_addressed(self):
+        digest = "a" * 40
+        assert is_content_addressed(f"dogs/aa/aa/{digest}.png")
+        assert not is_content_addressed("dogs/rex.png")
+
+
+@pytest.mark.services
+class TestPhotoReferences:
+    """Test that dog photos and avatars release their files."""
+
+    def test_same_photo_for_two_dogs_is_shared(self, dog, dog2, storage, png_upload):
+        dog.photo = png_upload("one.png")
+        dog.save()
+        dog2.photo = png_upload("two.png")
+        dog2.save()
+
+        assert dog.photo.name == dog2.photo.name
+        assert StoredFile.objects.get(name=dog.photo.name).refcount == 2
+
+    def test_replaced_photo_is_released(
+        self, dog, storage, png_upload, django_capture_on_commit_callbacks
+    ):
+        dog.photo = png_upload("one.png")
+        dog.save()
+        old_name = dog.photo.name
+
+        with django_capture_on_commit_callbacks(execute=True):
+            dog.photo = png_upload("two.png", color="blue")
+            dog.save()
+
+        assert not dog.photo.storage.exists(old_name)
+        assert not StoredFile.objects.filter(name=old_name).exists()
+        assert dog.photo.storage.exists(dog.photo.name)
+
+    def test_failed_save_keeps_replaced_photo(
+        self, transactional_db, dog, dog2, storage, png_upload
+    ):
+        # Autocommit, as in views: on_commit callbacks run right away
+        dog.photo = png_upload("one.png")
+        dog.save()
+        old_name = dog.photo.name
+
+        dog.photo = png_upload("two.png", color="blue")
+        dog.name = dog2.name
+        with pytest.raises(IntegrityError):
+            dog.save()
+
+        assert StoredFile.objects.get(name=old_name).refcount == 1
+        assert storage.exists(old_name)
+
+    def test_deleted_dog_releases_photo(
+        self, dog, storage, png_upload, django_capture_on_commit_callbacks
+    ):
+        dog.photo = png_upload("one.png")
+        dog.save()
+        name = dog.photo.name
+
+        with django_capture_on_commit_callbacks(execute=True):
+            dog.delete()
+
+        assert not StoredFile.objects.filter(name=name).exists()
+
+    def test_replaced_avatar_is_released(
+        self, user_profile, storage, png_upload, django_capture_on_commit_callbacks
+    ):
+        user_profile.avatar = png_upload("me.png")
+        user_profile.save()
+        old_name = user_profile.avatar.name
+
+        with django_capture_on_commit_callbacks(execute=True):
+            user_profile.avatar = None
+            user_profile.save()
+
+        assert not StoredFile.objects.filter(name=old_name).exists()
@@ -0,0 +1,85 @@
+"""
+Result Count Service Tests
+
+Tests for exact/approximate counting used by dog_list and the admin.
+"""
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from dogs.models import Dog
+from services.count_service import (
+    ApproximateCountPaginator,
+    _sampled_estimate,
+    _table_total,
+    estimate_count,
+)
+
+
+@pytest.mark.services
+class TestEstimateCount:
+    """Test the counting strategy."""
+
+    def test_exact_below_threshold(self, multiple_dogs):
+        """Small results are counted exactly."""
+        result = estimate_count(Dog.objects.all(), threshold=100)
+        assert result == 15
+        assert result.is_exact is True
+
+    def test_estimate_above_threshold(self, multiple_dogs, settings):
+        """Large results are estimated and flagged as approximate."""
+        settings.SEARCH_COUNT_SAMPLE_SIZE = 10
+        result = estimate_count(Dog.objects.filter(is_active=True), threshold=5)
+        assert result.is_exact is False
+        assert 5 < result <= 30
+
+    def test_estimate_is_cached(
+        self, multiple_dogs, settings, django_assert_num_queries
+    ):
+        """A repeated estimate costs only the bounded count query."""
+        settings.SEARCH_COUNT_SAMPLE_SIZE = 10
+        qs = Dog.objects.filter(size="S")
+        first = estimate_count(qs, threshold=2)
+        with django_assert_num_queries(1):
+            second = estimate_count(qs, threshold=2)
+        assert first == second
+
+    def test_sampled_estimate_scales_to_the_cached_table_total(
+        self, multiple_dogs, settings
+    ):
+        """The table total comes from the cache, not a full count per estimate."""
+        settings.SEARCH_COUNT_SAMPLE_SIZE = 10
+        _table_total(Dog, "default")
+        cache.set("count-total:default:dogs.dog", 1500)
+
+        with CaptureQueriesContext(connection) as queries:
+            estimate = _sampled_estimate(Dog.objects.all())
+
+        assert estimate == 1500
+        assert 'SELECT COUNT(*) AS "__count" FROM "dogs_dog"' not in [
+            query["sql"] for query in queries
+        ]
+
+    def test_paginator_uses_estimate(self, multiple_dogs):
+        """The paginator exposes the ResultCount."""
+        paginator = ApproximateCountPaginator(Dog.objects.all(), 12)
+        assert paginator.count == 15
+        assert paginator.num_pages == 2
+
+
+@pytest.mark.views
+class TestDogListCount:
+    """Test how dog_list renders counts."""
+
+    def test_exact_count_rendered(self, client, multiple_dogs):
+        response = client.get(reverse("dogs:dog_list"))
+        assert "Найдено: 15 собак" in response.content.decode()
+
+    def test_approximate_count_rendered(self, client, multiple_dogs, settings):
+        settings.SEARCH_COUNT_EXACT_THRESHOLD = 5
+        response = client.get(reverse("dogs:dog_list"))
+        assert response.context["total_results"].is_exact is False
+        assert "Найдено: около" in response.content.decode()
@@ -0,0 +1,80 @@
+"""
+Dog Card Service Tests
+
+Tests for the dog card fragment cache shared by dog_list, favorites and landing.
+"""
+
+from unittest import mock
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.template.loader import get_template
+
+from dogs.models import Favorite
+from services import dog_card_service
+from services.dog_card_service import render_dog_cards
+
+
+@pytest.mark.services
+class TestRenderDogCards:
+    """Test rendering and caching of dog card fragments."""
+
+    def test_second_render_skips_templates(self, other_dog, user):
+        first = render_dog_cards([other_dog], user)
+
+        with mock.patch.object(
+            dog_card_service, "get_template", wraps=get_template
+        ) as loader:
+            second = render_dog_cards([other_dog], user)
+
+        assert second == first
+        loader.assert_not_called()
+        assert "Подробнее" in first[0]
+
+    def test_saving_the_dog_renders_a_new_card(self, other_dog, user):
+        render_dog_cards([other_dog], user)
+        other_dog.name = "Renamed"
+        other_dog.save()
+
+        assert "Renamed" in render_dog_cards([other_dog], user)[0]
+
+    def test_changed_template_renders_new_cards(self, other_dog, user, monkeypatch):
+        render_dog_cards([other_dog], user)
+        # As if the cache had been filled by a build with another card template
+        monkeypatch.setitem(dog_card_service._fingerprints, "list", "old-deploy")
+
+        with mock.patch.object(
+            dog_card_service, "get_template", wraps=get_template
+        ) as loader:
+            render_dog_cards([other_dog], user)
+        loader.assert_called_once()
+
+    def test_viewer_flags_select_the_card(self, dog, other_dog, user):
+        Favorite.objects.create(user=user, dog=other_dog)
+
+        own, favorite = render_dog_cards([dog, other_dog], user)
+        anonymous = render_dog_cards([other_dog], AnonymousUser())[0]
+
+        assert "Моя собака" in own and "favorite-btn" not in own
+        assert 'data-is-favorite="true"' in favorite and "bi-heart-fill" in favorite
+        assert "favorite-btn" not in anonymous
+
+    def test_list_and_favorites_pages_share_cards(
+        self, authenticated_client, other_dog, user
+    ):
+        Favorite.objects.create(user=user, dog=other_dog)
+        authenticated_client.get("/dogs/")
+
+        with mock.patch.object(
+            dog_card_service, "get_template", wraps=get_template
+        ) as loader:
+            response = authenticated_client.get("/favorites/")
+
+        assert other_dog.name in response.content.decode()
+        loader.assert_not_called()
+
+    def test_landing_uses_its_own_variant(self, db, multiple_dogs):
+        html = render_dog_cards(multiple_dogs[:1], AnonymousUser(), "landing")[0]
+
+        assert 'class="dog-card"' in html
+        assert "favorite-btn" not in html
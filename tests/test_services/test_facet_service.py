@@ -0,0 +1,122 @@
+"""
+Search Facet Tests
+
+Tests for grouped facet counts and their versioned cache.
+"""
+
+import pytest
+from django.urls import reverse
+
+from services.cache_service import filter_signature
+from services.facet_service import compute_facets, compute_search_facets, get_facets
+from services.search_service import search_dogs
+
+
+def _counts(facet_list):
+    return {facet["value"]: facet["count"] for facet in facet_list}
+
+
+@pytest.mark.services
+class TestFacets:
+    """Test facet computation and caching."""
+
+    def test_facets_in_single_query(self, multiple_dogs, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            facets = compute_facets(search_dogs({}))
+
+        assert _counts(facets["gender"]) == {"M": 8, "F": 7}
+        assert _counts(facets["size"]) == {"S": 5, "M": 5, "L": 5}
+        # ages are 1..15
+        assert _counts(facets["age"]) == {
+            "puppy": 1,
+            "young": 3,
+            "adult": 4,
+            "senior": 7,
+        }
+        assert len(facets["breed"]) == 10
+
+    def test_facets_follow_current_filters(self, multiple_dogs):
+        facets = get_facets({"gender": "F"})
+        females = search_dogs({"gender": "F"})
+
+        # the gender facet ignores its own filter, so "M" counts its link's dogs
+        assert _counts(facets["gender"]) == {"M": 8, "F": 7}
+        assert _counts(facets["size"]) == {
+            size: females.filter(size=size).count() for size in ("S", "M", "L")
+        }
+        assert sum(_counts(facets["age"]).values()) == 7
+
+    def test_filtered_facets_in_single_query(
+        self, multiple_dogs, django_assert_num_queries
+    ):
+        with django_assert_num_queries(1):
+            facets = compute_search_facets({"gender": "F", "age_min": 9})
+
+        assert _counts(facets["gender"]) == {
+            gender: search_dogs({"gender": gender, "age_min": 9}).count()
+            for gender in ("M", "F")
+        }
+        assert _counts(facets["age"])["puppy"] == (
+            search_dogs({"gender": "F", "age_max": 1}).count()
+        )
+        assert sum(_counts(facets["age"]).values()) == 7
+
+    def test_every_filter_combination_costs_one_query(
+        self, multiple_dogs, django_assert_num_queries
+    ):
+        filters = {"gender": "M", "size": "S", "age_max": 8, "breed": "Breed6"}
+        with django_assert_num_queries(1):
+            facets = compute_search_facets(filters)
+
+        for dimension, fields in (
+            ("gender", ("gender",)),
+            ("size", ("size",)),
+            ("age", ("age_max",)),
+        ):
+            relaxed = {k: v for k, v in filters.items() if k not in fields}
+            assert sum(_counts(facets[dimension]).values()) == (
+                search_dogs(relaxed).count()
+            )
+        # the breed facet still lists the other small young males
+        assert _counts(facets["breed"]) == {
+            dog.breed: 1
+            for dog in search_dogs({"gender": "M", "size": "S", "age_max": 8})
+        }
+
+    def test_facets_are_cached_and_invalidated(
+        self, multiple_dogs, django_assert_num_queries
+    ):
+        get_facets({"size": "S"})
+        with django_assert_num_queries(0):
+            cached = get_facets({"size": "S", "breed": ""})
+        assert _counts(cached["size"])["S"] == 5
+
+        dog = multiple_dogs[1]
+        dog.size = "S"
+        dog.save()
+        assert _counts(get_facets({"size": "S"})["size"])["S"] == 6
+
+        multiple_dogs[0].delete()
+        assert _counts(get_facets({"size": "S"})["size"])["S"] == 5
+
+    def test_filter_signature_is_canonical(self):
+        assert filter_signature({"gender": "F", "size": ""}) == filter_signature(
+            {"size": None, "gender": "F"}
+        )
+        assert filter_signature({"breed": " Лабрадор  ретривер"}) == filter_signature(
+            {"breed": "Лабрадор ретривер"}
+        )
+        assert filter_signature({"gender": "F"}) != filter_signature({"gender": "M"})
+
+    def test_dog_list_renders_facets(self, client, multiple_dogs):
+        response = client.get(reverse("dogs:dog_list"), {"size": "L"})
+        assert _counts(response.context["facets"]["size"]) == {"S": 5, "M": 5, "L": 5}
+        assert "Уточнить" in response.content.decode()
+
+    def test_facet_links_replace_the_current_value(self, client, multiple_dogs):
+        response = client.get(reverse("dogs:dog_list"), {"gender": "F", "page": 2})
+        html = response.content.decode()
+
+        assert 'href="?gender=M"' in html
+        assert "gender=F&amp;gender=" not in html
+        assert 'href="?gender=F&amp;age_min=9"' in html
@@ -0,0 +1,142 @@
+"""
+Featured Dog Pool Tests
+
+Tests for the sampled featured-dog pool used by the landing page.
+"""
+
+from io import BytesIO
+
+import pytest
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from PIL import Image
+
+from dogs.models import Dog
+from services.featured_service import (
+    FEATURED_LOCK_KEY,
+    FEATURED_POOL_KEY,
+    _eligible_fraction,
+    _sample_percent,
+    get_featured_dogs,
+    refresh_featured_pool,
+)
+from services.media_service import reconcile_photo_flags
+from services.photo_queue_service import process_photo_queue
+
+
+@pytest.fixture
+def image_bytes():
+    """Distinct PNG bytes per color; identical uploads share one stored file."""
+
+    def make(color):
+        buffer = BytesIO()
+        Image.new("RGB", (10, 10), color=color).save(buffer, format="PNG")
+        return buffer.getvalue()
+
+    return make
+
+
+@pytest.fixture
+def dogs_with_photos(multiple_dogs, settings, tmp_path, image_bytes):
+    settings.MEDIA_ROOT = tmp_path
+    for index, dog in enumerate(multiple_dogs[:8]):
+        dog.photo = SimpleUploadedFile(
+            f"{dog.name}.png", image_bytes((index * 20, 0, 0)), content_type="image/png"
+        )
+        dog.save()
+    process_photo_queue()
+    return multiple_dogs[:8]
+
+
+@pytest.mark.services
+class TestFeaturedPool:
+    """Test the featured pool."""
+
+    def test_pool_contains_only_dogs_with_photos(self, dogs_with_photos):
+        pool = refresh_featured_pool()
+        assert sorted(pool) == sorted(dog.pk for dog in dogs_with_photos)
+
+    def test_pool_skips_missing_files_and_inactive_dogs(self, dogs_with_photos):
+        missing, inactive = dogs_with_photos[0], dogs_with_photos[1]
+        missing.photo.storage.delete(missing.photo.name)
+        inactive.is_active = False
+        inactive.save()
+        reconcile_photo_flags()
+
+        pool = refresh_featured_pool()
+        assert missing.pk not in pool
+        assert inactive.pk not in pool
+        assert len(pool) == 6
+
+    def test_pool_size_is_bounded(self, dogs_with_photos, settings):
+        settings.FEATURED_POOL_SIZE = 3
+        assert len(refresh_featured_pool()) == 3
+
+    def test_pick_uses_cached_pool(self, dogs_with_photos, django_assert_num_queries):
+        refresh_featured_pool()
+        with django_assert_num_queries(1):
+            featured = get_featured_dogs(6)
+        assert len(featured) == 6
+        assert len({dog.pk for dog in featured}) == 6
+
+    def test_pool_refreshes_when_expired(self, dogs_with_photos):
+        cache.delete(FEATURED_POOL_KEY)
+        assert len(get_featured_dogs(6)) == 6
+        assert cache.get(FEATURED_POOL_KEY)
+
+    def test_deactivated_dog_not_shown_from_stale_pool(self, dogs_with_photos):
+        refresh_featured_pool()
+        deactivated, *active = dogs_with_photos
+        Dog.objects.filter(pk=deactivated.pk).update(is_active=False)
+
+        featured = get_featured_dogs(len(dogs_with_photos))
+        assert deactivated not in featured
+        assert sorted(dog.pk for dog in featured) == sorted(dog.pk for dog in active)
+
+    def test_stale_pool_is_served_while_another_request_refreshes(
+        self, dogs_with_photos, django_assert_num_queries
+    ):
+        refresh_featured_pool()
+        entry = cache.get(FEATURED_POOL_KEY)
+        cache.set(FEATURED_POOL_KEY, {**entry, "fresh_until": 0})
+        cache.add(FEATURED_LOCK_KEY, True)
+
+        with django_assert_num_queries(1):
+            assert len(get_featured_dogs(6)) == 6
+        assert cache.get(FEATURED_POOL_KEY)["fresh_until"] == 0
+
+    def test_stale_pool_is_refreshed_by_the_lock_holder(self, dogs_with_photos):
+        refresh_featured_pool()
+        entry = cache.get(FEATURED_POOL_KEY)
+        cache.set(FEATURED_POOL_KEY, {**entry, "fresh_until": 0})
+
+        assert len(get_featured_dogs(6)) == 6
+        assert cache.get(FEATURED_POOL_KEY)["fresh_until"] > 0
+        assert cache.get(FEATURED_LOCK_KEY) is None
+
+    def test_cold_cache_does_not_sample_concurrently(
+        self, dogs_with_photos, django_assert_num_queries
+    ):
+        cache.delete(FEATURED_POOL_KEY)
+        cache.add(FEATURED_LOCK_KEY, True)
+
+        with django_assert_num_queries(0):
+            assert get_featured_dogs(6) == []
+
+    def test_sample_percent_follows_the_eligible_share(self):
+        everyone = _sample_percent(60, 100_000, 1.0)
+
+        assert _sample_percent(60, 100_000, 0.1) == pytest.approx(everyone * 10)
+        assert _sample_percent(60, 100, 0.5) == 100.0
+
+    def test_eligible_fraction_is_cached(
+        self, dogs_with_photos, django_assert_num_queries
+    ):
+        assert _eligible_fraction(80) == len(dogs_with_photos) / 80
+        with django_assert_num_queries(0):
+            assert _eligible_fraction(80) == len(dogs_with_photos) / 80
+
+    def test_landing_page_shows_pool(self, client, dogs_with_photos):
+        response = client.get(reverse("dogs:landing_page"))
+        assert len(response.context["featured_dogs"]) == 6
@@ -0,0 +1,89 @@
+"""
+Full-Text Search Tests
+
+Tests for the free-text dog search (FTS5 on SQLite, tsvector on PostgreSQL).
+"""
+
+import pytest
+from django.urls import reverse
+
+from dogs.forms import DogSearchForm
+from dogs.models import Dog
+from services.search_service import build_fts_query, rebuild_search_index, search_dogs
+
+
+@pytest.fixture
+def searchable_dogs(db, user, user2):
+    def make(owner, name, breed, temperament, description):
+        return Dog.objects.create(
+            owner=owner,
+            name=name,
+            breed=breed,
+            age=3,
+            gender="F",
+            size="M",
+            temperament=temperament,
+            looking_for="playmate",
+            description=description,
+        )
+
+    return {
+        "lab": make(user, "Луна", "Лабрадор", "спокойный", "Любит плавать"),
+        "beagle": make(user2, "Рыжик", "Бигль", "энергичный", "Обожает лабрадоров"),
+        "pug": make(user2, "Пуся", "Мопс", "дружелюбный", "Любит спать на диване"),
+    }
+
+
+@pytest.mark.services
+class TestFullTextSearch:
+    """Test the search service."""
+
+    def test_build_fts_query_quotes_tokens(self):
+        assert build_fts_query('лабрадор OR "x') == '"лабрадор"* "or"* "x"*'
+        assert build_fts_query("  ,,, ") == ""
+
+    def test_search_matches_breed_temperament_and_description(self, searchable_dogs):
+        assert list(search_dogs({"q": "энергичный"})) == [searchable_dogs["beagle"]]
+        assert list(search_dogs({"q": "диване"})) == [searchable_dogs["pug"]]
+
+    def test_breed_match_ranks_above_description_match(self, searchable_dogs):
+        results = list(search_dogs({"q": "лабрадор"}))
+        assert results == [searchable_dogs["lab"], searchable_dogs["beagle"]]
+
+    def test_text_search_combines_with_filters(self, searchable_dogs):
+        assert list(search_dogs({"q": "любит", "breed": "Мопс"})) == [
+            searchable_dogs["pug"]
+        ]
+
+    def test_index_follows_updates_and_deletes(self, searchable_dogs):
+        pug = searchable_dogs["pug"]
+        pug.description = "Охраняет двор"
+        pug.save()
+        assert list(search_dogs({"q": "двор"})) == [pug]
+        assert list(search_dogs({"q": "диване"})) == []
+
+        pug.delete()
+        assert list(search_dogs({"q": "двор"})) == []
+
+    def test_rebuild_search_index(self, searchable_dogs):
+        assert rebuild_search_index() == 3
+        assert list(search_dogs({"q": "плавать"})) == [searchable_dogs["lab"]]
+
+
+@pytest.mark.views
+class TestDogListTextSearch:
+    """Test the free-text box on dog_list."""
+
+    def test_search_form_exposes_text_field(self):
+        form = DogSearchForm(data={"q": "лабрадор"})
+        assert form.is_valid()
+        assert form.cleaned_data["q"] == "лабрадор"
+
+    def test_dog_list_text_search(self, client, searchable_dogs):
+        response = client.get(reverse("dogs:dog_list"), {"q": "диване"})
+        assert list(response.context["page_obj"].object_list) == [
+            searchable_dogs["pug"]
+        ]
+        assert (
+            response.context["query_string"] == "q=%D0%B4%D0%B8%D0%B2%D0%B0%D0%BD%D0%B5"
+        )
@@ -0,0 +1,218 @@
+"""
+Image Rendition Tests
+
+Tests for the WebP/JPEG rendition pipeline and the responsive_image tag.
+"""
+
+import base64
+from io import BytesIO, StringIO
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.template import Context, Template
+from PIL import Image
+
+from dogs.models import Dog
+from services.cache_service import DOG_VERSION, get_version
+from services.image_service import (
+    AVATAR_RENDITION_SIZES,
+    DOG_RENDITION_SIZES,
+    backfill_lqip,
+    backfill_renditions,
+)
+from services.photo_queue_service import process_photo_queue
+
+
+@pytest.fixture
+def large_image():
+    def make(name, size=(1600, 1200), color="green"):
+        buffer = BytesIO()
+        Image.new("RGB", size, color=color).save(buffer, format="PNG")
+        return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/png")
+
+    return make
+
+
+@pytest.fixture
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    return tmp_path
+
+
+@pytest.mark.services
+class TestRenditionPipeline:
+    """Test rendition generation for uploads and existing media."""
+
+    def test_upload_creates_all_sizes_and_formats(self, dog, media_root, large_image):
+        dog.photo = large_image("rex.png")
+        dog.save()
+        process_photo_queue()
+        dog.refresh_from_db()
+
+        assert set(dog.photo_renditions) == set(DOG_RENDITION_SIZES)
+        card = dog.photo_renditions["card"]
+        assert (card["width"], card["height"]) == (400, 300)
+        for image_format, pillow_format in (("webp", "WEBP"), ("jpeg", "JPEG")):
+            with Image.open(media_root / card[image_format]) as image:
+                assert image.format == pillow_format
+                assert image.size == (400, 300)
+
+    def test_small_images_are_not_upscaled(self, dog, media_root, large_image):
+        dog.photo = large_image("tiny.png", size=(100, 80))
+        dog.save()
+        process_photo_queue()
+        dog.refresh_from_db()
+
+        assert dog.photo_renditions["detail"]["width"] == 100
+
+    def test_new_upload_replaces_renditions(self, dog, media_root, large_image):
+        dog.photo = large_image("first.png")
+        dog.save()
+        process_photo_queue()
+        dog.refresh_from_db()
+        first_card = dog.photo_renditions["card"]["webp"]
+
+        dog.photo = large_image("second.png", color="purple")
+        dog.save()
+        process_photo_queue()
+        dog.refresh_from_db()
+
+        stem = dog.photo.name.rsplit(".", 1)[0]
+        assert dog.photo_renditions["card"]["webp"] == f"renditions/{stem}/card.webp"
+        assert dog.photo_renditions["card"]["webp"] != first_card
+
+    def test_clearing_photo_clears_renditions(self, dog, media_root, large_image):
+        dog.photo = large_image("rex.png")
+        dog.save()
+        dog.photo = None
+        dog.save()
+        dog.refresh_from_db()
+
+        assert dog.photo_renditions == {}
+
+    def test_avatar_renditions(self, user_profile, media_root, large_image):
+        user_profile.avatar = large_image("me.png")
+        user_profile.save()
+        user_profile.refresh_from_db()
+
+        assert set(user_profile.avatar_renditions) == set(AVATAR_RENDITION_SIZES)
+
+    def test_backfill_renders_missing(self, dog, media_root, large_image):
+        dog.photo = large_image("rex.png")
+        dog.save()
+        Dog.objects.update(photo_renditions={})
+        version = get_version(DOG_VERSION)
+
+        assert backfill_renditions() == {"dogs": 1, "avatars": 0}
+        assert get_version(DOG_VERSION) != version
+        version = get_version(DOG_VERSION)
+        assert backfill_renditions() == {"dogs": 0, "avatars": 0}
+        assert get_version(DOG_VERSION) == version
+        assert backfill_renditions(force=True)["dogs"] == 1
+
+    def test_backfill_command(self, dog, media_root, large_image):
+        dog.photo = large_image("rex.png")
+        dog.save()
+        Dog.objects.update(photo_renditions={})
+        out = StringIO()
+
+        call_command("backfill_renditions", stdout=out)
+        assert "Rendered 1 dog photos and 0 avatars." in out.getvalue()
+
+
+@pytest.mark.services
+class TestPhotoLqip:
+    """Test the inline low-quality previews of dog photos."""
+
+    def test_processing_stores_tiny_preview(self, dog, media_root, large_image):
+        dog.photo = large_image("rex.png")
+        dog.save()
+        process_photo_queue()
+        dog.refresh_from_db()
+
+        assert dog.photo_lqip.startswith("data:image/webp;base64,")
+        encoded = dog.photo_lqip.split(",", 1)[1]
+        with Image.open(BytesIO(base64.b64decode(encoded))) as preview:
+            assert max(preview.size) == 16
+
+    def test_new_upload_resets_preview(self, dog, media_root, large_image):
+        dog.photo = large_image("rex.png")
+        dog.save()
+        process_photo_queue()
+        dog.refresh_from_db()
+
+        dog.photo = large_image("max.png", color="purple")
+        dog.save()
+        dog.refresh_from_db()
+        assert dog.photo_lqip == ""
+
+    def test_backfill_fills_missing(self, dog, media_root, large_image):
+        dog.photo = large_image("rex.png")
+        dog.save()
+        process_photo_queue()
+        Dog.objects.update(photo_lqip="")
+
+        assert backfill_lqip() == 1
+        assert backfill_lqip() == 0
+        dog.refresh_from_db()
+        assert dog.photo_lqip.startswith("data:image/webp;base64,")
+
+    def test_backfill_command(self, dog, media_root, large_image):
+        dog.photo = large_image("rex.png")
+        dog.save()
+        process_photo_queue()
+        Dog.objects.update(photo_lqip="")
+        out = StringIO()
+
+        call_command("backfill_lqip", workers=0, stdout=out)
+        assert "Stored 1 photo previews." in out.getvalue()
+
+    def test_tag_renders_preview_background(self, dog, media_root, large_image):
+        dog.photo = large_image("rex.png")
+        dog.save()
+        process_photo_queue()
+        dog.refresh_from_db()
+
+        html = Template(
+            "{% load dogs_tags %}"
+            '{% responsive_image dog.photo dog.photo_renditions "card" '
+            "placeholder=dog.photo_lqip %}"
+        ).render(Context({"dog": dog}))
+        assert f"background: url({dog.photo_lqip}) center / cover" in html
+
+
+@pytest.mark.services
+class TestResponsiveImageTag:
+    """Test the responsive_image template tag."""
+
+    template = Template(
+        "{% load dogs_tags %}"
+        '{% responsive_image dog.photo dog.photo_renditions "card" alt=dog.name %}'
+    )
+
+    def test_emits_picture_with_srcset(self, dog, media_root, large_image):
+        dog.photo = large_image("rex.png")
+        dog.save()
+        process_photo_queue()
+        dog.refresh_from_db()
+
+        html = self.template.render(Context({"dog": dog}))
+        assert html.startswith("<picture>")
+        assert 'type="image/webp"' in html
+        assert "card.webp 400w" in html
+        assert "thumb.jpg 160w" in html
+        assert 'width="400" height="300"' in html
+        assert 'loading="lazy"' in html
+
+    def test_falls_back_to_original(self, dog, media_root, large_image):
+        dog.photo = large_image("rex.png")
+        dog.save()
+        Dog.objects.update(photo_renditions={})
+        dog.refresh_from_db()
+
+        html = self.template.render(Context({"dog": dog}))
+        assert html.startswith(f'<img src="{dog.photo.url}"')
+
+    def test_empty_without_photo(self, dog):
+        assert self.template.render(Context({"dog": dog})) == ""
@@ -0,0 +1,193 @@
+"""
+Media Service Tests
+
+Tests for the photo availability flag and its reconciliation with storage.
+"""
+
+import os
+import time
+from io import BytesIO, StringIO
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from PIL import Image
+
+from dogs.models import Dog
+from services.media_service import (
+    collect_orphaned_media,
+    iter_media_files,
+    reconcile_photo_flags,
+)
+from services.photo_queue_service import process_photo_queue
+
+
+@pytest.fixture
+def photo_upload():
+    def make(name, color="blue"):
+        buffer = BytesIO()
+        Image.new("RGB", (10, 10), color=color).save(buffer, format="PNG")
+        return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/png")
+
+    return make
+
+
+@pytest.fixture
+def dogs_with_photos(multiple_dogs, settings, tmp_path, photo_upload):
+    settings.MEDIA_ROOT = tmp_path
+    for index, dog in enumerate(multiple_dogs[:4]):
+        dog.photo = photo_upload(f"{dog.name}.png", color=(0, 0, index * 20))
+        dog.save()
+    process_photo_queue()
+    return multiple_dogs[:4]
+
+
+@pytest.mark.services
+class TestPhotoAvailableFlag:
+    """Test that saving a dog keeps photo_available up to date."""
+
+    def test_upload_sets_flag(self, dogs_with_photos):
+        for dog in dogs_with_photos:
+            dog.refresh_from_db()
+            assert dog.photo_available is True
+            assert dog.has_photo is True
+
+    def test_clearing_photo_resets_flag(self, dogs_with_photos):
+        dog = dogs_with_photos[0]
+        dog.photo = None
+        dog.save()
+        dog.refresh_from_db()
+        assert dog.photo_available is False
+        assert dog.has_photo is False
+
+    def test_has_photo_does_not_touch_storage(self, dogs_with_photos, monkeypatch):
+        dog = Dog.objects.get(pk=dogs_with_photos[0].pk)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("storage.exists() called")
+
+        monkeypatch.setattr(dog.photo.storage, "exists", fail)
+        assert dog.has_photo is True
+
+
+@pytest.mark.services
+class TestReconcilePhotoFlags:
+    """Test the storage reconciler."""
+
+    def test_iter_media_files_walks_subdirectories(self, dogs_with_photos, tmp_path):
+        names = {entry.name for entry in iter_media_files("dogs", root=tmp_path)}
+        assert len(names) == len(dogs_with_photos)
+
+    def test_clears_flag_for_missing_files(self, dogs_with_photos):
+        missing = dogs_with_photos[0]
+        missing.photo.storage.delete(missing.photo.name)
+
+        before = Dog.objects.get(pk=missing.pk).updated_at
+
+        assert reconcile_photo_flags(batch_size=2) == {"marked": 0, "cleared": 1}
+        missing.refresh_from_db()
+        assert missing.photo_available is False
+        # Cards and page validators are keyed by updated_at
+        assert missing.updated_at > before
+
+    def test_marks_existing_files(self, dogs_with_photos):
+        Dog.objects.update(photo_available=False)
+
+        assert reconcile_photo_flags(batch_size=3) == {"marked": 4, "cleared": 0}
+        assert Dog.objects.filter(photo_available=True).count() == 4
+
+    def test_dry_run_changes_nothing(self, dogs_with_photos):
+        Dog.objects.update(photo_available=False)
+
+        result = reconcile_photo_flags(dry_run=True)
+        assert result["marked"] == 4
+        assert not Dog.objects.filter(photo_available=True).exists()
+
+    def test_command_reports_changes(self, dogs_with_photos):
+        missing = dogs_with_photos[0]
+        missing.photo.storage.delete(missing.photo.name)
+        out = StringIO()
+
+        call_command("reconcile_photos", stdout=out)
+        assert "Marked 0 photos available, 1 missing." in out.getvalue()
+
+
+def age_media(root, hours=48):
+    """Backdate every file under ``root`` past the default grace period."""
+    old = time.time() - hours * 3600
+    for entry in iter_media_files(root=root):
+        os.utime(entry.path, (old, old))
+
+
+@pytest.fixture
+def orphaned_media(dogs_with_photos, tmp_path):
+    """An unreferenced photo with a rendition and an abandoned upload."""
+    (tmp_path / "dogs" / "old").mkdir()
+    (tmp_path / "dogs" / "old" / "gone.jpg").write_bytes(b"x" * 100)
+    (tmp_path / "renditions" / "dogs" / "old" / "gone").mkdir(parents=True)
+    (tmp_path / "renditions" / "dogs" / "old" / "gone" / "card.webp").write_bytes(
+        b"x" * 20
+    )
+    (tmp_path / "dogs" / ".upload-abc").write_bytes(b"x" * 5)
+    age_media(tmp_path)
+    return tmp_path
+
+
+@pytest.mark.services
+class TestCollectOrphanedMedia:
+    """Test the media garbage collector."""
+
+    def test_deletes_only_orphans(self, orphaned_media):
+        stats = collect_orphaned_media(batch_size=2)
+
+        assert stats["deleted"] == 3
+        assert stats["bytes"] == 125
+        assert not (orphaned_media / "dogs" / "old").exists()
+        assert not (orphaned_media / "renditions" / "dogs" / "old").exists()
+        assert not (orphaned_media / "dogs" / ".upload-abc").exists()
+        for dog in Dog.objects.all():
+            if dog.photo:
+                assert dog.photo.storage.exists(dog.photo.name)
+                for entry in dog.photo_renditions.values():
+                    assert dog.photo.storage.exists(entry["jpeg"])
+
+    def test_keeps_recent_files(self, orphaned_media):
+        os.utime(orphaned_media / "dogs" / "old" / "gone.jpg")
+
+        stats = collect_orphaned_media()
+        assert stats["deleted"] == 2
+        assert (orphaned_media / "dogs" / "old" / "gone.jpg").exists()
+
+    def test_dry_run_deletes_nothing(self, orphaned_media):
+        stats = collect_orphaned_media(dry_run=True)
+
+        assert stats["deleted"] == 3
+        assert (orphaned_media / "dogs" / "old" / "gone.jpg").exists()
+
+    def test_keeps_renditions_of_legacy_photo_names(self, orphaned_media):
+        dog = Dog.objects.exclude(photo="").first()
+        (orphaned_media / "dogs" / "old" / "Legacy.JPG").write_bytes(b"x" * 10)
+        legacy = orphaned_media / "renditions" / "dogs" / "old" / "Legacy"
+        legacy.mkdir()
+        (legacy / "card.webp").write_bytes(b"x" * 10)
+        Dog.objects.filter(pk=dog.pk).update(photo="dogs/old/Legacy.JPG")
+        age_media(orphaned_media)
+
+        collect_orphaned_media()
+        assert (legacy / "card.webp").exists()
+        assert not (orphaned_media / "renditions" / "dogs" / "old" / "gone").exists()
+
+    def test_renditions_of_deleted_dog_are_collected(self, dogs_with_photos, tmp_path):
+        dog = Dog.objects.get(pk=dogs_with_photos[0].pk)
+        Dog.objects.filter(pk=dog.pk).delete()
+        age_media(tmp_path)
+
+        stats = collect_orphaned_media()
+        assert stats["deleted"] == 2 * 3
+        assert not dog.photo.storage.exists(dog.photo_renditions["card"]["webp"])
+
+    def test_command_reports_reclaimed_space(self, orphaned_media):
+        out = StringIO()
+
+        call_command("gc_media", "--dry-run", stdout=out)
+        assert "Would delete 3 orphans, reclaiming 125" in out.getvalue()
@@ -0,0 +1,116 @@
+"""
+Menu Service Tests
+
+Tests for the cached menu trees used by the draw_menu template tag.
+"""
+
+from unittest import mock
+
+import pytest
+from django.core.cache.backends.filebased import FileBasedCache
+from django.template import Context, Template
+from django.test import RequestFactory, override_settings
+
+from menu_app.models import Menu, MenuItem
+from services import menu_service
+from services.cache_service import MENU_VERSION, get_version
+from services.menu_service import get_menu
+
+
+@pytest.fixture
+def main_menu(db):
+    menu = Menu.objects.create(name="main_menu")
+    dogs = MenuItem.objects.create(
+        menu=menu, title="Собаки", named_url="dogs:dog_list", order=1
+    )
+    MenuItem.objects.create(
+        menu=menu, parent=dogs, title="Породы", named_url="dogs:breeds", order=1
+    )
+    MenuItem.objects.create(menu=menu, title="О нас", url="/about/", order=2)
+    return menu
+
+
+def render_menu(path="/"):
+    request = RequestFactory().get(path)
+    template = Template("{% load menu_tags %}{% draw_menu 'main_menu' %}")
+    return template.render(Context({"request": request}))
+
+
+@pytest.mark.services
+class TestMenuTreeCache:
+    """Test the process-local menu cache."""
+
+    def test_tree_resolves_urls(self, main_menu):
+        tree = get_menu("main_menu")["tree"]
+
+        assert [node["title"] for node in tree] == ["Собаки", "О нас"]
+        assert tree[0]["url"] == "/dogs/"
+        assert tree[0]["children"][0]["url"] == "/breeds/"
+
+    def test_cached_tree_needs_no_queries(self, main_menu, django_assert_num_queries):
+        render_menu()
+        with django_assert_num_queries(0):
+            html = render_menu()
+        assert "О нас" in html
+
+    def test_page_reads_the_menu_version_once(self, main_menu):
+        request = RequestFactory().get("/")
+        template = Template(
+            "{% load menu_tags %}{% draw_menu 'main_menu' %}{% draw_menu 'footer' %}"
+        )
+        template.render(Context({"request": request}))
+
+        with mock.patch.object(
+            menu_service, "get_version", wraps=get_version
+        ) as lookups:
+            template.render(Context({"request": RequestFactory().get("/")}))
+        lookups.assert_called_once_with(MENU_VERSION)
+
+    def test_item_change_invalidates_tree(self, main_menu):
+        render_menu()
+        MenuItem.objects.filter(title="О нас").get().delete()
+
+        assert "О нас" not in render_menu()
+
+    def test_unknown_menu_is_empty(self, db):
+        assert get_menu("missing")["tree"] == []
+
+    def test_active_index_includes_ancestors(self, main_menu):
+        menu = get_menu("main_menu")
+        dogs, about = menu["tree"]
+        breeds = dogs["children"][0]
+
+        assert menu["active"]["/breeds/"] == {dogs["id"], breeds["id"]}
+        assert menu["active"]["/about/"] == {about["id"]}
+
+    def test_active_branch_is_expanded(self, main_menu):
+        html = render_menu("/breeds/")
+
+        assert "active-link" in html
+        assert "collapsed" not in html
+        assert "collapsed" in render_menu("/about/")
+
+    def test_html_is_cached_per_active_branch(self, main_menu):
+        render_menu("/breeds/")
+        render_menu("/breeds/")
+        render_menu("/unknown/")
+        render_menu("/elsewhere/")
+
+        assert len(get_menu("main_menu")["html"]) == 2
+
+    def test_version_is_read_from_the_shared_cache(self, main_menu, tmp_path):
+        """An edit handled by another worker reaches this process's trees."""
+        location = str(tmp_path / "cache")
+        shared = {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache"}
+        with override_settings(CACHES={"default": {**shared, "LOCATION": location}}):
+            get_menu("main_menu")
+            # Another worker: its own backend instance on the same storage
+            other_worker = FileBasedCache(location, {})
+            MenuItem.objects.filter(title="О нас").update(title="Контакты")
+            other_worker.incr(f"{MENU_VERSION}:version")
+
+            assert other_worker.get(f"{MENU_VERSION}:version") == get_version(
+                MENU_VERSION
+            )
+            titles = [node["title"] for node in get_menu("main_menu")["tree"]]
+            assert titles == ["Собаки", "Контакты"]
@@ -0,0 +1,123 @@
+"""
+Photo Queue Tests
+
+Tests for the background photo processing queue and the process_images command.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO, StringIO
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from PIL import Image
+
+from dogs.models import Dog
+from services.cache_service import DOG_VERSION, get_version
+from services.photo_queue_service import (
+    claim_photo_jobs,
+    complete_photo_job,
+    process_photo_queue,
+    requeue_stuck_jobs,
+)
+
+
+@pytest.fixture
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    return tmp_path
+
+
+@pytest.fixture
+def png_upload():
+    def make(name):
+        buffer = BytesIO()
+        Image.new("RGB", (600, 400), color="orange").save(buffer, format="PNG")
+        return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/png")
+
+    return make
+
+
+@pytest.fixture
+def queued_dog(dog, media_root, png_upload):
+    dog.photo = png_upload("rex.png")
+    dog.save()
+    return dog
+
+
+@pytest.mark.services
+class TestPhotoQueue:
+    """Test queueing and processing of uploaded photos."""
+
+    def test_upload_only_enqueues(self, queued_dog, media_root):
+        queued_dog.refresh_from_db()
+
+        assert queued_dog.photo_status == Dog.PHOTO_STATUS_PENDING
+        assert queued_dog.photo_renditions == {}
+        assert queued_dog.has_photo is False
+        assert not (media_root / "renditions").exists()
+
+    def test_inline_processing_marks_ready(self, queued_dog):
+        assert process_photo_queue() == {"ready": 1}
+
+        queued_dog.refresh_from_db()
+        assert queued_dog.photo_status == Dog.PHOTO_STATUS_READY
+        assert queued_dog.photo_attempts == 0
+        assert queued_dog.has_photo is True
+        assert "card" in queued_dog.photo_renditions
+
+    def test_processed_batch_invalidates_dog_listings(self, queued_dog):
+        version = get_version(DOG_VERSION)
+
+        process_photo_queue()
+        assert get_version(DOG_VERSION) != version
+
+        version = get_version(DOG_VERSION)
+        process_photo_queue()
+        assert get_version(DOG_VERSION) == version
+
+    def test_process_pool(self, queued_dog):
+        context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            assert process_photo_queue(executor) == {"ready": 1}
+
+        queued_dog.refresh_from_db()
+        assert queued_dog.photo_status == Dog.PHOTO_STATUS_READY
+
+    def test_broken_image_is_retried_then_failed(self, dog, media_root):
+        dog.photo = SimpleUploadedFile("broken.png", b"not an image")
+        dog.save()
+
+        stats = process_photo_queue(attempts_limit=2)
+
+        assert stats == {"retried": 1, "failed": 1}
+        dog.refresh_from_db()
+        assert dog.photo_status == Dog.PHOTO_STATUS_FAILED
+        assert dog.photo_attempts == 2
+        assert dog.has_photo is False
+
+    def test_replaced_photo_is_not_overwritten(self, queued_dog, png_upload):
+        [(dog_id, photo_name)] = claim_photo_jobs(10)
+        queued_dog.photo = png_upload("newer.png")
+        queued_dog.save()
+
+        assert complete_photo_job(dog_id, photo_name, {"card": {}}) is False
+        queued_dog.refresh_from_db()
+        assert queued_dog.photo_status == Dog.PHOTO_STATUS_PENDING
+
+    def test_requeue_stuck_jobs(self, queued_dog):
+        claim_photo_jobs(10)
+
+        assert process_photo_queue() == {}
+        assert requeue_stuck_jobs() == 1
+        assert process_photo_queue() == {"ready": 1}
+
+    def test_process_images_command(self, queued_dog):
+        out = StringIO()
+
+        call_command("process_images", "--once", "--workers", "0", stdout=out)
+
+        assert "Ready: 1, retried: 0, failed: 0" in out.getvalue()
+        queued_dog.refresh_from_db()
+        assert queued_dog.photo_status == Dog.PHOTO_STATUS_READY
@@ -0,0 +1,147 @@
+"""
+Photo Reprocessing Tests
+
+Tests for EXIF normalization of existing photos and the reprocess_photos command.
+"""
+
+import json
+from datetime import timedelta
+from io import BytesIO, StringIO
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.utils import timezone
+from PIL import Image
+
+from dogs.models import Dog
+from services.photo_queue_service import process_photo_queue
+from services.photo_reprocess_service import reprocess_photos
+
+ORIENTATION_TAG = 0x0112
+
+
+@pytest.fixture
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    return tmp_path
+
+
+@pytest.fixture
+def rotated_photo_dog(dog, media_root):
+    """A dog with a 60x30 JPEG whose EXIF says "rotate 90° clockwise"."""
+    exif = Image.Exif()
+    exif[ORIENTATION_TAG] = 6
+    exif[0x010F] = "PhoneMaker"
+    buffer = BytesIO()
+    Image.new("RGB", (60, 30), color="teal").save(
+        buffer, format="JPEG", exif=exif.tobytes()
+    )
+    dog.photo = SimpleUploadedFile("phone.jpg", buffer.getvalue(), "image/jpeg")
+    dog.save()
+    process_photo_queue()
+    dog.refresh_from_db()
+    return dog
+
+
+@pytest.fixture
+def oversized_photo_dog(dog, media_root):
+    """A dog with a noisy quality-100 JPEG that carries no metadata."""
+    buffer = BytesIO()
+    Image.effect_noise((120, 120), 60).convert("RGB").save(
+        buffer, format="JPEG", quality=100
+    )
+    dog.photo = SimpleUploadedFile("scan.jpg", buffer.getvalue(), "image/jpeg")
+    dog.save()
+    process_photo_queue()
+    dog.refresh_from_db()
+    return dog
+
+
+@pytest.mark.services
+class TestReprocessPhotos:
+    """Test re-encoding of photos with EXIF metadata."""
+
+    def test_applies_orientation_and_strips_metadata(
+        self, rotated_photo_dog, django_capture_on_commit_callbacks
+    ):
+        old_name = rotated_photo_dog.photo.name
+        with django_capture_on_commit_callbacks(execute=True):
+            stats = reprocess_photos()
+
+        assert stats["processed"] == 1
+        dog = Dog.objects.get(pk=rotated_photo_dog.pk)
+        assert dog.photo.name != old_name
+        assert not dog.photo.storage.exists(old_name)
+        with dog.photo.open("rb") as file, Image.open(file) as image:
+            assert image.size == (30, 60)
+            assert not image.getexif()
+
+    def test_requeues_renditions(self, rotated_photo_dog):
+        reprocess_photos()
+
+        dog = Dog.objects.get(pk=rotated_photo_dog.pk)
+        assert dog.photo_status == Dog.PHOTO_STATUS_PENDING
+        assert dog.photo_renditions == {}
+        assert dog.photo_lqip == ""
+
+    def test_second_run_skips_clean_photos(self, rotated_photo_dog):
+        reprocess_photos()
+        stats = reprocess_photos()
+
+        assert stats["processed"] == 0
+        assert stats["skipped"] == 1
+
+    def test_reencodes_oversized_photos_without_metadata(self, oversized_photo_dog):
+        old_size = oversized_photo_dog.photo.size
+
+        stats = reprocess_photos(quality=60)
+
+        assert stats["processed"] == 1
+        assert stats["bytes_after"] < stats["bytes_before"] == old_size
+        assert reprocess_photos(quality=60)["skipped"] == 1
+
+    def test_since_filter(self, rotated_photo_dog):
+        stats = reprocess_photos(since=timezone.now() + timedelta(days=1))
+        assert not stats
+
+    def test_resumes_after_checkpoint(self, rotated_photo_dog):
+        checkpoints = []
+
+        stats = reprocess_photos(
+            start_after=rotated_photo_dog.pk,
+            on_batch=lambda last_pk, stats: checkpoints.append(last_pk),
+        )
+        assert stats["processed"] == 0
+        assert checkpoints == []
+
+        reprocess_photos(on_batch=lambda last_pk, stats: checkpoints.append(last_pk))
+        assert checkpoints == [rotated_photo_dog.pk]
+
+
+@pytest.mark.services
+class TestReprocessPhotosCommand:
+    """Test the reprocess_photos management command."""
+
+    def test_reports_throughput_and_clears_progress(
+        self, rotated_photo_dog, media_root
+    ):
+        out = StringIO()
+
+        call_command("reprocess_photos", workers=0, stdout=out)
+        assert "Processed 1, skipped 0, failed 0, stale 0 photos" in out.getvalue()
+        assert "photos/s" in out.getvalue()
+        assert not (media_root / ".reprocess_photos.json").exists()
+
+    def test_resumes_from_state_file(self, rotated_photo_dog, tmp_path):
+        state_file = tmp_path / "progress.json"
+        state_file.write_text(
+            json.dumps({"since": None, "last_pk": rotated_photo_dog.pk})
+        )
+        out = StringIO()
+
+        call_command(
+            "reprocess_photos", workers=0, state_file=str(state_file), stdout=out
+        )
+        assert f"Resuming after dog #{rotated_photo_dog.pk}." in out.getvalue()
+        assert "Processed 0" in out.getvalue()
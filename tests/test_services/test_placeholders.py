@@ -0,0 +1,65 @@
+"""
+Placeholder Image Tests
+
+Tests for the pre-rendered placeholder assets and the placeholder_image tag.
+"""
+
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.template import Context, Template
+
+from dogs.utils import (
+    PLACEHOLDERS,
+    create_default_avatar,
+    create_default_dog_image,
+    render_placeholder_svg,
+)
+
+
+@pytest.mark.services
+class TestPlaceholders:
+    """Test placeholder rendering and caching."""
+
+    def test_pillow_placeholders_are_rendered_once(self, monkeypatch):
+        from dogs import utils
+
+        create_default_dog_image()
+        create_default_avatar()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("placeholder rendered again")
+
+        monkeypatch.setattr(utils.Image, "new", fail)
+        first, second = create_default_dog_image(), create_default_dog_image()
+        assert first.read() == second.read()
+        assert create_default_avatar().name == "default_avatar.png"
+
+    def test_svg_variants(self):
+        for variant in PLACEHOLDERS:
+            svg = render_placeholder_svg(variant)
+            assert svg.startswith("<svg")
+            assert PLACEHOLDERS[variant]["text"] in svg
+
+    def test_static_files_are_up_to_date(self, tmp_path):
+        call_command("render_placeholders", output_dir=tmp_path, stdout=StringIO())
+
+        from django.contrib.staticfiles import finders
+
+        for variant in PLACEHOLDERS:
+            committed = finders.find(f"dogs/img/placeholders/{variant}.svg")
+            assert committed, f"{variant}.svg missing, run render_placeholders"
+            with open(committed, encoding="utf-8") as committed_file:
+                assert committed_file.read() == (tmp_path / f"{variant}.svg").read_text(
+                    encoding="utf-8"
+                )
+
+    def test_placeholder_image_tag(self):
+        html = Template(
+            '{% load dogs_tags %}{% placeholder_image "avatar" alt="Rex" %}'
+        ).render(Context())
+
+        assert 'src="/static/dogs/img/placeholders/avatar.svg"' in html
+        assert 'alt="Rex"' in html
+        assert 'width="120" height="120"' in html
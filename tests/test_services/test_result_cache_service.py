@@ -0,0 +1,148 @@
+"""
+dog_list Result Cache Tests
+
+Tests for the per-filter-signature page cache and its invalidation.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+from django.conf import settings
+from django.core.management import call_command
+from django.urls import reverse
+
+from dogs.models import Dog
+from services.result_cache_service import get_cache_stats, get_dog_page
+
+
+@pytest.mark.services
+class TestResultCache:
+    """Test caching of dog_list pages."""
+
+    def test_hit_hydrates_with_single_query(
+        self, multiple_dogs, django_assert_num_queries
+    ):
+        first = get_dog_page({"size": "S"}, 1)
+        with django_assert_num_queries(1):
+            second = get_dog_page({"size": "S", "gender": ""}, "1")
+            ids = [dog.pk for dog in second.object_list]
+            owners = [dog.owner.username for dog in second.object_list]
+
+        assert ids == [dog.pk for dog in first.object_list]
+        assert len(owners) == 5
+        assert second.paginator.count == 5
+        assert get_cache_stats() == {"hits": 1, "misses": 1, "hit_ratio": 0.5}
+
+    def test_pages_are_cached_separately(self, multiple_dogs):
+        page1 = get_dog_page({}, 1)
+        page2 = get_dog_page({}, 2)
+        cached_page2 = get_dog_page({}, "2")
+
+        assert len(page1.object_list) == 12
+        assert [d.pk for d in cached_page2.object_list] == [
+            d.pk for d in page2.object_list
+        ]
+        assert cached_page2.number == 2
+        assert not cached_page2.has_next()
+
+    def test_invalid_page_number_falls_back_to_first(self, multiple_dogs):
+        assert get_dog_page({}, "abc").number == 1
+        assert get_dog_page({}, 99).number == 2
+
+    @pytest.mark.parametrize("change", ["create", "update", "delete"])
+    def test_dog_changes_invalidate_cache(self, multiple_dogs, user, change):
+        before = get_dog_page({"size": "S"}, 1).paginator.count
+
+        if change == "create":
+            Dog.objects.create(
+                owner=user,
+                name="New",
+                breed="Мопс",
+                age=2,
+                gender="F",
+                size="S",
+                temperament="calm",
+                looking_for="playmate",
+                description="New dog",
+            )
+            expected = before + 1
+        elif change == "update":
+            dog = multiple_dogs[1]
+            dog.size = "S"
+            dog.save()
+            expected = before + 1
+        else:
+            multiple_dogs[0].delete()
+            expected = before - 1
+
+        assert get_dog_page({"size": "S"}, 1).paginator.count == expected
+
+    def test_admin_deactivation_invalidates_cache(self, admin_client, multiple_dogs):
+        before = get_dog_page({"size": "S"}, 1).paginator.count
+
+        response = admin_client.post(
+            reverse("admin:dogs_dog_changelist"),
+            {"action": "deactivate_dogs", "_selected_action": [multiple_dogs[0].pk]},
+        )
+
+        assert response.status_code == 302
+        assert get_dog_page({"size": "S"}, 1).paginator.count == before - 1
+
+    def test_hit_skips_dogs_deactivated_meanwhile(self, multiple_dogs):
+        first = get_dog_page({"size": "S"}, 1)
+        hidden = first.object_list[0]
+        # update() skips the signal that would bump the cache version
+        Dog.objects.filter(pk=hidden.pk).update(is_active=False)
+
+        cached = get_dog_page({"size": "S"}, 1)
+        assert get_cache_stats()["hits"] == 1
+        assert hidden not in cached.object_list
+        assert len(cached.object_list) == len(first.object_list) - 1
+
+    def test_cache_stats_command(self, multiple_dogs, capsys):
+        get_dog_page({}, 1)
+        get_dog_page({}, 1)
+        call_command("search_cache_stats")
+        assert "hit ratio: 50.0%" in capsys.readouterr().out
+
+    def test_dog_list_uses_cache(self, client, multiple_dogs):
+        client.get(reverse("dogs:dog_list"), {"gender": "F"})
+        response = client.get(reverse("dogs:dog_list"), {"gender": "F"})
+        assert response.context["total_results"] == 7
+        assert get_cache_stats()["hits"] == 1
+
+
+def _load_production_settings(cache_url):
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": "project.settings.production"}
+    env.pop("CACHE_URL", None)
+    if cache_url:
+        env["CACHE_URL"] = cache_url
+    code = "import django; django.setup(); from django.conf import settings; "
+    code += "print(settings.CACHES['default']['BACKEND'])"
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=settings.BASE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+
+@pytest.mark.services
+@pytest.mark.parametrize("cache_url", [None, "locmemcache://", "dbcache://cache"])
+def test_production_requires_a_shared_atomic_cache(cache_url):
+    """Versions and stats must not live in a per-worker or SQL cache."""
+    result = _load_production_settings(cache_url)
+
+    assert result.returncode != 0
+    assert "ImproperlyConfigured" in result.stderr
+
+
+@pytest.mark.services
+def test_production_accepts_redis():
+    result = _load_production_settings("redis://localhost:6379/1")
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "django.core.cache.backends.redis.RedisCache"
@@ -0,0 +1,54 @@
+"""
+Warmup Tests
+
+Tests for the per-process startup warmup and the warmup command.
+"""
+
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.template import Context, Template
+from django.test import RequestFactory
+
+from menu_app.models import Menu, MenuItem
+from services.warmup_service import warm_templates, warm_up
+
+
+@pytest.fixture
+def main_menu(db):
+    menu = Menu.objects.create(name="main_menu")
+    MenuItem.objects.create(menu=menu, title="Собаки", named_url="dogs:dog_list")
+    return menu
+
+
+@pytest.mark.services
+class TestWarmup:
+    """Test the startup warmup steps."""
+
+    def test_compiles_app_templates(self):
+        assert warm_templates() > 20
+
+    def test_reports_every_step(self, main_menu):
+        timings = warm_up()
+
+        assert set(timings) == {"urls", "templates", "menus"}
+        assert timings["menus"][0] == 1
+
+    def test_menus_render_without_queries_after_warmup(
+        self, main_menu, django_assert_num_queries
+    ):
+        warm_up()
+        template = Template("{% load menu_tags %}{% draw_menu 'main_menu' %}")
+        request = RequestFactory().get("/dogs/")
+
+        with django_assert_num_queries(0):
+            html = template.render(Context({"request": request}))
+        assert "active-link" in html
+
+    def test_command_prints_timings(self, main_menu):
+        out = StringIO()
+
+        call_command("warmup", stdout=out)
+        assert "menus: 1 in" in out.getvalue()
+        assert "Warmup took" in out.getvalue()
@@ -4,10 +4,20 @@ Dog CRUD View Tests
 Tests for dog profile creation, reading, updating, and deletion views.
 """
 
+from datetime import timedelta
+from io import BytesIO
+
 import pytest
+from django.core.cache.backends.filebased import FileBasedCache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
 from django.urls import reverse
+from django.utils import timezone
+from PIL import Image
 
-from dogs.models import Dog
+from dogs.models import Dog, Favorite
+from services.cache_service import DOG_VERSION
+from services.photo_queue_service import process_photo_queue
 
 
 @pytest.mark.views
@@ -284,3 +294,119 @@ class TestFavoritesListView:
         response = authenticated_client.get(reverse("dogs:favorites_list"))
         assert response.status_code == 200
         assert "page_obj" in response.context
+
+
+@pytest.mark.views
+class TestConditionalGet:
+    """Test ETag/Last-Modified handling of dog pages."""
+
+    def test_dog_detail_revalidates_with_etag(self, authenticated_client, other_dog):
+        url = reverse("dogs:dog_detail", kwargs={"pk": other_dog.pk})
+        response = authenticated_client.get(url)
+        assert response["ETag"].startswith('W/"')
+        assert "Last-Modified" in response
+
+        repeat = authenticated_client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        assert repeat.status_code == 304
+        assert repeat.content == b""
+
+    def test_dog_detail_revalidates_with_last_modified(self, client, dog):
+        url = reverse("dogs:dog_detail", kwargs={"pk": dog.pk})
+        response = client.get(url)
+
+        repeat = client.get(url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"])
+        assert repeat.status_code == 304
+
+    def test_dog_detail_changes_with_favorite_state(
+        self, authenticated_client, other_dog, user
+    ):
+        url = reverse("dogs:dog_detail", kwargs={"pk": other_dog.pk})
+        etag = authenticated_client.get(url)["ETag"]
+        favorite = Favorite.objects.create(user=user, dog=other_dog)
+        favorited = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert favorited.status_code == 200
+
+        favorite.delete()
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=favorited["ETag"])
+        assert response.status_code == 200
+
+    def test_dog_detail_changes_with_owner_name(self, client, dog, user):
+        url = reverse("dogs:dog_detail", kwargs={"pk": dog.pk})
+        Dog.objects.filter(pk=dog.pk).update(
+            updated_at=timezone.now() - timedelta(hours=1)
+        )
+        response = client.get(url)
+
+        user.username = "renamed_owner"
+        user.save()
+        assert (
+            client.get(
+                url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+            ).status_code
+            == 200
+        )
+        renamed = client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        assert renamed.status_code == 200
+        assert "renamed_owner" in renamed.content.decode()
+
+    def test_dog_list_etag_follows_photo_processing(
+        self, client, dog, settings, tmp_path
+    ):
+        settings.MEDIA_ROOT = tmp_path
+        buffer = BytesIO()
+        Image.new("RGB", (60, 40), color="teal").save(buffer, format="PNG")
+        dog.photo = SimpleUploadedFile("rex.png", buffer.getvalue(), "image/png")
+        dog.save()
+        url = reverse("dogs:dog_list")
+        pending = client.get(url)
+        assert "<picture" not in pending.content.decode()
+
+        process_photo_queue(None)
+        response = client.get(url, HTTP_IF_NONE_MATCH=pending["ETag"])
+
+        assert response.status_code == 200
+        assert response["ETag"] != pending["ETag"]
+        assert "<picture" in response.content.decode()
+
+    def test_dog_list_etag_follows_dog_changes(self, client, dog):
+        url = reverse("dogs:dog_list")
+        etag = client.get(url)["ETag"]
+        assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+        dog.name = "Renamed"
+        dog.save()
+        assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+    def test_dog_list_etag_reads_the_shared_cache(self, client, dog, tmp_path):
+        location = str(tmp_path / "cache")
+        shared = {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache"}
+        url = reverse("dogs:dog_list")
+        with override_settings(CACHES={"default": {**shared, "LOCATION": location}}):
+            etag = client.get(url)["ETag"]
+            # A dog edit handled by another worker
+            FileBasedCache(location, {}).incr(f"{DOG_VERSION}:version")
+
+            assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+    def test_favorites_etag_follows_favorites(
+        self, authenticated_client, other_dog, user
+    ):
+        url = reverse("dogs:favorites_list")
+        etag = authenticated_client.get(url)["ETag"]
+        assert authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+        Favorite.objects.create(user=user, dog=other_dog)
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert other_dog.name in response.content.decode()
+
+    def test_pending_messages_skip_conditional_response(self, client, dog, user):
+        url = reverse("dogs:dog_detail", kwargs={"pk": dog.pk})
+        etag = client.get(url)["ETag"]
+        # Logging out leaves the anonymous viewer with a queued flash message
+        client.force_login(user)
+        client.get(reverse("dogs:logout"))
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert "Вы успешно вышли" in response.content.decode()
@@ -0,0 +1,120 @@
+"""
+Media Serving Tests
+
+Tests for the production media view: conditional GETs, ranges and caching.
+"""
+
+import pytest
+from django.utils.http import http_date
+
+from dogs.media_views import IMMUTABLE_MAX_AGE
+
+HASHED_NAME = f"dogs/ab/cd/{'ab' * 20}.png"
+BODY = bytes(range(256)) * 4
+
+
+@pytest.fixture
+def media_file(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    settings.MEDIA_ACCEL_REDIRECT_PREFIX = ""
+    path = tmp_path / HASHED_NAME
+    path.parent.mkdir(parents=True)
+    path.write_bytes(BODY)
+    return path
+
+
+def content(response):
+    return b"".join(response.streaming_content)
+
+
+@pytest.mark.views
+class TestServeMedia:
+    """Test serve_media."""
+
+    def test_serves_whole_file(self, client, media_file):
+        response = client.get(f"/media/{HASHED_NAME}")
+
+        assert response.status_code == 200
+        assert content(response) == BODY
+        assert response["Content-Type"] == "image/png"
+        assert response["Accept-Ranges"] == "bytes"
+        assert response["ETag"]
+
+    def test_hashed_names_are_immutable(self, client, media_file):
+        response = client.get(f"/media/{HASHED_NAME}")
+
+        assert response["Cache-Control"] == (
+            f"public, max-age={IMMUTABLE_MAX_AGE}, immutable"
+        )
+
+    def test_other_names_get_short_max_age(self, client, media_file, settings):
+        settings.MEDIA_CACHE_MAX_AGE = 60
+        (media_file.parent / "plain.png").write_bytes(b"x")
+
+        response = client.get("/media/dogs/ab/cd/plain.png")
+        assert response["Cache-Control"] == "public, max-age=60"
+
+    def test_if_none_match_returns_304(self, client, media_file):
+        etag = client.get(f"/media/{HASHED_NAME}")["ETag"]
+
+        response = client.get(f"/media/{HASHED_NAME}", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+
+    def test_if_modified_since_returns_304(self, client, media_file):
+        since = http_date(media_file.stat().st_mtime + 10)
+
+        response = client.get(f"/media/{HASHED_NAME}", HTTP_IF_MODIFIED_SINCE=since)
+        assert response.status_code == 304
+
+    @pytest.mark.parametrize(
+        "header,start,end",
+        [("bytes=0-99", 0, 99), ("bytes=1000-", 1000, 1023), ("bytes=-24", 1000, 1023)],
+    )
+    def test_range_request(self, client, media_file, header, start, end):
+        response = client.get(f"/media/{HASHED_NAME}", HTTP_RANGE=header)
+
+        assert response.status_code == 206
+        assert response["Content-Range"] == f"bytes {start}-{end}/{len(BODY)}"
+        assert response["Content-Length"] == str(end - start + 1)
+        assert content(response) == BODY[start : end + 1]
+
+    def test_unsatisfiable_range(self, client, media_file):
+        response = client.get(f"/media/{HASHED_NAME}", HTTP_RANGE="bytes=5000-")
+
+        assert response.status_code == 416
+        assert response["Content-Range"] == f"bytes */{len(BODY)}"
+
+    def test_stale_if_range_serves_whole_file(self, client, media_file):
+        response = client.get(
+            f"/media/{HASHED_NAME}", HTTP_RANGE="bytes=0-9", HTTP_IF_RANGE='"stale"'
+        )
+
+        assert response.status_code == 200
+        assert content(response) == BODY
+
+    def test_x_accel_redirect(self, client, media_file, settings):
+        settings.MEDIA_ACCEL_REDIRECT_PREFIX = "/protected-media/"
+
+        response = client.get(f"/media/{HASHED_NAME}")
+        assert response.status_code == 200
+        assert response["X-Accel-Redirect"] == f"/protected-media/{HASHED_NAME}"
+        assert response.content == b""
+
+    def test_head_has_no_body(self, client, media_file):
+        response = client.head(f"/media/{HASHED_NAME}")
+
+        assert response.status_code == 200
+        assert response["Content-Length"] == str(len(BODY))
+        assert response.content == b""
+
+    @pytest.mark.parametrize(
+        "path", ["../secret.txt", "dogs/ab/cd/.upload-tmp", "dogs/", "missing.png"]
+    )
+    def test_not_found(self, client, media_file, path):
+        (media_file.parent / ".upload-tmp").write_bytes(b"partial")
+
+        assert client.get(f"/media/{path}").status_code == 404
+
+    def test_post_not_allowed(self, client, media_file):
+        assert client.post(f"/media/{HASHED_NAME}").status_code == 405